@@ -0,0 +1,54 @@
+"""Out-of-band storage for virtual event payloads.
+
+`BindingMixin.emit` parks a payload here and passes only a short reference
+(``slot:<token>``) through `event_generate -data`. `convert_event_data`
+resolves the reference back to the very same Python object, so listeners get
+the payload without any serialization or copy, whatever its size.
+"""
+from __future__ import annotations
+
+from itertools import count
+from threading import RLock
+from typing import Any
+
+PREFIX = "slot:"
+
+_slots: dict[int, Any] = {}
+_tokens = count(1)
+_lock = RLock()
+
+
+def store(payload: Any) -> str:
+    """Park `payload` and return the reference to pass through Tcl."""
+    with _lock:
+        token = next(_tokens)
+        _slots[token] = payload
+    return f"{PREFIX}{token}"
+
+
+def resolve(ref: str, default: Any = None) -> Any:
+    """Return the payload for `ref`, or `default` if it was released or never stored."""
+    try:
+        return _slots.get(int(ref[len(PREFIX):]), default)
+    except ValueError:
+        return default
+
+
+def release(ref: str) -> None:
+    """Drop the payload for `ref`; safe to call more than once."""
+    try:
+        token = int(ref[len(PREFIX):])
+    except ValueError:
+        return
+    with _lock:
+        _slots.pop(token, None)
+
+
+def is_ref(value: Any) -> bool:
+    """True if `value` is a payload reference produced by `store`."""
+    return isinstance(value, str) and value.startswith(PREFIX)
+
+
+def pending_count() -> int:
+    """Number of payloads currently parked (emitted but not yet released)."""
+    return len(_slots)
@@ -32,9 +32,9 @@ def register(widget: SupportsRegistry, *, custom_id: str | None = None) -> None:
         if custom_id:
             _claim_id(widget, custom_id)
 
-        # Auto-unregister on destroy (safe: add="+", fires once for the widget itself)
+        # Auto-unregister on destroy
         try:
-            widget.on(Event.DESTROY).listen(lambda e, w_ref=ref(widget): _on_destroy(w_ref()), add="+")
+            widget.on(Event.DESTROY).listen(lambda e, w_ref=ref(widget): _on_destroy_event(e, w_ref()))
         except Exception:
             # If bind is not available (very rare), it's still safe; GC will prune.
             pass
@@ -98,9 +98,19 @@ def all_widgets_snapshot() -> Iterable[SupportsRegistry]:
 
 
 # ---- internals ----
+def _on_destroy_event(event: Any, widget: Optional[SupportsRegistry]) -> None:
+    # a toplevel's own bindings also see <Destroy> for each of its descendants
+    if widget is not None and getattr(event, "target_path", None) == widget.tk_name:
+        _on_destroy(widget)
+
+
 def _on_destroy(widget: Optional[SupportsRegistry]) -> None:
     if widget is not None:
         unregister(widget)
+        # reclaim the Tcl commands behind the widget's bindings
+        release = getattr(widget, "_release_commands", None)
+        if release is not None:
+            release()
 
 
 def _claim_id(widget: SupportsRegistry, cid: str) -> None:
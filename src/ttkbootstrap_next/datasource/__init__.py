@@ -1,5 +1,6 @@
 from ttkbootstrap_next.datasource.memory_source import MemoryDataSource
+from ttkbootstrap_next.datasource.page_cache import PageCache
 from ttkbootstrap_next.datasource.sqlite_source import SqliteDataSource
 from ttkbootstrap_next.datasource.types import DataSourceProtocol
 
-__all__ = ['SqliteDataSource', 'MemoryDataSource', 'DataSourceProtocol']
+__all__ = ['SqliteDataSource', 'MemoryDataSource', 'DataSourceProtocol', 'PageCache']
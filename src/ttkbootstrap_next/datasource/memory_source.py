@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import csv
 import re
+from array import array
+from collections import OrderedDict
 from collections.abc import Sequence
 from typing import Any, Dict, List, Optional, Union, Mapping, Iterable, Tuple
 
@@ -11,8 +13,11 @@ try:
 except Exception:
     Primitive = Any  # fallback
 
+from ttkbootstrap_next.datasource.selection import RangeSelection
+from ttkbootstrap_next.datasource.utils import ChangeNotifier, parse_aggregates, parse_group_columns
 
-class MemoryDataSource:
+
+class MemoryDataSource(ChangeNotifier):
     """
     Pure-Python in-memory data manager with pagination, sorting, filtering,
     inferred schema, and full CRUD support.
@@ -30,14 +35,27 @@ class MemoryDataSource:
     Sorting:
         set_sort("last_name ASC, score DESC")
         ASC is default if omitted.
+        Sorted orderings are kept as index permutations in a small LRU keyed by
+        (sort spec, data version), so toggling back to a recent sort skips the
+        re-sort. The LRU is bounded by `sort_cache_bytes`.
+
+    Grouping:
+        group_by("region", aggregates={"total": "SUM(score)", "best": "MAX(score)"})
+        Supported aggregates: COUNT, SUM, AVG, MIN, MAX (COUNT(*) counts rows).
 
     Notes:
         - Records are dictionaries. If you pass primitives, they'll be wrapped as {"text": str(x)}.
         - Ensures an integer `id` field and an integer `selected` field (0/1).
+        - `select_all`, `unselect_all` and `select_range` record the change as a
+          range (see `RangeSelection`); the rows' `selected` flags are only
+          rewritten when a filter or sort on `selected`, an export or a grouping
+          needs them. Records returned by the source always carry the effective flag.
+        - `on_change(callback)` registers a listener for data, selection, filter and sort changes.
     """
 
-    def __init__(self, page_size: int = 10):
+    def __init__(self, page_size: int = 10, sort_cache_bytes: int = 16 * 1024 * 1024):
         self.page_size = page_size
+        self.sort_cache_bytes = sort_cache_bytes
         self._table = "records"
         self._page = 0
         self._columns: List[str] = []
@@ -47,6 +65,15 @@ class MemoryDataSource:
         self._order_by_sql: str = ""
         self._filter_predicate = None  # callable | None
         self._sort_keys: List[Tuple[str, bool]] = []  # (col, reverse)
+        self._version = 0  # bumped on every data mutation
+        self._group_cache: Dict[tuple, List[Dict[str, Any]]] = {}
+        self._sort_cache: OrderedDict[tuple, array] = OrderedDict()  # (sort keys, version) -> permutation
+        self._view_key: Optional[tuple] = None
+        self._view_rows: List[Dict[str, Any]] = []
+        self._selection = RangeSelection()  # selection not yet written to the `selected` flags
+        self._flag_count = 0  # rows whose own `selected` flag is set
+        self._view_positions = None  # (view, {id(row): position}) for the view of the pending ranges
+        self._change_listeners = []
 
     # ----------------------------
     # Internal helpers
@@ -66,6 +93,52 @@ class MemoryDataSource:
     def _is_mapping(x: Any) -> bool:
         return isinstance(x, Mapping)
 
+    def _bump_version(self) -> None:
+        """Mark the data as changed and drop any results derived from it."""
+        self._version += 1
+        self._group_cache.clear()
+        self._sort_cache.clear()
+        self._view_key = None
+        self._notify_change()
+
+    def _selection_changed(self) -> None:
+        """Drop derived results that may depend on the `selected` flags."""
+        self._group_cache.clear()
+        if self._view_uses_selection():
+            self._view_key = None
+        for key in [k for k in self._sort_cache if any(col == "selected" for col, _ in k[0])]:
+            del self._sort_cache[key]
+        self._notify_change()
+
+    def _view_uses_selection(self) -> bool:
+        """True if the current filter or sort reads the `selected` flags."""
+        return "selected" in self._where_sql or any(col == "selected" for col, _ in self._sort_keys)
+
+    def _sort_permutation(self) -> array:
+        """Return row indexes of `_data` in the current sort order, using the LRU when possible."""
+        key = (tuple(self._sort_keys), self._version)
+        perm = self._sort_cache.get(key)
+        if perm is not None:
+            self._sort_cache.move_to_end(key)
+            return perm
+
+        data = self._data
+        order = list(range(len(data)))
+        # To respect per-column ASC/DESC, apply keys in reverse order (stable sort)
+        for col, rev in reversed(self._sort_keys):
+            order.sort(key=lambda i, c=col: (data[i].get(c) is None, data[i].get(c)), reverse=rev)
+        perm = array("L", order)
+
+        budget = max(0, int(self.sort_cache_bytes))
+        size = perm.itemsize * len(perm)
+        if size <= budget:
+            self._sort_cache[key] = perm
+            used = sum(p.itemsize * len(p) for p in self._sort_cache.values())
+            while used > budget:
+                _, evicted = self._sort_cache.popitem(last=False)
+                used -= evicted.itemsize * len(evicted)
+        return perm
+
     def _rebuild_id_index(self) -> None:
         self._id_index.clear()
         for i, rec in enumerate(self._data):
@@ -290,10 +363,14 @@ class MemoryDataSource:
     # ----------------------------
 
     def set_data(self, records: Union[Sequence[Primitive], Sequence[Dict[str, Any]]]):
+        self._selection.clear()
+        self._view_positions = None
         if not records:
             self._data = []
             self._columns = []
+            self._flag_count = 0
             self._rebuild_id_index()
+            self._bump_version()
             return self
 
         # Coerce primitives to dicts
@@ -312,26 +389,61 @@ class MemoryDataSource:
         self._columns = list(self._data[0].keys())
         self._ensure_id()
         self._ensure_selected_column()
+        self._count_flags()
+        self._bump_version()
         return self
 
-    def set_filter(self, where_sql: str = ""):
+    def set_filter(self, where_sql: str = "", refine: bool = False):
+        """
+        Set the filter expression.
+
+        Args:
+            where_sql: Filter expression (see class docstring).
+            refine: The new filter only narrows the previous one (e.g. a search
+                term that extends the last term). The current result set is
+                filtered instead of the full data.
+        """
+        prev_key = (self._where_sql, tuple(self._sort_keys), self._version)
         self._where_sql = where_sql or ""
         self._filter_predicate = self._parse_filter(self._where_sql)
+        self._group_cache.clear()
+        if self._selection.pending and self._view_uses_selection():
+            self._settle_selection()
+
+        if refine and self._view_key == prev_key and self._filter_predicate:
+            predicate = self._filter_predicate
+            self._view_rows = [r for r in self._view_rows if predicate(r)]
+            self._view_key = (self._where_sql, tuple(self._sort_keys), self._version)
+        self._notify_change()
 
     def set_sort(self, order_by_sql: str = ""):
         self._order_by_sql = order_by_sql or ""
         self._sort_keys = self._parse_sort(self._order_by_sql)
+        self._notify_change()
 
     def _filtered_sorted_rows(self) -> List[Dict[str, Any]]:
-        return self._apply_filter_and_sort(self._data)
+        if self._selection.pending and self._view_uses_selection():
+            self._settle_selection()
+        key = (self._where_sql, tuple(self._sort_keys), self._version)
+        if self._view_key == key:
+            return self._view_rows
+
+        data = self._data
+        rows: Iterable[Dict[str, Any]] = (data[i] for i in self._sort_permutation()) if self._sort_keys else data
+        if self._filter_predicate:
+            rows = [r for r in rows if self._filter_predicate(r)]
+        else:
+            rows = list(rows)
+
+        self._view_key, self._view_rows = key, rows
+        return rows
 
     def get_page(self, page: Optional[int] = None) -> List[Dict[str, Any]]:
         if page is not None:
             self._page = max(0, int(page))
         rows = self._filtered_sorted_rows()
         start = self._page * self.page_size
-        end = start + self.page_size
-        return [dict(r) for r in rows[start:end]]
+        return self._view_records(rows, start, start + self.page_size)
 
     def next_page(self) -> List[Dict[str, Any]]:
         if self.has_next_page():
@@ -365,6 +477,11 @@ class MemoryDataSource:
         self._data.append(r)
         self._columns = list(set(self._columns) | set(r.keys()))
         self._id_index[r["id"]] = len(self._data) - 1
+        self._flag_count += r["selected"] == 1
+        if self._selection.pending:
+            # a recorded select_all must not reach rows created after it
+            self._selection.set_record(r["id"], 1 if r["selected"] else 0)
+        self._bump_version()
         return r["id"]
 
     def read_record(self, record_id: Any) -> Optional[Dict[str, Any]]:
@@ -372,7 +489,10 @@ class MemoryDataSource:
         idx = self._id_index.get(record_id)
         if idx is None:
             return None
-        return dict(self._data[idx])
+        record = dict(self._data[idx])
+        if self._selection.pending:
+            record["selected"] = int(self.is_selected(record_id))
+        return record
 
     def update_record(self, record_id: Any, updates: Dict[str, Any]) -> bool:
         """Updates a record by ID. Returns True if successful."""
@@ -381,8 +501,13 @@ class MemoryDataSource:
         idx = self._id_index.get(record_id)
         if idx is None:
             return False
+        was_flagged = self._data[idx].get("selected") == 1
         self._data[idx].update(updates)
+        self._flag_count += (self._data[idx].get("selected") == 1) - was_flagged
+        if "selected" in updates and self._selection.pending:
+            self._selection.set_record(record_id, 1 if updates["selected"] else 0)
         self._columns = list(set(self._columns) | set(updates.keys()))
+        self._bump_version()
         return True
 
     def delete_record(self, record_id: Any) -> bool:
@@ -390,9 +515,12 @@ class MemoryDataSource:
         idx = self._id_index.get(record_id)
         if idx is None:
             return False
-        self._data.pop(idx)
+        if self._selection.ranges:
+            self._settle_selection()  # range counts would still include the deleted row
+        self._flag_count -= self._data.pop(idx).get("selected") == 1
         # rebuild index (positions changed)
         self._rebuild_id_index()
+        self._bump_version()
         return True
 
     # === SELECTION ====
@@ -406,72 +534,299 @@ class MemoryDataSource:
         return self._set_selected_flag(record_id, 0)
 
     def select_all(self, current_page_only: bool = False) -> int:
-        """Marks all records as selected."""
-        self._ensure_selected_column()
-        if current_page_only:
-            ids = [r["id"] for r in self.get_page()]
-            count = 0
-            idset = set(ids)
-            for r in self._data:
-                if r["id"] in idset and r.get("selected") != 1:
-                    r["selected"] = 1
-                    count += 1
-            return count
-        else:
-            count = 0
-            for r in self._data:
-                if r.get("selected") != 1:
-                    r["selected"] = 1
-                    count += 1
-            return count
+        """Marks all records as selected; without `current_page_only` this costs O(1)."""
+        return self._set_all_flags(1, current_page_only)
 
     def unselect_all(self, current_page_only: bool = False) -> int:
-        """Unselects all records."""
+        """Unselects all records; without `current_page_only` this costs O(1)."""
+        return self._set_all_flags(0, current_page_only)
+
+    def _set_all_flags(self, flag: int, current_page_only: bool) -> int:
         self._ensure_selected_column()
         if current_page_only:
-            ids = [r["id"] for r in self.get_page()]
+            self._settle_selection()
+            idset = {r["id"] for r in self.get_page()}
             count = 0
-            idset = set(ids)
             for r in self._data:
-                if r["id"] in idset and r.get("selected") != 0:
-                    r["selected"] = 0
+                if r["id"] in idset and r.get("selected") != flag:
+                    r["selected"] = flag
                     count += 1
-            return count
+            self._flag_count += count if flag else -count
         else:
-            count = 0
-            for r in self._data:
-                if r.get("selected") != 0:
-                    r["selected"] = 0
-                    count += 1
-            return count
+            selected = self.selected_count()
+            count = len(self._data) - selected if flag else selected
+            self._selection.set_all(flag)
+        if count:
+            self._selection_changed()
+        return count
+
+    def select_range(self, start_index: int, end_index: int, selected: bool = True) -> int:
+        """
+        Select or unselect a contiguous slice of the current view.
+
+        The range is recorded, not applied row by row, so the call costs O(1)
+        regardless of its size.
+
+        Args:
+            start_index: First view index (inclusive).
+            end_index: Last view index (exclusive).
+            selected: Select (True) or unselect (False) the rows.
+
+        Returns:
+            The number of rows in the range.
+        """
+        self._ensure_selected_column()
+        rows = self._filtered_sorted_rows()
+        start = max(0, start_index)
+        end = min(len(rows), max(start, end_index))
+        if end == start:
+            return 0
+        if self._selection.ranges and self._selection.view is not rows:
+            self._settle_selection()  # the pending ranges refer to an earlier view
+        self._selection.add_range(rows, start, end, 1 if selected else 0)
+        self._selection_changed()
+        return end - start
+
+    def is_selected(self, record_id: Any) -> bool:
+        """Return True if the record is selected."""
+        idx = self._id_index.get(record_id)
+        if idx is None:
+            return False
+        if self._selection.ranges:
+            self._settle_selection()
+        return self._selection.flag_of(record_id, self._data[idx].get("selected", 0)) == 1
 
     def _set_selected_flag(self, record_id: Any, flag: int) -> bool:
         self._ensure_selected_column()
         idx = self._id_index.get(record_id)
         if idx is None:
             return False
-        self._data[idx]["selected"] = 1 if flag else 0
+        if self._selection.pending:
+            self._selection.set_record(record_id, 1 if flag else 0)
+        else:
+            row = self._data[idx]
+            self._flag_count += (1 if flag else 0) - (row.get("selected") == 1)
+            row["selected"] = 1 if flag else 0
+        self._selection_changed()
         return True
 
+    def _settle_selection(self) -> None:
+        """Write the recorded selection into the rows' `selected` flags."""
+        if not self._selection.pending:
+            return
+        base, view, changes = self._selection.drain()
+        self._view_positions = None
+        if base is not None:
+            for r in self._data:
+                r["selected"] = base
+        for kind, target, flag in changes:
+            if kind == "range":
+                for r in view[target[0]:target[1]]:
+                    r["selected"] = flag
+            else:
+                idx = self._id_index.get(target)
+                if idx is not None:
+                    self._data[idx]["selected"] = flag
+        self._count_flags()
+
+    def _count_flags(self) -> None:
+        self._flag_count = sum(1 for r in self._data if r.get("selected") == 1)
+
+    def _view_records(self, rows: List[Dict[str, Any]], start: int, end: int) -> List[Dict[str, Any]]:
+        """Copy view rows `start` to `end`, with `selected` reflecting the recorded selection."""
+        selection = self._selection
+        if selection.ranges and selection.view is not rows:
+            self._settle_selection()
+        if not selection.pending:
+            return [dict(r) for r in rows[start:end]]
+        records = []
+        for position, r in enumerate(rows[start:end], start):
+            record = dict(r)
+            record["selected"] = selection.flag_of(r["id"], r.get("selected", 0), position)
+            records.append(record)
+        return records
+
     def get_selected(self, page: Optional[int] = None) -> List[Dict[str, Any]]:
         """Retrieves selected records, optionally paginated."""
         self._ensure_selected_column()
-        rows = [r for r in self._data if r.get("selected") == 1]
+        selection = self._selection
+        if selection.ranges:
+            self._settle_selection()
+        rows = [
+            {**r, "selected": 1} for r in self._data
+            if selection.flag_of(r["id"], r.get("selected", 0)) == 1]
         rows = self._apply_filter_and_sort(rows)  # respect current filter/sort
         if page is None:
-            return [dict(r) for r in rows]
+            return rows
         start = max(0, int(page)) * self.page_size
         end = start + self.page_size
-        return [dict(r) for r in rows[start:end]]
+        return rows[start:end]
 
     def selected_count(self) -> int:
         self._ensure_selected_column()
-        return sum(1 for r in self._data if r.get("selected") == 1)
+        count = self._selection.count(len(self._data), self._own_flag, self._flag_count, self._view_position)
+        if count is None:
+            self._settle_selection()
+            count = self._flag_count
+        return count
+
+    def _own_flag(self, record_id: Any) -> Optional[int]:
+        idx = self._id_index.get(record_id)
+        return None if idx is None else int(self._data[idx].get("selected") == 1)
+
+    def _view_position(self, record_id: Any) -> Optional[int]:
+        """Return the record's position in the view the pending ranges refer to, or None."""
+        view = self._selection.view
+        idx = self._id_index.get(record_id)
+        if idx is None:
+            return None
+        row = self._data[idx]
+        if idx < len(view) and view[idx] is row:
+            return idx  # a view without sort or filter keeps the data order
+        if self._view_positions is None or self._view_positions[0] is not view:
+            # built once per view, and only when records were changed on top of a range
+            self._view_positions = (view, {id(r): i for i, r in enumerate(view)})
+        return self._view_positions[1].get(id(row))
+
+    # === ORDERING ===
+
+    def move_records(self, ids: Sequence[Any], target_index: int) -> int:
+        """
+        Move records so they occupy consecutive view positions starting at `target_index`.
+
+        The moved records keep their relative order. Records are moved in place
+        in the backing list; only ids between the old and new positions are reindexed.
+
+        Args:
+            ids: Ids of the records to move.
+            target_index: View index of the first moved record after the move.
+
+        Returns:
+            The number of records moved.
+
+        Raises:
+            ValueError: If a sort is applied, since the sort decides the order.
+        """
+        if self._sort_keys:
+            raise ValueError("Records cannot be moved while a sort is applied")
+        positions = sorted({self._id_index[i] for i in ids if i in self._id_index})
+        if not positions:
+            return 0
+        data = self._data
+        moved_ids = {data[p]["id"] for p in positions}
+
+        # The record the moved block lands in front of (None: after the last remaining row)
+        anchor = None
+        remaining = max(0, int(target_index))
+        view = self._filtered_sorted_rows()
+        for r in view:
+            if r["id"] in moved_ids:
+                continue
+            if remaining == 0:
+                anchor = r
+                break
+            remaining -= 1
+        if anchor is not None:
+            insert_at = self._id_index[anchor["id"]]
+        else:
+            last = next((r for r in reversed(view) if r["id"] not in moved_ids), None)
+            insert_at = self._id_index[last["id"]] + 1 if last is not None else len(data)
+
+        block = [data[p] for p in positions]
+        for p in reversed(positions):
+            del data[p]
+        insert_at -= sum(1 for p in positions if p < insert_at)
+        data[insert_at:insert_at] = block
+
+        lo = min(positions[0], insert_at)
+        hi = max(positions[-1], insert_at + len(block) - 1)
+        for i in range(lo, hi + 1):
+            self._id_index[data[i]["id"]] = i
+        self._bump_version()
+        return len(block)
+
+    # === GROUPING ===
+
+    def group_by(
+            self,
+            columns: Union[str, Sequence[str]],
+            aggregates: Optional[Mapping[str, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Group the filtered records and return one header per group.
+
+        Each header holds the group column values, a `count` of rows, and one
+        entry per aggregate (e.g. {"total": "SUM(score)"}). Groups are ordered
+        by their column values, with None last. Results are computed in a single
+        hash-aggregation pass and cached until the data or filter changes.
+
+        Args:
+            columns: A column name, a comma separated string, or a sequence of names.
+            aggregates: Mapping of output name to COUNT/SUM/AVG/MIN/MAX expression.
+
+        Returns:
+            A list of group header dictionaries.
+        """
+        cols = parse_group_columns(columns)
+        aggs = parse_aggregates(aggregates)
+        cache_key = (cols, aggs)
+        cached = self._group_cache.get(cache_key)
+        if cached is not None:
+            return [dict(h) for h in cached]
+        self._settle_selection()
+
+        # group key -> [row count, *accumulators]; accumulator shape depends on func
+        groups: Dict[tuple, List[Any]] = {}
+        predicate = self._filter_predicate
+        for r in self._data:
+            if predicate and not predicate(r):
+                continue
+            key = tuple(r.get(c) for c in cols)
+            acc = groups.get(key)
+            if acc is None:
+                acc = [0] + [[0, None] for _ in aggs]  # [non-null count, value]
+                groups[key] = acc
+            acc[0] += 1
+            for i, (_alias, func, col) in enumerate(aggs, start=1):
+                slot = acc[i]
+                if col == "*":
+                    slot[0] += 1
+                    continue
+                v = r.get(col)
+                if v is None:
+                    continue
+                slot[0] += 1
+                cur = slot[1]
+                if func in ("SUM", "AVG"):
+                    slot[1] = v if cur is None else cur + v
+                elif func == "MIN":
+                    slot[1] = v if cur is None or v < cur else cur
+                elif func == "MAX":
+                    slot[1] = v if cur is None or v > cur else cur
+
+        headers: List[Dict[str, Any]] = []
+        for key in sorted(groups, key=lambda k: tuple((v is None, v) for v in k)):
+            acc = groups[key]
+            header: Dict[str, Any] = dict(zip(cols, key))
+            header["count"] = acc[0]
+            for i, (alias, func, _col) in enumerate(aggs, start=1):
+                n, value = acc[i]
+                if func == "COUNT":
+                    header[alias] = n
+                elif func == "AVG":
+                    header[alias] = (value / n) if n else None
+                else:
+                    header[alias] = value
+            headers.append(header)
+
+        self._group_cache[cache_key] = headers
+        return [dict(h) for h in headers]
 
     # === DATA EXPORT ===
 
     def export_to_csv(self, filepath: str, include_all: bool = True) -> None:
         """Export the data to a CSV file."""
+        self._settle_selection()
         rows = self._data if include_all else [r for r in self._data if r.get("selected") == 1]
         if not rows:
             return
@@ -488,5 +843,4 @@ class MemoryDataSource:
     def get_page_from_index(self, start_index: int, count: int) -> List[Dict[str, Any]]:
         rows = self._filtered_sorted_rows()
         start = max(0, int(start_index))
-        end = start + max(0, int(count))
-        return [dict(r) for r in rows[start:end]]
+        return self._view_records(rows, start, start + max(0, int(count)))
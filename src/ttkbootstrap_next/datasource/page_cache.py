@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from ttkbootstrap_next.datasource.types import DataSourceProtocol
+
+Record = Dict[str, Any]
+
+
+class PageCache:
+    """
+    Block cache in front of a data source's index-based paging.
+
+    Rows are fetched in aligned blocks of `block_size` records and the most
+    recently used `max_blocks` blocks are kept. Scrolling back and forth over
+    the same rows is served from memory, and `prefetch` loads the next block
+    in the scroll direction ahead of time.
+
+    The cache subscribes to the source's `on_change` listener and is cleared
+    whenever the source reports a change. Sources without `on_change` cannot
+    announce changes, so their reads pass straight through.
+    """
+
+    def __init__(self, source: DataSourceProtocol, block_size: int = 64, max_blocks: int = 16):
+        self.source = source
+        self.block_size = max(1, block_size)
+        self.max_blocks = max(1, max_blocks)
+        self._blocks: OrderedDict[int, List[Record]] = OrderedDict()
+        self._total: Optional[int] = None
+        self._stats = dict(hits=0, misses=0, prefetched=0)
+
+        on_change = getattr(source, "on_change", None)
+        self.enabled = callable(on_change)
+        self._unsubscribe = on_change(self.invalidate) if self.enabled else None
+
+    # ---------- reads ----------
+
+    def total_count(self) -> int:
+        if not self.enabled:
+            return self.source.total_count()
+        if self._total is None:
+            self._total = self.source.total_count()
+        return self._total
+
+    def get_page_from_index(self, start_index: int, count: int) -> List[Record]:
+        """Return `count` records starting at `start_index`, fetching missing blocks."""
+        if not self.enabled:
+            return self.source.get_page_from_index(start_index, count)
+        if count <= 0:
+            return []
+
+        start_index = max(0, start_index)
+        end = min(start_index + count, self.total_count())
+        if end <= start_index:
+            return []
+        rows: List[Record] = []
+        bs = self.block_size
+        for block in range(start_index // bs, (end - 1) // bs + 1):
+            records = self._block(block)
+            lo = max(start_index - block * bs, 0)
+            hi = min(end - block * bs, len(records))
+            rows.extend(records[lo:hi])
+        return rows
+
+    def prefetch(self, start_index: int, count: int, direction: int) -> bool:
+        """
+        Load the block just past the given range in the scroll `direction`.
+
+        Args:
+            start_index: First row of the range currently shown.
+            count: Number of rows shown.
+            direction: Positive when scrolling down, negative when scrolling up.
+
+        Returns:
+            True if a block was fetched.
+        """
+        if not self.enabled or not direction:
+            return False
+        edge = start_index + count if direction > 0 else start_index - 1
+        if edge < 0 or edge >= self.total_count():
+            return False
+        block = edge // self.block_size
+        if block in self._blocks:
+            return False
+        self._block(block, prefetch=True)
+        return True
+
+    # ---------- maintenance ----------
+
+    def invalidate(self) -> None:
+        """Drop every cached block and the cached row count."""
+        self._blocks.clear()
+        self._total = None
+
+    def close(self) -> None:
+        """Stop listening to the source and drop cached rows."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        self.invalidate()
+
+    def stats(self) -> dict:
+        """Return hit, miss and prefetch counters plus the number of cached blocks."""
+        return {**self._stats, "blocks": len(self._blocks)}
+
+    # ---------- internal ----------
+
+    def _block(self, block: int, prefetch: bool = False) -> List[Record]:
+        blocks = self._blocks
+        if block in blocks:
+            blocks.move_to_end(block)
+            self._stats["hits"] += 1
+            return blocks[block]
+
+        records = self.source.get_page_from_index(block * self.block_size, self.block_size)
+        self._stats["prefetched" if prefetch else "misses"] += 1
+        blocks[block] = records
+        while len(blocks) > self.max_blocks:
+            blocks.popitem(last=False)
+        return records
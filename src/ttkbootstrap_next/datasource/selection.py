@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from itertools import count
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class RangeSelection:
+    """
+    Selection changes recorded as view ranges instead of per-row flags.
+
+    `select_all`, `unselect_all` and `select_range` only record what was asked
+    for, so their cost does not depend on the number of rows. A data source
+    keeps one instance and folds it into the rows' `selected` flags (see
+    `drain`) only when something must read the flags directly, such as a
+    filter or sort on `selected`. Until then the selection is:
+
+        - `base`: None to use each row's own flag, or 0/1 for every row
+        - `ranges`: (start, end, flag) over the positions of the view identified
+          by `view`, in the order they were made
+        - `exceptions`: record id -> flag, for single records changed since
+
+    A later change wins over an earlier one.
+    """
+
+    def __init__(self):
+        self.base: Optional[int] = None
+        self.view: Any = None  # the view the range positions refer to
+        self.ranges: List[Tuple[int, int, int, int]] = []  # (start, end, flag, seq)
+        self.exceptions: Dict[Any, Tuple[int, int]] = {}  # record id -> (flag, seq)
+        self._seq = count()
+
+    @property
+    def pending(self) -> bool:
+        """True if some of the selection is not yet written to the rows' flags."""
+        return self.base is not None or bool(self.ranges) or bool(self.exceptions)
+
+    def clear(self):
+        self.base = None
+        self.view = None
+        self.ranges.clear()
+        self.exceptions.clear()
+
+    def set_all(self, flag: int):
+        """Select (1) or unselect (0) every row."""
+        self.clear()
+        self.base = flag
+
+    def add_range(self, view: Any, start: int, end: int, flag: int):
+        """Set `flag` on view positions `start` to `end` (exclusive) of `view`.
+
+        Ranges recorded for another view must be folded into the flags first.
+        """
+        if self.ranges and view is not self.view:
+            raise ValueError("Pending ranges refer to another view")
+        self.view = view
+        self.ranges.append((start, end, flag, next(self._seq)))
+
+    def set_record(self, record_id: Any, flag: int):
+        self.exceptions[record_id] = (flag, next(self._seq))
+
+    def flag_of(self, record_id: Any, row_flag: int, position: Optional[int] = None) -> int:
+        """Return the selection of one row.
+
+        Args:
+            record_id: The row's id.
+            row_flag: The row's own `selected` flag.
+            position: The row's position in `view`; required while ranges are pending.
+        """
+        flag, seq = (row_flag if self.base is None else self.base), -1
+        if position is not None:
+            for start, end, range_flag, range_seq in reversed(self.ranges):
+                if start <= position < end:
+                    flag, seq = range_flag, range_seq
+                    break
+        exception = self.exceptions.get(record_id)
+        if exception is not None and exception[1] > seq:
+            flag = exception[0]
+        return flag
+
+    def count(
+            self,
+            total: int,
+            row_flag: Callable[[Any], Optional[int]],
+            flagged: Optional[int] = None,
+            position_of: Optional[Callable[[Any], Optional[int]]] = None,
+    ) -> Optional[int]:
+        """Return the number of selected rows out of `total`.
+
+        The cost depends on the number of recorded changes, not on `total`. Returns
+        None if the answer depends on the rows' own flags and `flagged` is not given,
+        or on where the excepted records sit within the ranges and `position_of`
+        is not given.
+
+        Args:
+            total: Number of rows.
+            row_flag: Returns a record's own flag, or None if the record no longer exists.
+            flagged: Number of rows whose own flag is set, if the source tracks it.
+            position_of: Returns a record's position in `view`, or None if it is not in the view.
+        """
+        base = self.base
+        if base is None and self.ranges:
+            # the ranges can only be counted against a uniform starting flag
+            if flagged == 0 or flagged == total:
+                base = 1 if flagged else 0
+            else:
+                return None
+        if self.ranges and self.exceptions and position_of is None:
+            return None
+        if base is None:
+            if flagged is None:
+                return None
+            selected = flagged
+        else:
+            selected = base * total
+            bounds = sorted({b for start, end, _, _ in self.ranges for b in (start, end)})
+            for lo, hi in zip(bounds, bounds[1:]):
+                flag = self._covering(lo, hi)[0]
+                if flag is not None:
+                    selected += (flag - base) * (hi - lo)
+        for record_id, (flag, seq) in self.exceptions.items():
+            own = row_flag(record_id)
+            if own is None:
+                continue
+            counted = own if base is None else base
+            if self.ranges:
+                position = position_of(record_id)
+                if position is not None:
+                    range_flag, range_seq = self._covering(position, position + 1)
+                    if range_flag is not None:
+                        if range_seq > seq:
+                            continue  # a later range decides this record
+                        counted = range_flag
+            selected += flag - counted
+        return selected
+
+    def _covering(self, lo: int, hi: int) -> Tuple[Optional[int], int]:
+        """Return (flag, seq) of the latest range covering positions `lo` to `hi`, or (None, -1)."""
+        for start, end, flag, seq in reversed(self.ranges):
+            if start <= lo and hi <= end:
+                return flag, seq
+        return None, -1
+
+    def drain(self) -> Tuple[Optional[int], Any, List[Tuple[str, Any, int]]]:
+        """Return the recorded selection and clear it.
+
+        Returns:
+            A tuple of (base, view, changes). Set every row to `base` when it is not
+            None, then apply the changes in order; each is ("range", (start, end), flag)
+            over the positions of `view`, or ("record", record_id, flag).
+        """
+        entries = [(seq, ("range", (start, end), flag)) for start, end, flag, seq in self.ranges]
+        entries += [(seq, ("record", record_id, flag)) for record_id, (flag, seq) in self.exceptions.items()]
+        entries.sort(key=lambda e: e[0])
+        drained = self.base, self.view, [change for _, change in entries]
+        self.clear()
+        return drained
@@ -1,14 +1,24 @@
 import csv
 import sqlite3
-from typing import Any, Dict, List, Optional, Union, Sequence
+from typing import Any, Dict, List, Mapping, Optional, Union, Sequence
 
+from ttkbootstrap_next.datasource.selection import RangeSelection
+from ttkbootstrap_next.datasource.utils import ChangeNotifier, parse_aggregates, parse_group_columns
 from ttkbootstrap_next.types import Primitive
 
+POSITION_COLUMN = "_position"  # manual row order, added by the first move_records call
 
-class SqliteDataSource:
+
+class SqliteDataSource(ChangeNotifier):
     """
     SQLite-backed data manager with pagination, sorting, filtering,
     inferred schema, and full CRUD support.
+
+    `on_change(callback)` registers a listener for data, selection, filter and sort changes.
+
+    `select_all`, `unselect_all` and `select_range` are recorded (see
+    `RangeSelection`) and only written to the `selected` column when the view
+    changes or a query reads the column.
     """
 
     def __init__(self, name: str = ":memory:", page_size: int = 10):
@@ -20,6 +30,11 @@ class SqliteDataSource:
         self._order_by = ""
         self._page = 0
         self._columns = []
+        self._version = 0  # bumped on every data mutation
+        self._group_cache: Dict[tuple, List[Dict[str, Any]]] = {}
+        self._change_listeners = []
+        self._selection = RangeSelection()  # selection not yet written to the `selected` column
+        self._positioned = False  # True once the table has a POSITION_COLUMN
 
     @classmethod
     def _infer_type(cls, value: Any) -> str:
@@ -31,7 +46,14 @@ class SqliteDataSource:
             return "BLOB"
         return "TEXT"
 
+    def _bump_version(self):
+        """Mark the data as changed and drop any results derived from it."""
+        self._version += 1
+        self._group_cache.clear()
+        self._notify_change()
+
     def set_data(self, records: Union[Sequence[Primitive], Sequence[dict[str, Any]]]):
+        self._selection.clear()
         if not records:
             return self
 
@@ -56,34 +78,50 @@ class SqliteDataSource:
 
         self.conn.execute(f"DROP TABLE IF EXISTS {self._table}")
         self.conn.execute(f"CREATE TABLE {self._table} ({col_definitions})")
+        self._positioned = False
 
         with self.conn:
             for row in records:
                 placeholders = ", ".join("?" for _ in self._columns)
                 values = tuple(row.get(col) for col in self._columns)
                 self.conn.execute(f"INSERT INTO {self._table} VALUES ({placeholders})", values)
+        self._bump_version()
         return self
 
-    def set_filter(self, where_sql: str = ""):
+    def set_filter(self, where_sql: str = "", refine: bool = False):
+        """
+        Set the WHERE clause used for paging and counts.
+
+        Args:
+            where_sql: SQL WHERE clause without the keyword.
+            refine: Hint that the new filter narrows the previous one. SQLite
+                re-evaluates the clause with its own indexes, so this is ignored.
+        """
+        self._settle_selection()
         self._where = where_sql
+        self._group_cache.clear()
+        self._notify_change()
 
     def set_sort(self, order_by_sql: str = ""):
+        self._settle_selection()
         self._order_by = order_by_sql
+        self._notify_change()
 
     def get_page(self, page: Optional[int] = None) -> List[Dict[str, Any]]:
         if page is not None:
             self._page = page
         offset = self._page * self.page_size
+        if self._view_uses_selection():
+            self._settle_selection()
 
         query = f"SELECT * FROM {self._table}"
         if self._where:
             query += f" WHERE {self._where}"
-        if self._order_by:
-            query += f" ORDER BY {self._order_by}"
+        query += self._order_clause()
         query += f" LIMIT {self.page_size} OFFSET {offset}"
 
         cursor = self.conn.execute(query)
-        return [dict(row) for row in cursor.fetchall()]
+        return self._view_records(cursor.fetchall(), offset)
 
     def next_page(self) -> List[Dict[str, Any]]:
         self._page += 1
@@ -97,6 +135,8 @@ class SqliteDataSource:
         return (self._page + 1) * self.page_size < self.total_count()
 
     def total_count(self) -> int:
+        if self._view_uses_selection():
+            self._settle_selection()
         query = f"SELECT COUNT(*) FROM {self._table}"
         if self._where:
             query += f" WHERE {self._where}"
@@ -106,6 +146,7 @@ class SqliteDataSource:
 
     def create_record(self, record: Dict[str, Any]) -> int:
         """Inserts a new record and returns its ID."""
+        self._settle_selection()
         if "id" not in record:
             record["id"] = self._generate_new_id()
 
@@ -119,29 +160,46 @@ class SqliteDataSource:
 
         with self.conn:
             self.conn.execute(f"INSERT INTO {self._table} ({cols}) VALUES ({placeholders})", values)
+            if self._positioned:
+                self.conn.execute(
+                    f"UPDATE {self._table} SET {POSITION_COLUMN} = "
+                    f"(SELECT COALESCE(MAX({POSITION_COLUMN}), 0) + 1 FROM {self._table}) WHERE id = ?",
+                    (record["id"],))
+        self._bump_version()
         return record["id"]
 
     def read_record(self, record_id: Any) -> Optional[Dict[str, Any]]:
         """Reads a single record by its ID."""
+        if self._selection.ranges:
+            self._settle_selection()
         cursor = self.conn.execute(f"SELECT * FROM {self._table} WHERE id = ?", (record_id,))
         row = cursor.fetchone()
-        return dict(row) if row else None
+        if not row:
+            return None
+        record = self._record(row)
+        if self._selection.pending:
+            record["selected"] = self._selection.flag_of(record_id, record.get("selected") or 0)
+        return record
 
     def update_record(self, record_id: Any, updates: Dict[str, Any]) -> bool:
         """Updates a record by ID. Returns True if successful."""
         if not updates:
             return False
+        self._settle_selection()
         set_clause = ", ".join(f"{k} = ?" for k in updates)
         values = tuple(updates.values()) + (record_id,)
         with self.conn:
             cur = self.conn.execute(f"UPDATE {self._table} SET {set_clause} WHERE id = ?", values)
-            return cur.rowcount > 0
+        self._bump_version()
+        return cur.rowcount > 0
 
     def delete_record(self, record_id: Any) -> bool:
         """Deletes a record by ID. Returns True if successful."""
+        self._settle_selection()
         with self.conn:
             cur = self.conn.execute(f"DELETE FROM {self._table} WHERE id = ?", (record_id,))
-            return cur.rowcount > 0
+        self._bump_version()
+        return cur.rowcount > 0
 
     def _generate_new_id(self) -> int:
         """Finds the next available integer ID."""
@@ -179,51 +237,84 @@ class SqliteDataSource:
         """
         Marks all records as selected.
 
+        Without `current_page_only` the change is recorded rather than written
+        to every row; see `select_range`.
+
         Args:
             current_page_only: If True, selects only the current page.
 
         Returns:
             The number of rows updated.
         """
-        self._ensure_selected_column()
-        if current_page_only:
-            ids = [row["id"] for row in self.get_page()]
-            if not ids:
-                return 0
-            placeholders = ", ".join("?" for _ in ids)
-            query = f"UPDATE {self._table} SET selected = 1 WHERE id IN ({placeholders})"
-            with self.conn:
-                cur = self.conn.execute(query, ids)
-                return cur.rowcount
-        else:
-            with self.conn:
-                cur = self.conn.execute(f"UPDATE {self._table} SET selected = 1")
-                return cur.rowcount
+        return self._set_all_flags(1, current_page_only)
 
     def unselect_all(self, current_page_only: bool = False) -> int:
         """
         Unselects all records.
 
+        Without `current_page_only` the change is recorded rather than written
+        to every row; see `select_range`.
+
         Args:
             current_page_only: If True, unselects only the current page.
 
         Returns:
             The number of rows updated.
         """
+        return self._set_all_flags(0, current_page_only)
+
+    def _set_all_flags(self, flag: int, current_page_only: bool) -> int:
         self._ensure_selected_column()
         if current_page_only:
+            self._settle_selection()
             ids = [row["id"] for row in self.get_page()]
             if not ids:
                 return 0
             placeholders = ", ".join("?" for _ in ids)
-            query = f"UPDATE {self._table} SET selected = 0 WHERE id IN ({placeholders})"
+            query = f"UPDATE {self._table} SET selected = ? WHERE id IN ({placeholders})"
             with self.conn:
-                cur = self.conn.execute(query, ids)
-                return cur.rowcount
+                count = self.conn.execute(query, (flag, *ids)).rowcount
         else:
-            with self.conn:
-                cur = self.conn.execute(f"UPDATE {self._table} SET selected = 0")
-                return cur.rowcount
+            selected = self.selected_count()
+            count = self._row_count() - selected if flag else selected
+            self._selection.set_all(flag)
+        self._selection_changed()
+        return count
+
+    def select_range(self, start_index: int, end_index: int, selected: bool = True) -> int:
+        """
+        Select or unselect a contiguous slice of the current view.
+
+        The range is recorded instead of running an UPDATE, so the call costs
+        O(1) regardless of its size. Recorded changes are written to the
+        `selected` column before the view changes, and whenever a query reads
+        the column (a filter or sort on `selected`, `get_selected`, an export
+        or a grouping).
+
+        Args:
+            start_index: First view index (inclusive).
+            end_index: Last view index (exclusive).
+            selected: Select (True) or unselect (False) the rows.
+
+        Returns:
+            The number of rows in the range.
+        """
+        self._ensure_selected_column()
+        start = max(0, start_index)
+        end = min(self.total_count(), max(start, end_index))
+        if end == start:
+            return 0
+        # ranges always refer to the current view; they are settled before it changes
+        self._selection.add_range(None, start, end, 1 if selected else 0)
+        self._selection_changed()
+        return end - start
+
+    def is_selected(self, record_id: Any) -> bool:
+        """Return True if the record is selected."""
+        if self._selection.ranges:
+            self._settle_selection()
+        row = self.conn.execute(f"SELECT selected FROM {self._table} WHERE id = ?", (record_id,)).fetchone()
+        return row is not None and self._selection.flag_of(record_id, row[0] or 0) == 1
 
     def get_selected(self, page: Optional[int] = None) -> List[Dict[str, Any]]:
         """
@@ -236,6 +327,7 @@ class SqliteDataSource:
             A list of selected row dictionaries.
         """
         self._ensure_selected_column()
+        self._settle_selection()
         query = f"SELECT * FROM {self._table} WHERE selected = 1"
 
         if page is not None:
@@ -243,7 +335,7 @@ class SqliteDataSource:
             query += f" LIMIT {self.page_size} OFFSET {offset}"
 
         cursor = self.conn.execute(query)
-        return [dict(row) for row in cursor.fetchall()]
+        return [self._record(row) for row in cursor.fetchall()]
 
     def _ensure_selected_column(self):
         """
@@ -259,6 +351,10 @@ class SqliteDataSource:
         Returns the total number of selected records.
         """
         self._ensure_selected_column()
+        count = self._selection.count(self._row_count(), self._own_flag)
+        if count is not None:
+            return count
+        self._settle_selection()
         query = f"SELECT COUNT(*) FROM {self._table} WHERE selected = 1"
         return self.conn.execute(query).fetchone()[0]
 
@@ -273,15 +369,110 @@ class SqliteDataSource:
         Returns:
             True if update was successful.
         """
-        if "selected" not in self._columns:
-            # Add selected column if it doesn't exist
-            with self.conn:
-                self.conn.execute(f"ALTER TABLE {self._table} ADD COLUMN selected INTEGER DEFAULT 0")
-            self._columns.append("selected")
+        self._ensure_selected_column()
+        if self._selection.pending:
+            if not self._record_exists(record_id):
+                return False
+            self._selection.set_record(record_id, 1 if flag else 0)
+            self._selection_changed()
+            return True
 
         with self.conn:
             cur = self.conn.execute(f"UPDATE {self._table} SET selected = ? WHERE id = ?", (flag, record_id))
-            return cur.rowcount > 0
+        self._selection_changed()
+        return cur.rowcount > 0
+
+    def _settle_selection(self):
+        """Write the recorded selection into the `selected` column."""
+        if not self._selection.pending:
+            return
+        self._ensure_selected_column()
+        base, _, changes = self._selection.drain()
+        with self.conn:
+            if base is not None:
+                self.conn.execute(f"UPDATE {self._table} SET selected = ?", (base,))
+            for kind, target, flag in changes:
+                if kind == "range":
+                    start, end = target
+                    view = f"SELECT id FROM {self._table}"
+                    if self._where:
+                        view += f" WHERE {self._where}"
+                    view += self._order_clause()
+                    view += f" LIMIT {end - start} OFFSET {start}"
+                    self.conn.execute(f"UPDATE {self._table} SET selected = ? WHERE id IN ({view})", (flag,))
+                else:
+                    self.conn.execute(f"UPDATE {self._table} SET selected = ? WHERE id = ?", (flag, target))
+
+    def _selection_changed(self):
+        """Drop derived results that may depend on the `selected` column."""
+        self._group_cache.clear()
+        self._notify_change()
+
+    def _view_uses_selection(self) -> bool:
+        """True if the current filter or sort reads the `selected` column."""
+        return "selected" in (self._where or "") or "selected" in (self._order_by or "")
+
+    def _view_records(self, rows: List[sqlite3.Row], offset: int) -> List[Dict[str, Any]]:
+        """Convert rows starting at view index `offset`, with `selected` reflecting the recorded selection."""
+        records = [self._record(row) for row in rows]
+        selection = self._selection
+        if selection.pending:
+            for position, record in enumerate(records, offset):
+                record["selected"] = selection.flag_of(record["id"], record.get("selected") or 0, position)
+        return records
+
+    def _row_count(self) -> int:
+        return self.conn.execute(f"SELECT COUNT(*) FROM {self._table}").fetchone()[0]
+
+    def _record_exists(self, record_id: Any) -> bool:
+        return self.conn.execute(f"SELECT 1 FROM {self._table} WHERE id = ?", (record_id,)).fetchone() is not None
+
+    def _own_flag(self, record_id: Any) -> Optional[int]:
+        row = self.conn.execute(f"SELECT selected FROM {self._table} WHERE id = ?", (record_id,)).fetchone()
+        return None if row is None else int(row[0] == 1)
+
+    # === GROUPING ===
+
+    def group_by(
+            self,
+            columns: Union[str, Sequence[str]],
+            aggregates: Optional[Mapping[str, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Group the filtered records with SQL GROUP BY and return one header per group.
+
+        Args:
+            columns: A column name, a comma separated string, or a sequence of names.
+            aggregates: Mapping of output name to COUNT/SUM/AVG/MIN/MAX expression,
+                e.g. {"total": "SUM(score)"}.
+
+        Returns:
+            A list of group header dictionaries holding the group column values,
+            a `count` of rows, and one entry per aggregate. Groups are ordered
+            by their column values, with NULL last. Results are cached until the
+            data or filter changes.
+        """
+        cols = parse_group_columns(columns)
+        aggs = parse_aggregates(aggregates)
+        cache_key = (cols, aggs)
+        cached = self._group_cache.get(cache_key)
+        if cached is not None:
+            return [dict(h) for h in cached]
+        self._settle_selection()
+
+        select = [*cols, "COUNT(*) AS count"]
+        select += [f"{func}({col}) AS {alias}" for alias, func, col in aggs]
+        group_cols = ", ".join(cols)
+        order_by = ", ".join(f"{c} IS NULL, {c}" for c in cols)
+
+        query = f"SELECT {', '.join(select)} FROM {self._table}"
+        if self._where:
+            query += f" WHERE {self._where}"
+        query += f" GROUP BY {group_cols} ORDER BY {order_by}"
+
+        headers = [dict(row) for row in self.conn.execute(query).fetchall()]
+        self._group_cache[cache_key] = headers
+        return [dict(h) for h in headers]
 
     # === DATA EXPORT ===
 
@@ -295,6 +486,7 @@ class SqliteDataSource:
                          If False, exports only selected records.
         """
         self._ensure_selected_column()
+        self._settle_selection()
         query = f"SELECT * FROM {self._table}"
         if not include_all:
             query += " WHERE selected = 1"
@@ -306,17 +498,122 @@ class SqliteDataSource:
             return
 
         with open(filepath, mode='w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=rows[0].keys())
+            writer = csv.DictWriter(f, fieldnames=[k for k in rows[0].keys() if k != POSITION_COLUMN])
             writer.writeheader()
             for row in rows:
-                writer.writerow(dict(row))
+                writer.writerow(self._record(row))
 
     def get_page_from_index(self, start_index: int, count: int) -> List[Dict[str, Any]]:
+        if self._view_uses_selection():
+            self._settle_selection()
         query = f"SELECT * FROM {self._table}"
         if self._where:
             query += f" WHERE {self._where}"
-        if self._order_by:
-            query += f" ORDER BY {self._order_by}"
+        query += self._order_clause()
         query += f" LIMIT {count} OFFSET {start_index}"
         cursor = self.conn.execute(query)
-        return [dict(row) for row in cursor.fetchall()]
+        return self._view_records(cursor.fetchall(), start_index)
+
+    # === ORDERING ===
+
+    def move_records(self, ids: Sequence[Any], target_index: int) -> int:
+        """
+        Move records so they occupy consecutive view positions starting at `target_index`.
+
+        The moved records keep their relative order. Only their rows are written:
+        each gets a fractional position between its new neighbours.
+
+        Args:
+            ids: Ids of the records to move.
+            target_index: View index of the first moved record after the move.
+
+        Returns:
+            The number of records moved.
+
+        Raises:
+            ValueError: If a sort is applied, since the sort decides the order.
+        """
+        if self._order_by:
+            raise ValueError("Records cannot be moved while a sort is applied")
+        self._settle_selection()
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return 0
+        self._ensure_position_column()
+
+        marks = ", ".join("?" for _ in ids)
+        moved = [row[0] for row in self.conn.execute(
+            f"SELECT id FROM {self._table} WHERE id IN ({marks}) ORDER BY {POSITION_COLUMN}", ids)]
+        if not moved:
+            return 0
+
+        lo, hi = self._move_bounds(ids, max(0, int(target_index)), len(moved))
+        if (hi - lo) / (len(moved) + 1) < 1e-6:
+            # repeated moves into the same gap exhausted float precision
+            self._renumber_positions()
+            lo, hi = self._move_bounds(ids, max(0, int(target_index)), len(moved))
+        step = (hi - lo) / (len(moved) + 1)
+
+        with self.conn:
+            self.conn.executemany(
+                f"UPDATE {self._table} SET {POSITION_COLUMN} = ? WHERE id = ?",
+                [(lo + step * (i + 1), record_id) for i, record_id in enumerate(moved)])
+        self._bump_version()
+        return len(moved)
+
+    def _move_bounds(self, ids: List[Any], target: int, count: int) -> tuple[float, float]:
+        """Return the positions the moved block must fit between."""
+        marks = ", ".join("?" for _ in ids)
+        where = f"({self._where}) AND " if self._where else ""
+        rest = f"SELECT {POSITION_COLUMN} FROM {self._table} WHERE {where}id NOT IN ({marks})"
+
+        before = after = None
+        if target == 0:
+            row = self.conn.execute(f"{rest} ORDER BY {POSITION_COLUMN} LIMIT 1", ids).fetchone()
+            after = row[0] if row else None
+        else:
+            rows = self.conn.execute(f"{rest} ORDER BY {POSITION_COLUMN} LIMIT 2 OFFSET {target - 1}", ids).fetchall()
+            if rows:
+                before = rows[0][0]
+                after = rows[1][0] if len(rows) > 1 else None
+            else:
+                row = self.conn.execute(f"{rest} ORDER BY {POSITION_COLUMN} DESC LIMIT 1", ids).fetchone()
+                before = row[0] if row else None
+
+        if before is None and after is None:
+            return 0.0, float(count + 1)
+        if before is None:
+            return after - count - 1, after
+        if after is None:
+            return before, before + count + 1
+        return before, after
+
+    def _ensure_position_column(self):
+        """Add POSITION_COLUMN, seeded with the current (id) order."""
+        if self._positioned:
+            return
+        with self.conn:
+            self.conn.execute(f"ALTER TABLE {self._table} ADD COLUMN {POSITION_COLUMN} REAL")
+            self.conn.execute(f"UPDATE {self._table} SET {POSITION_COLUMN} = id")
+            self.conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self._table}_position ON {self._table} ({POSITION_COLUMN})")
+        self._positioned = True
+
+    def _renumber_positions(self):
+        with self.conn:
+            self.conn.execute(
+                f"WITH ranked AS (SELECT id, ROW_NUMBER() OVER (ORDER BY {POSITION_COLUMN}) AS rn FROM {self._table}) "
+                f"UPDATE {self._table} SET {POSITION_COLUMN} = (SELECT rn FROM ranked WHERE ranked.id = {self._table}.id)")
+
+    def _order_clause(self) -> str:
+        if self._order_by:
+            return f" ORDER BY {self._order_by}"
+        if self._positioned:
+            return f" ORDER BY {POSITION_COLUMN}"
+        return ""
+
+    @staticmethod
+    def _record(row: sqlite3.Row) -> Dict[str, Any]:
+        record = dict(row)
+        record.pop(POSITION_COLUMN, None)
+        return record
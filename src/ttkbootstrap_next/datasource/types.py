@@ -19,7 +19,7 @@ class DataSourceProtocol(Protocol):
     # ---------- data & view config ----------
     def set_data(self, records: Sequence[Primitive] | Sequence[Mapping[str, Any]]) -> "DataSourceProtocol": ...
 
-    def set_filter(self, where_sql: str = "") -> None: ...
+    def set_filter(self, where_sql: str = "") -> None: ...  # may also accept `refine: bool`
 
     def set_sort(self, order_by_sql: str = "") -> None: ...
 
@@ -61,3 +61,21 @@ class DataSourceProtocol(Protocol):
 
     # ---------- index-based paging ----------
     def get_page_from_index(self, start_index: int, count: int) -> List[Record]: ...
+
+
+# ---------- optional capabilities ----------
+# Not part of DataSourceProtocol, so sources written against it keep passing the
+# runtime check; callers probe for these methods with getattr/hasattr.
+
+class RangeSelectableDataSource(Protocol):
+    def select_range(self, start_index: int, end_index: int, selected: bool = True) -> int: ...
+
+
+class ReorderableDataSource(Protocol):
+    def move_records(self, ids: Sequence[Any], target_index: int) -> int: ...
+
+
+class GroupingDataSource(Protocol):
+    def group_by(
+            self, columns: str | Sequence[str], aggregates: Optional[Mapping[str, str]] = None
+    ) -> List[Record]: ...
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Callable, List, Mapping, Optional, Sequence, Tuple, Union
+
+_IDENT_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_AGGREGATE_RE = re.compile(
+    r"^\s*(COUNT|SUM|AVG|MIN|MAX)\s*\(\s*(\*|[A-Za-z_][A-Za-z0-9_]*)\s*\)\s*$", re.IGNORECASE)
+
+AGGREGATE_FUNCS = ("COUNT", "SUM", "AVG", "MIN", "MAX")
+
+
+class ChangeNotifier:
+    """
+    Mixin that lets views subscribe to changes in a data source.
+
+    Listeners are called with no arguments after the records, the selection,
+    or the filter/sort change. Subclasses initialize `_change_listeners`.
+    """
+    _change_listeners: List[Callable[[], Any]]
+
+    def on_change(self, callback: Callable[[], Any]) -> Callable[[], None]:
+        """
+        Call `callback` whenever the records or the current view change.
+
+        Returns:
+            A function that removes the listener.
+        """
+        listeners = self._change_listeners
+        listeners.append(callback)
+
+        def cancel():
+            if callback in listeners:
+                listeners.remove(callback)
+
+        return cancel
+
+    def _notify_change(self) -> None:
+        for callback in list(self._change_listeners):
+            callback()
+
+
+def parse_group_columns(columns: Union[str, Sequence[str]]) -> Tuple[str, ...]:
+    """
+    Normalize a group column spec into a tuple of column names.
+
+    Accepts "region", "region, status", or ["region", "status"].
+    """
+    if isinstance(columns, str):
+        parts = [p.strip() for p in columns.split(",")]
+    else:
+        parts = [str(p).strip() for p in columns]
+    parts = [p for p in parts if p]
+    if not parts:
+        raise ValueError("group_by requires at least one column")
+    for p in parts:
+        if not _IDENT_RE.match(p):
+            raise ValueError(f"Invalid group column: {p!r}")
+    return tuple(parts)
+
+
+def parse_aggregates(aggregates: Optional[Mapping[str, str]]) -> Tuple[Tuple[str, str, str], ...]:
+    """
+    Parse {"total": "SUM(score)", "n": "COUNT(*)"} into (alias, FUNC, column) triples.
+
+    Supported functions: COUNT, SUM, AVG, MIN, MAX. `*` is only valid for COUNT.
+    """
+    out: List[Tuple[str, str, str]] = []
+    for alias, expr in (aggregates or {}).items():
+        if not _IDENT_RE.match(str(alias)):
+            raise ValueError(f"Invalid aggregate name: {alias!r}")
+        m = _AGGREGATE_RE.match(str(expr))
+        if not m:
+            raise ValueError(f"Unrecognized aggregate expression: {expr!r}")
+        func, col = m.group(1).upper(), m.group(2)
+        if col == "*" and func != "COUNT":
+            raise ValueError(f"{func}(*) is not supported")
+        out.append((str(alias), func, col))
+    return tuple(out)
@@ -203,6 +203,7 @@ class Event(StrEnum):
 
     ITEM_SELECTING = "<<Tkb-ItemSelecting>>"
     ITEM_SELECTED = "<<Tkb-ItemSelected>>"
+    ITEM_RANGE_SELECTING = "<<Tkb-ItemRangeSelecting>>"
 
     ITEM_FOCUSED = "<<Tkb-ItemFocused>>"
 
@@ -3,16 +3,19 @@
 This module centralizes Tk/ttk event binding with a small FRP-style Stream API.
 
 The module installs a single Tk binding per (scope, sequence) and multiplexes
-to subscribers. It also provides helpers to emit virtual events with JSON
+to subscribers. It also provides helpers to emit virtual events with Python
 payloads and to manage rebinding safely.
 
 Features:
   * Wraps Tk's `bind`, `bind_class`, and `bind_all` with ttkbootstrap integration.
   * Uses per-event substitution strings (`event_substring`) so Tcl only expands
     the fields each event type needs.
-  * Braces `%d` substitutions as `{%d}` so JSON payloads in `event_generate -data`
-    are not split by Tcl.
-  * `.emit()` to programmatically generate events (virtual events carry payloads).
+  * Braces `%d` substitutions as `{%d}` so `event_generate -data` values are not
+    split by Tcl.
+  * `.emit()` to programmatically generate events. Virtual event payloads stay on
+    the Python side (`core.payload_store`); only a short reference crosses Tcl.
+  * `.emit(..., via="python")` delivers virtual events synchronously to the stream
+    listeners of the widget's bindtags without going through Tk at all.
   * Tracks callbacks/func_ids for safe rebinding and cleanup.
   * Stream API with composition operators and Tk/domain short-circuit semantics.
 
@@ -30,12 +33,17 @@ Scopes:
 
 from __future__ import annotations
 
+import time
 import weakref
+from bisect import insort
 from collections import defaultdict
+from itertools import count
 from typing import Any, Callable, Dict, Generic, List, Literal, Mapping, Optional, TypeVar, Union
 
+from ttkbootstrap_next.core import payload_store
 from ttkbootstrap_next.events import EventType
-from ttkbootstrap_next.interop.runtime.commands import event_callback_wrapper
+from ttkbootstrap_next.interop.runtime.commands import event_callback_wrapper, owned_commands, release_command
+from ttkbootstrap_next.interop.runtime.event_types import WidgetEvent
 from ttkbootstrap_next.interop.spec.profiles import event_substring
 from ttkbootstrap_next.types import Widget
 
@@ -46,6 +54,7 @@ from ttkbootstrap_next.types import Widget
 T = TypeVar("T")
 U = TypeVar("U")
 When = Literal["now", "tail", "head", "mark"]
+Via = Literal["tk", "python", "auto"]
 
 
 # --------------------------------------------------------------------- timing
@@ -93,22 +102,50 @@ class Subscription:
     dispose = unlisten
 
 
+_listen_order = count()  # ties between equal priorities go to the earlier listener
+_COMPACT_MIN = 16  # tombstones tolerated before a stream compacts its subscriber list
+_VETO = object()  # returned by `cancel_when` guards; stops the stream even on operator-derived streams
+
+
+class _Sub:
+    """A subscriber entry; `fn` is cleared (a tombstone) when the subscription is cancelled."""
+
+    __slots__ = ("key", "fn")
+
+    def __init__(self, priority: int, fn: Callable[[Any], Any]) -> None:
+        self.key = (-priority, next(_listen_order))
+        self.fn: Optional[Callable[[Any], Any]] = fn
+
+
+def _sub_key(sub: _Sub) -> tuple[int, int]:
+    return sub.key
+
+
 class Stream(Generic[T]):
     """Minimal push-stream with composition and terminals.
 
     Notes:
-        - Subscribers run in descending priority (higher first).
+        - Subscribers run in descending priority (higher first), and in
+          subscription order within a priority.
         - Returning `"break"` short-circuits later subscribers on this stream
           and signals Tk to stop propagation.
         - `cancel_when` is for domain veto on pre/ING events; `then_stop`
           controls raw Tk propagation.
+        - Subscribing is a binary insertion and unsubscribing leaves a
+          tombstone that is compacted away later, so neither re-sorts nor scans
+          the subscriber list. A value is delivered to the subscribers present
+          when it was pushed; listeners added meanwhile see the next value.
     """
 
-    __slots__ = ("_subs", "_on_empty", "_sched")
+    __slots__ = ("_subs", "_live", "_dead", "_depth", "_on_first", "_on_empty", "_sched")
 
     def __init__(self, scheduler: Optional[_TkScheduler] = None):
-        # store subscribers as (priority, fn)
-        self._subs: List[tuple[int, Callable[[T], Any]]] = []
+        # subscribers ordered by (-priority, listen order)
+        self._subs: List[_Sub] = []
+        self._live = 0
+        self._dead = 0  # tombstones still in `_subs`
+        self._depth = 0  # nested dispatches in progress
+        self._on_first: Optional[Callable[[], None]] = None
         self._on_empty: Optional[Callable[[], None]] = None
         self._sched = scheduler
 
@@ -124,17 +161,25 @@ class Stream(Generic[T]):
         Returns:
             Subscription: Disposable handle.
         """
-        pair = (priority, fn)
-        self._subs.append(pair)
-        # keep highest priority first
-        self._subs.sort(key=lambda p: p[0], reverse=True)
+        if not self._live and self._on_first is not None:
+            self._on_first()
+        sub = _Sub(priority, fn)
+        if self._depth:
+            # a dispatch is iterating `_subs`; leave its snapshot untouched
+            self._subs = list(self._subs)
+        insort(self._subs, sub, key=_sub_key)
+        self._live += 1
 
         def _cancel():
-            try:
-                self._subs.remove(pair)
-            finally:
-                if not self._subs and self._on_empty:
-                    self._on_empty()
+            if sub.fn is None:
+                return
+            sub.fn = None
+            self._live -= 1
+            self._dead += 1
+            if not self._depth and self._dead > max(_COMPACT_MIN, self._live):
+                self._compact()
+            if not self._live and self._on_empty:
+                self._on_empty()
 
         return Subscription(_cancel)
 
@@ -173,8 +218,8 @@ class Stream(Generic[T]):
         """Chainable domain veto for pre/ING streams.
 
         Installs a high-priority guard that evaluates `predicate(payload)`,
-        marks the event vetoed, and returns `"break"` so later listeners (e.g.,
-        the mutator) do not run. On predicate errors, fails open (no cancel).
+        marks the event vetoed, and stops later listeners (e.g., the mutator),
+        also on operator-derived streams; on a Tk-bound stream it returns `"break"`. On predicate errors, fails open (no cancel).
 
         Args:
             predicate: Function receiving event.
@@ -192,7 +237,7 @@ class Stream(Generic[T]):
                         ev.veto()
                     elif isinstance(payload, dict):
                         payload["_veto"] = True
-                    return "break"
+                    return _VETO
             except Exception:
                 return None
 
@@ -309,9 +354,42 @@ class Stream(Generic[T]):
     # ---------------- internal -----------------------------------------------
 
     def _next(self, v: T) -> None:
-        """Push values downstream (operators ignore 'break')."""
-        for _prio, fn in list(self._subs):
-            fn(v)
+        """Push values downstream (operators ignore 'break'; a `cancel_when` veto still stops)."""
+        self._dispatch(v, stop_on_break=False)
+
+    def _dispatch(self, v: T, *, swallow: bool = False, stop_on_break: bool = True) -> Optional[str]:
+        """Run the live subscribers in order; returns `"break"` if one stopped the rest.
+
+        With `swallow`, a subscriber that raises is skipped instead of ending the dispatch.
+        Without `stop_on_break`, only a `cancel_when` veto stops the remaining subscribers.
+        """
+        subs = self._subs  # replaced, not mutated, by listens during the loop
+        self._depth += 1
+        try:
+            for sub in subs:
+                fn = sub.fn
+                if fn is None:
+                    continue
+                if swallow:
+                    try:
+                        result = fn(v)
+                    except Exception:
+                        # Optional: log
+                        continue
+                else:
+                    result = fn(v)
+                if result is _VETO or (stop_on_break and result == "break"):
+                    return "break"
+            return None
+        finally:
+            self._depth -= 1
+            if not self._depth and self._dead > max(_COMPACT_MIN, self._live):
+                self._compact()
+
+    def _compact(self) -> None:
+        """Drop the tombstones left by cancelled subscriptions."""
+        self._subs = [sub for sub in self._subs if sub.fn is not None]
+        self._dead = 0
 
     # ---------- operator utilities (for cleanup and scheduling) ---------------
     def _chain(self, attach: Callable[[Callable[[T], Any]], "Subscription"], on_value: Callable[[T], Any]) -> "Stream":
@@ -342,11 +420,18 @@ class Stream(Generic[T]):
 
 Scope = Union[Literal["widget", "all"], str]  # str = Tk class name like "TEntry"
 
+# Hubs reachable from the pure-Python dispatch path (`emit(via="python")`): hubs with
+# widget-scope streams by Tk path name, and hubs with class or "all" streams by bindtag.
+_widget_hubs: "weakref.WeakValueDictionary[str, _EventHub]" = weakref.WeakValueDictionary()
+_tag_hubs: Dict[str, "weakref.WeakKeyDictionary[_EventHub, None]"] = defaultdict(weakref.WeakKeyDictionary)
+# Tcl command names of hub dispatchers, to tell them apart from other bindings
+_hub_commands: set[str] = set()
+
 
 class _EventHub:
     """Dispatcher that multiplexes a single Tk bind to stream subscribers."""
 
-    __slots__ = ("_owner_ref", "_streams", "_func_ids")
+    __slots__ = ("_owner_ref", "_streams", "_func_ids", "__weakref__")
 
     def __init__(self, mixin_owner: "BindingMixin") -> None:
         self._owner_ref = weakref.ref(mixin_owner)
@@ -363,37 +448,58 @@ class _EventHub:
             return s
 
         owner = self._owner_ref()
-        s = Stream[Any](scheduler=_TkScheduler(owner.widget))
+        s = Stream[Any](scheduler=_TkScheduler(owner.widget) if owner is not None else None)
         self._streams[key] = s
 
         if owner is None:
             return s
 
         def _dispatcher(event: Any):
-            for _prio, fn in list(s._subs):
-                try:
-                    if fn(event) == "break":
-                        return "break"
-                except Exception:
-                    # Optional: log
-                    pass
-            return None
-
-        if scope_key == "widget":
-            func_id = owner._bind_widget(sequence, _dispatcher, add=True, dedup=True)
-        elif scope_key == "all":
-            func_id = owner._bind_all(sequence, _dispatcher, add=True)
-        else:
-            func_id = owner._bind_class(scope_key, sequence, _dispatcher, add=True)
+            return self._deliver(s, event)
+
+        def _bind() -> None:
+            # the Tk binding exists only while the stream has listeners
+            owner = self._owner_ref()
+            if owner is None or key in self._func_ids:
+                return
+            if scope_key == "widget":
+                func_id = owner._bind_widget(sequence, _dispatcher, add=True, dedup=True)
+            elif scope_key == "all":
+                func_id = owner._bind_all(sequence, _dispatcher, add=True)
+            else:
+                func_id = owner._bind_class(scope_key, sequence, _dispatcher, add=True)
 
-        self._func_ids[key] = func_id
+            self._func_ids[key] = func_id
+            _hub_commands.add(func_id)
+            if scope_key == "widget":
+                _widget_hubs[str(owner.widget)] = self
+            else:
+                _tag_hubs[scope_key][self] = None
+
+        def _unbind() -> None:
+            # the last listener left: remove the binding and reclaim its Tcl command
+            func_id = self._func_ids.pop(key, None)
+            owner = self._owner_ref()
+            if func_id is None or owner is None:
+                return
+            _hub_commands.discard(func_id)
+            owner._unbind(scope_key, sequence, func_id)
+
+        s._on_first = _bind
+        s._on_empty = _unbind
+        return s
 
-        def _on_empty() -> None:
-            # Keeping the dispatcher bound is cheap and avoids churn.
-            self._streams.pop(key, None)
+    def dispatch(self, sequence: str, event: Any, scope: Scope = "widget") -> Optional[str]:
+        """Deliver `event` to the subscribers of (scope, sequence) without going through Tk."""
+        s = self._streams.get((self._scope_key(scope), sequence))
+        if s is None:
+            return None
+        return self._deliver(s, event)
 
-        s._on_empty = _on_empty
-        return s
+    @staticmethod
+    def _deliver(s: Stream[Any], event: Any) -> Optional[str]:
+        """Run the subscribers of `s` in priority order; a `"break"` stops the rest."""
+        return s._dispatch(event, swallow=True)
 
     @staticmethod
     def _scope_key(scope: Scope) -> str:
@@ -405,6 +511,17 @@ class _EventHub:
         return str(scope)
 
 
+def _remove_script(widget: Widget, tag: str, sequence: str, func_id: str) -> None:
+    """Drop the lines calling `func_id` from the script bound to `sequence` on `tag`."""
+    try:
+        script = str(widget.tk.call("bind", tag, sequence))
+        kept = [line for line in script.splitlines() if line.strip() and line.split(None, 1)[0] != func_id]
+        widget.tk.call("bind", tag, sequence, "\n".join(kept))
+    except Exception:
+        # the widget (and with it the tag's bindings) may already be gone
+        pass
+
+
 # =============================================================================
 # BindingMixin
 # =============================================================================
@@ -420,6 +537,8 @@ class BindingMixin:
         self.__tcl_bound_events: dict[str, list[str]] = defaultdict(list)
         # func_id -> Python callable
         self.__tcl_callbacks: dict[str, Callable[..., Any]] = {}
+        # (tag, sequence, func_id) of class and application-wide bindings made by this widget
+        self.__tcl_shared_binds: list[tuple[str, str, str]] = []
         # lazy-initialized hub for stream events
         self.__event_hub: Optional[_EventHub] = None
         super().__init__(*args, **kwargs)
@@ -464,6 +583,7 @@ class BindingMixin:
         )
         self.__tcl_bound_events[sequence].append(func_id)
         self.__tcl_callbacks[func_id] = func
+        self.__tcl_shared_binds.append((class_name, sequence, func_id))
         return func_id
 
     def _bind_all(
@@ -481,8 +601,56 @@ class BindingMixin:
         self.widget.tk.call("bind", "all", sequence, f"+{script}" if add else script)
         self.__tcl_bound_events[sequence].append(func_id)
         self.__tcl_callbacks[func_id] = func
+        self.__tcl_shared_binds.append(("all", sequence, func_id))
         return func_id
 
+    # ---------------------------------------------------------------- unbinders
+
+    def _unbind(self, scope: Scope, event: EventType, func_id: str) -> None:
+        """Remove one binding made by this widget and release its Tcl command.
+
+        Args:
+            scope: "widget", "all", or the class name / bindtag the callback was bound to.
+            event: The bound event sequence.
+            func_id: The command id returned by the binder.
+        """
+        sequence = self._normalize(event)
+        tag = str(self.widget) if scope == "widget" else str(scope)
+        _remove_script(self.widget, tag, sequence, func_id)
+        ids = self.__tcl_bound_events.get(sequence)
+        if ids and func_id in ids:
+            ids.remove(func_id)
+        self.__tcl_callbacks.pop(func_id, None)
+        if scope != "widget":
+            self.__tcl_shared_binds = [b for b in self.__tcl_shared_binds if b[2] != func_id]
+        release_command(self.widget, func_id)
+
+    def _release_commands(self) -> None:
+        """Reclaim every Tcl command registered on this widget once it is destroyed.
+
+        Runs at idle, after Tk has finished delivering `<Destroy>`. Class and
+        application-wide scripts installed by the widget are removed first, so
+        no binding is left calling a deleted command.
+        """
+        widget = self.widget
+        shared = self.__tcl_shared_binds
+        func_ids = owned_commands(widget)
+        self.__tcl_shared_binds = []
+        self.__tcl_bound_events.clear()
+        self.__tcl_callbacks.clear()
+
+        def release():
+            for tag, sequence, func_id in shared:
+                _remove_script(widget, tag, sequence, func_id)
+            for func_id in func_ids:
+                release_command(widget, func_id)
+
+        try:
+            widget._root().after_idle(release)
+        except Exception:
+            # the application is shutting down; the interpreter goes with it
+            pass
+
     # ---------------------------------------------------------------- rebinders
 
     def _tcl_rebind_widget(self) -> None:
@@ -511,14 +679,13 @@ class BindingMixin:
 
     # ---------------------------------------------------------------- emitters
 
-    # TODO this needs some protection against massive payloads
-
     def emit(
             self,
             event: EventType,
             data: dict[str, Any] | Any | None = None,
             *,
             when: When = "now",
+            via: Via = "tk",
             **kwargs,
     ) -> None:
         """Programmatically generate a Tk event on this widget.
@@ -527,9 +694,23 @@ class BindingMixin:
             event: Tk event sequence (e.g., '<<Invalid>>', '<Return>').
             data: Payload for virtual events (<<...>>). If a mapping, it is
                 merged with ``**kwargs``. If non-mapping, it is wrapped as
-                ``{'data': data}`` and merged with ``**kwargs``.
+                ``{'data': data}`` and merged with ``**kwargs``. The payload is
+                parked in `core.payload_store` and listeners receive its values
+                as-is, so emitting is independent of the payload's size.
             when: Tk scheduling for the generated event ('now', 'tail', 'head', 'mark').
+                With the Python path, anything but 'now' dispatches at idle.
+            via: How the event is delivered.
+                'tk' (default) generates it through Tk.
+                'python' hands a virtual event straight to the `on()` listeners of
+                the widget's bindtags (widget, class, toplevel, "all"), in Tk's order,
+                skipping `event_generate`, %-substitution and converters. Bindings
+                made outside `on()` do not see it.
+                'auto' takes the Python path for virtual events when every binding
+                of the event on the widget's bindtags is a stream dispatcher.
             **kwargs: Additional key/values flattened into the payload for virtual events.
+
+        Raises:
+            ValueError: If `via` is 'python' and `event` is not a virtual event.
         """
         sequence = self._normalize(event)
 
@@ -542,29 +723,75 @@ class BindingMixin:
             # Non-mapping (e.g., list, tuple, str, int ...)
             payload = {"data": data, **kwargs} if kwargs else data
 
+        if via != "tk":
+            if sequence.startswith("<<") and sequence.endswith(">>"):
+                tags = self.widget.bindtags()
+                if via == "python" or self._python_reachable(tags, sequence):
+                    if when == "now":
+                        self._dispatch_python(sequence, payload, tags)
+                    else:
+                        self.widget.after_idle(self._dispatch_python, sequence, payload, tags)
+                    return
+            elif via == "python":
+                raise ValueError(f"via='python' only delivers virtual events, got {sequence!r}")
+
         # Only virtual events carry payload
         if sequence.startswith("<<") and sequence.endswith(">>") and payload is not None:
-            import json
-            import base64
-            import datetime as _dt
-            import enum as _enum
-
-            def _default(o: Any):
-                if isinstance(o, (_dt.date, _dt.datetime, _dt.time)):
-                    return o.isoformat()
-                if isinstance(o, _enum.Enum):
-                    return getattr(o, "value", o.name)
-                if isinstance(o, set):
-                    return list(o)
-                return str(o)
-
-            # JSON -> base64 (avoid Tcl parsing of [, $, \, etc.)
-            json_bytes = json.dumps(payload, default=_default).encode("utf-8")
-            b64 = base64.b64encode(json_bytes).decode("ascii")
-            self.widget.event_generate(sequence, data="b64:" + b64, when=when)
+            # only the slot reference crosses Tcl; `convert_event_data` resolves it
+            ref = payload_store.store(payload)
+            try:
+                self.widget.event_generate(sequence, data=ref, when=when)
+            except Exception:
+                payload_store.release(ref)
+                raise
+            if when == "now":
+                # "now" dispatches synchronously, so every listener has run
+                payload_store.release(ref)
+            else:
+                # Not at idle: `update_idletasks` runs idle callbacks without delivering
+                # queued events. A due timer is queued behind every event already in the
+                # Tcl queue, so it runs only after this event has been delivered.
+                self.widget.after(0, payload_store.release, ref)
         else:
             self.widget.event_generate(sequence, when=when)
 
+    def _dispatch_python(self, sequence: str, payload: Any, tags: tuple[str, ...]) -> Optional[str]:
+        """Deliver a virtual event to the stream listeners of `tags`, as Tk would.
+
+        Bindtags are visited in order; a Tk path name reaches the widget-scope
+        streams of that widget, any other tag the class or "all" streams bound
+        to it. A listener returning `"break"` stops the remaining tags.
+
+        Returns:
+            `"break"` if a listener stopped the dispatch, else None.
+        """
+        evt = WidgetEvent(
+            name=sequence,
+            data=payload if isinstance(payload, dict) else {},
+            target=self,
+            timestamp=time.time(),
+        )
+        for tag in tags:
+            if tag[0] == ".":
+                hub = _widget_hubs.get(tag)
+                if hub is not None and hub.dispatch(sequence, evt) == "break":
+                    return "break"
+            else:
+                for hub in list(_tag_hubs.get(tag, ())):
+                    if hub.dispatch(sequence, evt, tag) == "break":
+                        return "break"
+        return None
+
+    def _python_reachable(self, tags: tuple[str, ...], sequence: str) -> bool:
+        """True if every Tcl binding of `sequence` on `tags` is a stream dispatcher."""
+        tk = self.widget.tk
+        for tag in tags:
+            for line in str(tk.call("bind", tag, sequence)).splitlines():
+                line = line.strip()
+                if line and line.split(None, 1)[0] not in _hub_commands:
+                    return False
+        return True
+
     # ---------------------------------------------------------------- helpers
 
     @staticmethod
@@ -584,10 +811,13 @@ class BindingMixin:
         """Return a multiplexed Stream for the given event and scope.
 
         Binding:
-            The first call to `.on(event, scope)` installs a single underlying
-            Tk binding for that (scope, sequence). All listeners are fanned out
-            from that dispatcher. If any listener returns `"break"`, propagation
-            stops for that event instance at both the stream and Tk levels.
+            `.on(event, scope)` only creates (or returns) the stream for that
+            (scope, sequence). Its first `listen()` installs a single underlying
+            Tk binding, and all listeners are fanned out from that dispatcher.
+            When the last listener leaves, the binding is removed and its Tcl
+            command reclaimed; listening to the same stream again rebinds it.
+            If any listener returns `"break"`, propagation stops for that event
+            instance at both the stream and Tk levels.
 
         Args:
             event: Tk event sequence (e.g., '<<Change>>', '<Return>').
@@ -9,13 +9,17 @@ Register Python callables as Tcl/Tk commands.
 - event_callback_wrapper: event handler; builds a minimal, per-event payload
   using `runtime.event_factory.builder_for(...)` and passes it to the callback.
 
+Every command is owned by the widget it was registered on. `release_command`
+deletes one, `owned_commands` lists a widget's commands so they can be released
+once it is destroyed, and `commands_stats` reports live and released counts.
+
 Errors are routed to an optional custom handler and otherwise logged, then re-raised.
 """
 
 from __future__ import annotations
 
 import logging
-from collections import namedtuple
+from collections import defaultdict, namedtuple
 from functools import wraps
 from typing import Any, Callable, Optional
 from uuid import uuid4
@@ -29,6 +33,9 @@ __all__ = [
     "command_wrapper",
     "trace_callback_wrapper",
     "event_callback_wrapper",
+    "release_command",
+    "owned_commands",
+    "commands_stats",
     "set_error_handler",
     "get_error_handler",
 ]
@@ -40,6 +47,10 @@ Trace = namedtuple("Trace", "name operation")
 
 # Bookkeeping: Tcl command id -> original Python function
 _registered_commands: dict[str, Callable[..., Any]] = {}
+# Ownership: Tcl command id -> owner's Tk path name, and the reverse index
+_command_owners: dict[str, str] = {}
+_owned: dict[str, set[str]] = defaultdict(set)
+_counts = {"created": 0, "released": 0}
 
 # Optional pluggable error handler: (exc, context, details) -> None
 _error_handler: Optional[Callable[[BaseException, str, tuple[Any, ...]], None]] = None
@@ -70,6 +81,53 @@ def _handle_exception(exc: BaseException, *, context: str, details: tuple[Any, .
     raise exc
 
 
+def _track(widget: tk.Misc, func_id: str, func: Callable[..., Any]) -> None:
+    """Record a newly created command as owned by `widget`."""
+    owner = str(widget)
+    _registered_commands[func_id] = func
+    _command_owners[func_id] = owner
+    _owned[owner].add(func_id)
+    _counts["created"] += 1
+
+
+def release_command(widget: tk.Misc, func_id: str) -> bool:
+    """Delete a registered Tcl command and drop its Python callable.
+
+    Returns:
+        False if `func_id` is not a live registered command.
+    """
+    if _registered_commands.pop(func_id, None) is None:
+        return False
+    owner = _command_owners.pop(func_id, None)
+    ids = _owned.get(owner)
+    if ids is not None:
+        ids.discard(func_id)
+        if not ids:
+            del _owned[owner]
+    try:
+        widget.tk.deletecommand(func_id)
+    except Exception:
+        # interpreter already gone, or the command was deleted by Tcl
+        pass
+    _counts["released"] += 1
+    return True
+
+
+def owned_commands(widget: tk.Misc) -> list[str]:
+    """Return the ids of the live commands registered on `widget`."""
+    return list(_owned.get(str(widget), ()))
+
+
+def commands_stats() -> dict[str, int]:
+    """Report registered command counts.
+
+    Returns:
+        ``live`` commands currently registered, ``released`` and ``created``
+        totals since startup, and the number of ``owners`` holding live commands.
+    """
+    return dict(live=len(_registered_commands), owners=len(_owned), **_counts)
+
+
 def command_wrapper(
         widget: tk.Misc,
         func: Callable[..., Any],
@@ -80,9 +138,7 @@ def command_wrapper(
     if func_id is None:
         func_id = f"cmd_{uuid4().hex}"
 
-    if func_id in _registered_commands:
-        widget.tk.deletecommand(func_id)
-        _registered_commands.pop(func_id, None)
+    release_command(widget, func_id)
 
     @wraps(func)
     def wrapper(*args):
@@ -92,16 +148,11 @@ def command_wrapper(
             _handle_exception(exc, context="command", details=(func.__name__, args))
         else:
             if transient:
-                try:
-                    widget.tk.deletecommand(func_id)
-                    _registered_commands.pop(func_id, None)
-                except Exception:
-                    # Best-effort cleanup; ignore interpreter state errors
-                    pass
+                release_command(widget, func_id)
             return result
 
     widget.tk.createcommand(func_id, wrapper)
-    _registered_commands[func_id] = func
+    _track(widget, func_id, func)
     return func_id
 
 
@@ -117,7 +168,7 @@ def trace_callback_wrapper(widget: tk.Misc, func: Callable[[Trace], Any]) -> str
             _handle_exception(exc, context="trace", details=(func.__name__, name, index, op))
 
     widget.tk.createcommand(func_id, wrapper)
-    _registered_commands[func_id] = func
+    _track(widget, func_id, func)
     return func_id
 
 
@@ -140,9 +191,7 @@ def event_callback_wrapper(
     elif func_id is None:
         func_id = f"evt_{uuid4().hex}"
 
-    if func_id in _registered_commands:
-        widget.tk.deletecommand(func_id)
-        _registered_commands.pop(func_id, None)
+    release_command(widget, func_id)
 
     # Resolve and cache the builder once per registration (micro-opt).
     build = builder_for(event_name)
@@ -160,5 +209,5 @@ def event_callback_wrapper(
             )
 
     widget.tk.createcommand(func_id, wrapper)
-    _registered_commands[func_id] = func
+    _track(widget, func_id, func)
     return func_id
@@ -4,10 +4,14 @@ interop.runtime.event_factory
 
 Runtime factory for constructing minimal, per-event payload objects (slots
 dataclasses) from raw Tcl substitution values.
+
+Widget references and timestamps are not converted here: they are stored raw
+and resolved by the event object on first access (see `BaseEvent`).
 """
 
 from __future__ import annotations
 
+import time
 from functools import lru_cache
 from typing import Callable, Dict, List, Sequence, Tuple, Type
 
@@ -27,6 +31,13 @@ from ttkbootstrap_next.interop.spec.subs import Sub, event_subs
 # Build a fast lookup: field name -> Sub (to access its converter)
 _SUB_BY_NAME: Dict[str, Sub] = {s.name: s for s in event_subs}
 
+# Fields passed through raw; the event resolves them on first access
+_DEFERRED = frozenset({"target", "toplevel", "timestamp"})
+
+
+def _raw(v: str) -> str:
+    return v
+
 # Map a pattern to the corresponding event dataclass
 _CLASS_BY_PATTERN: Dict[str, Type[BaseEvent]] = {
     "key": KeyEvent,
@@ -51,8 +62,9 @@ def _converters_for(event_name: str) -> Tuple[List[str], Tuple[Callable[[str], o
     Internal: resolve the ordered field names and their converter callables
     for a specific event, with results cached.
     """
-    names = fields_for(event_name)
-    convs = tuple(_SUB_BY_NAME[n].converter for n in names)
+    fields = fields_for(event_name)
+    names = list(fields)
+    convs = tuple(_raw if n in _DEFERRED else _SUB_BY_NAME[n].converter for n in fields)
     return names, convs
 
 
@@ -64,6 +76,8 @@ def builder_for(event_name: str) -> Callable[[str, Sequence[str]], BaseEvent]:
     """
     names, convs = _converters_for(event_name)
     cls = event_class_for(event_name)
+    # virtual events are stamped here rather than by a `[clock seconds]` substitution
+    stamped = pattern_for(event_name) == "virtual"
 
     def _convert(v: str, conv: Callable[[str], object]):
         # Treat Tcl's unknown/sentinel '??' as None, else apply converter.
@@ -85,6 +99,9 @@ def builder_for(event_name: str) -> Callable[[str, Sequence[str]], BaseEvent]:
         if not isinstance(data_val, dict):
             data_val = {}
 
+        if stamped:
+            mapped["timestamp"] = time.time()
+
         # Instantiate minimal, specific event class
         return cls(name=name, data=data_val, **mapped)  # type: ignore[arg-type]
 
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import reprlib
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
 from enum import Enum
 from typing import Any, Dict, Mapping, Optional, Tuple
 
+from ttkbootstrap_next.core.layout_context import default_root
 from ttkbootstrap_next.interop.runtime.key_resolver import decode_mods, resolve_press_from_parts
+from ttkbootstrap_next.interop.spec.converters import convert_event_timestamp, convert_event_widget
 
 
 def _repr_data_preview(d: dict) -> str:
@@ -34,11 +36,34 @@ def _normalize(x: Any) -> Any:
 
 @dataclass(slots=True)
 class BaseEvent:
+    """Common event fields.
+
+    `target`, `toplevel` and `timestamp` are kept as the raw values they were built
+    from (a Tk path name, epoch seconds) and resolved on first access, so handlers
+    that never read them pay for neither the registry lookup nor the conversion.
+    The constructor and `dataclasses.replace` take the raw values under those names.
+    """
     name: str
-    target: Optional[str] = None
+    target: InitVar[Any] = None
     data: Dict[str, Any] = field(default_factory=dict)
-    timestamp: Optional[str] = None
-    toplevel: Optional[str] = None
+    timestamp: InitVar[Any] = None
+    toplevel: InitVar[Any] = None
+    _target: Any = field(default=None, init=False)
+    _toplevel: Any = field(default=None, init=False)
+    _timestamp: Any = field(default=None, init=False)
+
+    def __post_init__(self, target: Any, timestamp: Any, toplevel: Any) -> None:
+        self._target = target
+        self._timestamp = timestamp
+        self._toplevel = toplevel
+
+    @property
+    def target_path(self) -> Optional[str]:
+        """The Tk path name of the target, without looking up its wrapper."""
+        t = self._target
+        if t is None or isinstance(t, str):
+            return t
+        return getattr(t, "tk_name", str(t))
 
     def to_dict(self) -> Dict[str, Any]:
         out: Dict[str, Any] = {"name": self.name, "data": _normalize(self.data)}
@@ -58,6 +83,49 @@ class BaseEvent:
     __str__ = __repr__
 
 
+# The InitVars above take the raw values; the attributes of the same name resolve them.
+def _event_target(self: BaseEvent) -> Any:
+    """The widget wrapper the event was delivered to, or its path name if it is not registered."""
+    t = self._target
+    if isinstance(t, str):
+        t = convert_event_widget(t)
+        if not isinstance(t, str):
+            self._target = t
+    return t
+
+
+def _event_toplevel(self: BaseEvent) -> Any:
+    """The wrapper of the target's toplevel window, or its path name if it is not registered."""
+    t = self._toplevel
+    if t is None:
+        path = self.target_path
+        if path is None:
+            return None
+        # an unregistered target has no widget of its own to ask
+        widget = getattr(self.target, "widget", None) or getattr(default_root(), "widget", None)
+        try:
+            t = str(widget.tk.call("winfo", "toplevel", path))
+        except Exception:
+            return None
+    if isinstance(t, str):
+        t = convert_event_widget(t)
+    self._toplevel = t
+    return t
+
+
+def _event_timestamp(self: BaseEvent) -> Optional[str]:
+    """ISO-8601 UTC time the event was built, for events that carry one."""
+    t = self._timestamp
+    if t is not None and not isinstance(t, str):
+        t = self._timestamp = convert_event_timestamp(t)
+    return t
+
+
+BaseEvent.target = property(_event_target)
+BaseEvent.toplevel = property(_event_toplevel)
+BaseEvent.timestamp = property(_event_timestamp)
+
+
 # --- keyboard / key-like ---------------------------------------------------
 @dataclass(slots=True)
 class KeyEvent(BaseEvent):
@@ -13,7 +13,7 @@ Converters
 ----------
 - ``convert_event_timestamp``: seconds → UTC ISO-8601 string (Z suffix).
 - ``convert_event_state``: string → int (if possible), else raw value.
-- ``convert_event_data``: JSON string → dict/list, else raw value.
+- ``convert_event_data``: payload reference or JSON string → Python object.
 - ``convert_event_type``: int code → ``EventEnum``.
 - ``convert_event_widget``: resolve Tk pathname or a custom id to the
   ttkbootstrap widget via the registry; falls back to the original str.
@@ -36,7 +36,7 @@ from datetime import datetime, timezone
 from typing import Any
 
 
-def convert_event_timestamp(seconds: str) -> str:
+def convert_event_timestamp(seconds: str | float) -> str:
     """Convert seconds to an ISO-8601 UTC timestamp string."""
     return datetime.fromtimestamp(int(seconds), tz=timezone.utc).isoformat().replace("+00:00", "Z")
 
@@ -53,6 +53,8 @@ def convert_event_data(data: Any) -> Any:
     """Decode event.data into Python objects.
 
     Supports:
+      - "slot:<token>" references to payloads parked by `emit` (see `core.payload_store`);
+        the original object is returned, not a copy
       - "b64:<...>" payloads (base64-encoded JSON) to avoid Tcl parsing issues
       - Plain JSON strings
       - JSON strings with Tcl backslash-escapes for { } " and space
@@ -71,6 +73,11 @@ def convert_event_data(data: Any) -> Any:
         return data
 
     if isinstance(data, str):
+        # 0) Out-of-band payload reference
+        if data.startswith("slot:"):
+            from ttkbootstrap_next.core import payload_store
+            return payload_store.resolve(data, {})
+
         # 1) Base64-tagged JSON
         if data.startswith("b64:"):
             b64 = data[4:]
@@ -9,9 +9,10 @@ anything from the runtime layer.
 Rules:
 - Physical events (mouse/keyboard/motion/configure) map to minimal field sets.
 - **Any virtual event** (name starts with '<<' and ends with '>>') uses the
-  'widget' profile by default (only '%W').
-  If you later need custom payloads from `event_generate -data`, change the
-  'virtual' profile in _FIELDS to include "data" as well (e.g., ["widget","data"]).
+  'virtual' profile: the `event_generate -data` payload and '%W'.
+- Only plain '%' codes are requested. Fields that would need Tcl to evaluate a
+  command (`[winfo toplevel %W]`, `[clock seconds]`) are left out; the event
+  objects resolve `toplevel` and `timestamp` on first access instead.
 """
 
 from __future__ import annotations
@@ -26,13 +27,13 @@ _SUB_BY_NAME: Dict[str, Sub] = {s.name: s for s in event_subs}
 
 # Patterns → fields to request from Tcl (order matters)
 _FIELDS: Dict[str, List[str]] = {
-    "key": ["keysym", "char", "state", "target", "toplevel"],
-    "button": ["x", "y", "screen_x", "screen_y", "state", "target", "toplevel"],
-    "motion": ["x", "y", "screen_x", "screen_y", "state", "target", "toplevel"],
-    "wheel": ["delta", "x", "y", "target", "toplevel"],
-    "configure": ["width", "height", "x", "y", "target", "toplevel"],
-    "widget": ["target", "toplevel"],
-    "virtual": ["data", "timestamp", "target", "toplevel"]
+    "key": ["keysym", "char", "state", "target"],
+    "button": ["x", "y", "screen_x", "screen_y", "state", "target"],
+    "motion": ["x", "y", "screen_x", "screen_y", "state", "target"],
+    "wheel": ["delta", "x", "y", "target"],
+    "configure": ["width", "height", "x", "y", "target"],
+    "widget": ["target"],
+    "virtual": ["data", "target"]
 }
 
 # Physical event sequence → pattern
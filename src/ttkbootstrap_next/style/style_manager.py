@@ -165,6 +165,20 @@ class StyleManager:
         ttk_style = '.'.join(items).replace('-', '')
         return ttk_style
 
+    def build_with(self, **options) -> str:
+        """Build the style for this manager's options with `options` overridden and return its name.
+
+        The manager's own options are left unchanged, so a widget can precompute
+        alternative styles (for example on another surface) and swap to them later
+        with a single `configure(style=...)`.
+        """
+        saved = self._options
+        self._options = OptionManager(**{**dict(saved.items()), **options})
+        try:
+            return self.build()
+        finally:
+            self._options = saved
+
     def ttk_name_exists(self):
         return self._style.style_exists(self.resolve_ttk_name())
 
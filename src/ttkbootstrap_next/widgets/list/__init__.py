@@ -1,5 +1,6 @@
+from ttkbootstrap_next.widgets.list.canvas_renderer import CanvasRowRenderer
 from ttkbootstrap_next.widgets.list.list_item import ListItem
 from ttkbootstrap_next.widgets.list.style import *
 from ttkbootstrap_next.widgets.list.virtual_list import VirtualList
 
-__all__ = ['VirtualList', 'ListItem']
+__all__ = ['VirtualList', 'ListItem', 'CanvasRowRenderer']
@@ -0,0 +1,450 @@
+from tkinter.font import nametofont
+from typing import Any, Optional
+
+from ttkbootstrap_next.events import Event
+from ttkbootstrap_next.icons import BootstrapIcon
+from ttkbootstrap_next.interop.runtime.key_resolver import SHIFT
+from ttkbootstrap_next.widgets.canvas import Canvas
+from ttkbootstrap_next.widgets.canvas.style import CanvasStyleBuilder
+
+PAD_X = 8  # horizontal padding inside a row
+PAD_Y = 8  # vertical padding above and below the row content
+GAP = 12  # spacing between row parts
+
+# canvas items drawn for every pooled row, bottom to top
+ROW_PARTS = (
+    "bg", "sep", "focus", "select", "icon", "title", "text", "caption",
+    "badge-bg", "badge", "chevron", "drag", "delete")
+
+
+class CanvasRow:
+    """A pooled row drawn as items on the renderer's canvas.
+
+    Stands in for `ListItem` in the VirtualList pool: it exposes `data`,
+    `previewing`, `update_data`, `update_preview` and `destroy`, and its `widget` attribute
+    accepts the `place`/`place_forget` calls the list uses to position rows.
+    """
+
+    def __init__(self, renderer: "CanvasRowRenderer", slot: int):
+        self._renderer = renderer
+        self._data: dict = {}
+        self.preview: dict | None = None  # text shown instead of the record while scrubbing
+        self.tag = f"row{slot}"
+        self.items: dict[str, int] = {}
+        self.top = 0
+        self.height = renderer.measure({})
+        self.natural_height = self.height
+        self.visible = False
+        self.widget = _RowPlacement(self)
+
+    @property
+    def data(self):
+        return self._data
+
+    @property
+    def previewing(self) -> bool:
+        """True while the row shows a preview instead of its fully drawn record."""
+        return self.preview is not None
+
+    @property
+    def selected(self):
+        return self._data.get('selected')
+
+    def update_data(self, record: dict | None):
+        """Redraw the row for `record`; an empty record hides it."""
+        if record is None or '__empty__' in record:
+            self._data, self.preview = {}, None
+            self.widget.place_forget()
+            return
+        self._data, self.preview = record, None
+        self.natural_height = self._renderer.measure(record)
+        if self.visible:
+            self._renderer.draw(self)
+
+    def update_preview(self, record: dict):
+        """Show only the record's title (or text); `update_data` restores the full row."""
+        value = record.get('title', record.get('text'))
+        if value is None:
+            return
+        # keep the record so input on the row still targets it
+        self._data, self.preview = record, {'title': value}
+        if self.visible:
+            self._renderer.draw(self)
+
+    def destroy(self):
+        self._renderer.release(self)
+
+
+class _RowPlacement:
+    """The subset of the Tk geometry API that VirtualList calls on a pooled row."""
+
+    def __init__(self, row: CanvasRow):
+        self._row = row
+
+    def place(self, x=0, y=0, relwidth=1, height=None):
+        row = self._row
+        height = height or row.natural_height
+        if row.visible and height == row.height:
+            if y != row.top:
+                row._renderer.canvas.widget.move(row.tag, 0, y - row.top)
+                row.top = y
+            return
+        row.top, row.height, row.visible = y, height, True
+        row._renderer.draw(row)
+
+    def place_forget(self):
+        row = self._row
+        if row.visible:
+            row.visible = False
+            row._renderer.canvas.widget.itemconfigure(row.tag, state='hidden')
+
+    def winfo_manager(self):
+        return "place" if self._row.visible else ""
+
+    def winfo_reqheight(self):
+        return self._row.natural_height
+
+
+class CanvasRowRenderer:
+    """Draws the rows of a VirtualList as items on a single Canvas.
+
+    A `ListItem` is a tree of about ten Tk widgets, each with its own bindings
+    and style. This renderer keeps one Canvas for the whole viewport and draws
+    each row as a handful of rectangle, text and image items. Pointer input is
+    hit-tested against the row positions and dispatched on `parent` with the same
+    events and payloads a `ListItem` would emit.
+    """
+
+    def __init__(self, parent, **options: Any):
+        """
+        Create the canvas inside `parent` and listen for pointer input.
+
+        Args:
+            parent: The container that receives the row events (the list's event hub).
+            **options: The row options of the owning VirtualList.
+        """
+        self.parent = parent
+        self._options = options
+        self._rows: list[CanvasRow] = []
+        self._slots = 0
+        self._hover: Optional[CanvasRow] = None
+        self._pressed: Optional[dict] = None
+        self._icons: dict[tuple[str, str], Any] = {}
+
+        selection_mode = options.get('selection_mode', 'none')
+        self._ignore_selection_by_click = (
+                selection_mode != 'none' and options.get('selection_controls_visible', False)
+                and not options.get('select_by_click', False))
+
+        self.canvas = Canvas(
+            parent=parent, highlightthickness=0,
+            takefocus=1 if options.get('focus_state_enabled', True) else 0
+        ).attach(fill="both", expand=True)
+        self._builder = CanvasStyleBuilder(self.canvas)
+        self._width = 1
+        self._build_metrics()
+        self._build_palette()
+
+        self.canvas.on(Event.CONFIGURE).listen(self._on_configure)
+        self.canvas.on(Event.MOTION).listen(self._on_motion)
+        self.canvas.on(Event.LEAVE).listen(lambda _: self._set_hover(None))
+        self.canvas.on(Event.CLICK1_DOWN).listen(self._on_press)
+        self.canvas.on(Event.DRAG1).listen(self._on_drag)
+        self.canvas.on(Event.CLICK1_UP).listen(self._on_release)
+        self.canvas.on(Event.KEYDOWN_SPACE).listen(self._on_space)
+        self.canvas.on(Event.THEME_CHANGED).listen(self._on_theme_changed)
+
+    # ---------- pool ----------
+
+    def create_row(self) -> CanvasRow:
+        """Create the canvas items for a new pooled row."""
+        row = CanvasRow(self, self._slots)
+        self._slots += 1
+        cv = self.canvas.widget
+        for part in ROW_PARTS:
+            tags = (row.tag, part)
+            if part in ("bg", "focus", "badge-bg"):
+                item = cv.create_rectangle(0, 0, 0, 0, width=0, tags=tags)
+            elif part == "sep":
+                item = cv.create_line(0, 0, 0, 0, tags=tags)
+            elif part in ("title", "text", "caption", "badge"):
+                item = cv.create_text(0, 0, anchor="nw", tags=tags)
+            else:
+                item = cv.create_image(0, 0, anchor="center", tags=tags)
+            cv.itemconfigure(item, state='hidden')
+            row.items[part] = item
+        self._rows.append(row)
+        return row
+
+    def release(self, row: CanvasRow):
+        """Delete a row's canvas items."""
+        if row in self._rows:
+            self._rows.remove(row)
+        if self._hover is row:
+            self._hover = None
+        self.canvas.widget.delete(row.tag)
+
+    # ---------- drawing ----------
+
+    def measure(self, record: dict) -> int:
+        """Return the natural height of a row showing `record`."""
+        lines = sum(self._line_heights[f] for f in ('title', 'text', 'caption') if record.get(f) is not None)
+        return max(lines, self._icon_size) + 2 * PAD_Y
+
+    def draw(self, row: CanvasRow):
+        """Lay out and color every item of `row` at its current position."""
+        cv = self.canvas.widget
+        items = row.items
+        preview = row.preview
+        data = preview if preview is not None else row.data
+        opts = self._options
+        palette = self._palette
+        top, bottom, right = row.top, row.top + row.height, self._width
+        mid = top + row.height / 2
+
+        selected = bool(data.get('selected'))
+        focused = bool(data.get('focused')) and opts.get('focus_state_enabled', True)
+        background = self._background(row, data, selected, focused)
+        foreground = palette['on'][background]
+
+        def show(part, visible=True, **kw):
+            cv.itemconfigure(items[part], state='normal' if visible else 'hidden', **kw)
+
+        cv.coords(items['bg'], 0, top, right, bottom)
+        show('bg', fill=background)
+        separated = opts.get('show_separators', False)
+        cv.coords(items['sep'], 0, bottom - 1, right, bottom - 1)
+        show('sep', separated, fill=palette['border'])
+        cv.coords(items['focus'], 1, top + 1, right - 1, bottom - 1)
+        show('focus', focused, outline=palette['focus'], width=2)
+
+        # leading controls
+        x = PAD_X
+        icon_half = self._icon_size / 2
+        mode = opts.get('selection_mode', 'none')
+        if mode != 'none' and opts.get('selection_controls_visible', False) and preview is None:
+            shape = 'square' if mode == 'multiple' else 'circle'
+            name = f"check-{shape}-fill" if selected else shape
+            cv.coords(items['select'], x + icon_half, mid)
+            show('select', image=self._icon(name, foreground))
+            x += self._icon_size + GAP
+        else:
+            show('select', False)
+
+        icon = data.get('icon')
+        if icon is not None:
+            name = icon.get('name') if isinstance(icon, dict) else icon
+            cv.coords(items['icon'], x + icon_half, mid)
+            show('icon', image=self._icon(name, foreground))
+            x += self._icon_size + GAP
+        else:
+            show('icon', False)
+
+        # text stack, centered vertically
+        fields = [f for f in ('title', 'text', 'caption') if data.get(f) is not None]
+        y = mid - sum(self._line_heights[f] for f in fields) / 2
+        for field in ('title', 'text', 'caption'):
+            value = data.get(field)
+            if value is None:
+                show(field, False)
+                continue
+            cv.coords(items[field], x, y)
+            fill = palette['caption'] if field == 'caption' and not selected else foreground
+            show(field, text=value, fill=fill, font=self._fonts[field])
+            y += self._line_heights[field]
+
+        # trailing controls, right to left
+        x = right - PAD_X
+        for part, enabled, name in (
+                ('chevron', opts.get('chevron_visible', False), 'chevron-right'),
+                ('drag', opts.get('dragging_enabled', False), 'grip-vertical'),
+                ('delete', opts.get('deleting_enabled', False), 'x-lg')):
+            if enabled and preview is None:
+                cv.coords(items[part], x - icon_half, mid)
+                show(part, image=self._icon(name, foreground))
+                x -= self._icon_size + GAP
+            else:
+                show(part, False)
+
+        badge = data.get('badge')
+        if badge is not None:
+            show('badge', text=badge, fill=palette['on'][palette['badge']], font=self._fonts['caption'], anchor="e")
+            cv.coords(items['badge'], x - 6, mid)
+            x1, y1, x2, y2 = cv.bbox(items['badge'])
+            cv.coords(items['badge-bg'], x1 - 6, y1 - 2, x2 + 6, y2 + 2)
+            show('badge-bg', fill=palette['badge'])
+        else:
+            show('badge', False)
+            show('badge-bg', False)
+
+    def redraw(self):
+        """Redraw every visible row."""
+        for row in self._rows:
+            if row.visible:
+                self.draw(row)
+
+    def _background(self, row: CanvasRow, data: dict, selected: bool, focused: bool) -> str:
+        palette = self._palette
+        hovered = row is self._hover
+        if selected:
+            return palette['selected_hover'] if hovered or focused else palette['selected']
+        if hovered or focused:
+            return palette['hover']
+        opts = self._options
+        if opts.get('row_alternation_enabled', False):
+            parity = 0 if opts.get('row_alternation_mode', 'even') == 'even' else 1
+            if data.get('item_index', 0) % 2 == parity:
+                return palette['alternate']
+        return palette['background']
+
+    def _icon(self, name: str, color: str):
+        key = (name, color)
+        image = self._icons.get(key)
+        if image is None:
+            image = self._icons[key] = BootstrapIcon(name, self._icon_size, color).image
+        return image
+
+    def _build_metrics(self):
+        self._fonts = dict(title='heading-lg', text='body', caption='caption')
+        self._line_heights = {f: nametofont(font).metrics('linespace') for f, font in self._fonts.items()}
+        # matches the icon size of list labels
+        self._icon_size = int(nametofont('body-lg').metrics('linespace') * 0.9)
+
+    def _build_palette(self):
+        b = self._builder
+        opts = self._options
+        background = b.color(self.canvas.surface_token or 'background')
+        selected = b.color(opts.get('selection_background') or 'primary', background)
+        focus = b.color(opts['focus_color']) if opts.get('focus_color') else b.elevate(selected, 5)
+        palette = dict(
+            background=background,
+            alternate=b.color(opts.get('row_alternation_color') or 'background-1'),
+            hover=b.elevate(background, 1),
+            selected=selected,
+            selected_hover=b.hover(selected),
+            border=b.border(background),
+            focus=focus,
+            badge=b.elevate(background, 2),
+            caption=b.color('secondary'),
+        )
+        palette['on'] = {c: b.on_color(c) for c in set(palette.values())}
+        self._palette = palette
+        self.canvas.widget.configure(background=background)
+
+    # ---------- hit-testing ----------
+
+    def row_at(self, y: int) -> Optional[CanvasRow]:
+        """Return the visible row under canvas coordinate `y`."""
+        for row in self._rows:
+            if row.visible and row.top <= y < row.top + row.height:
+                return row
+        return None
+
+    def _part_at(self, x: int, y: int) -> Optional[str]:
+        cv = self.canvas.widget
+        for item in reversed(cv.find_overlapping(x, y, x, y)):
+            for tag in cv.gettags(item):
+                if tag in ("select", "drag", "delete"):
+                    return tag
+        return None
+
+    # ---------- event handlers ----------
+
+    def _emit(self, event: Event, data: dict):
+        self.parent.emit(event, data, via="auto")
+
+    def _on_configure(self, event):
+        width = max(1, int(getattr(event, 'width', 0) or self.canvas.widget.winfo_width()))
+        if width != self._width:
+            self._width = width
+            self.redraw()
+
+    def _on_theme_changed(self, _):
+        self._icons.clear()
+        self._build_palette()
+        self.redraw()
+
+    def _set_hover(self, row: Optional[CanvasRow]):
+        previous, self._hover = self._hover, row
+        for r in (previous, row):
+            if r is not None and r.visible:
+                self.draw(r)
+
+    def _on_motion(self, event):
+        row = self.row_at(event.y)
+        if row is not self._hover:
+            self._set_hover(row)
+
+    def _on_press(self, event):
+        row = self.row_at(event.y)
+        if row is None or not row.data:
+            return
+        data = row.data
+        part = self._part_at(event.x, event.y)
+        if part == "delete":
+            self._emit(Event.ITEM_DELETING, data)
+            return
+        if part == "drag":
+            # capture the record now; auto-scroll may rebind the row mid-drag
+            self._pressed = dict(data=data, start_y=event.screen_y, dragging=False)
+            return
+        if self._ignore_selection_by_click and part != "select":
+            return
+
+        if self._options.get('focus_state_enabled', True):
+            self.canvas.widget.focus_set()
+            self._emit(Event.ITEM_FOCUSED, data)
+        self._emit(Event.ITEM_CLICK, data)
+        state = getattr(event, 'state', 0)
+        if isinstance(state, int) and state & SHIFT and self._options.get('selection_mode') == 'multiple':
+            self._emit(Event.ITEM_RANGE_SELECTING, data)
+        else:
+            self._select(data)
+
+    def _on_drag(self, event):
+        pressed = self._pressed
+        if pressed is None:
+            return
+        data = pressed['data']
+        index = data.get('item_index', 0)
+        if not pressed['dragging']:
+            pressed['dragging'] = True
+            self._emit(Event.ITEM_DRAG_START, {**data, 'source_index': index, 'y_start': pressed['start_y']})
+        self._emit(
+            Event.ITEM_DRAGGING, {
+                **data,
+                'source_index': index,
+                'y_current': event.screen_y,
+                'y_start': pressed['start_y'],
+                'delta_y': event.screen_y - pressed['start_y']
+            })
+
+    def _on_release(self, event):
+        pressed, self._pressed = self._pressed, None
+        if pressed is None or not pressed['dragging']:
+            return
+        data = pressed['data']
+        self._emit(
+            Event.ITEM_DRAG_END, {
+                **data,
+                'source_index': data.get('item_index', 0),
+                'y_end': event.screen_y,
+                'y_start': pressed['start_y']
+            })
+
+    def _on_space(self, _):
+        for row in self._rows:
+            if row.visible and row.data.get('focused'):
+                self._select(row.data)
+                return
+
+    def _select(self, data: dict):
+        """Emit SELECTING/DESELECTING the same way `ListItem.select` does."""
+        mode = self._options.get('selection_mode', 'none')
+        if mode == 'none':
+            return
+        if data.get('selected'):
+            if mode != 'single':
+                self._emit(Event.ITEM_DESELECTING, data)
+        else:
+            self._emit(Event.ITEM_SELECTING, data)
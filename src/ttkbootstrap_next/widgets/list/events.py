@@ -0,0 +1,117 @@
+from typing import Any, Callable, Literal, Optional, TYPE_CHECKING
+
+from ttkbootstrap_next.events import Event
+
+if TYPE_CHECKING:
+    from ttkbootstrap_next.widgets.list.list_item import ListItem
+
+# How a press on a registered widget is handled; `None` is a plain row click
+RowPart = Literal['ignore', 'drag', 'delete'] | None
+
+
+class RowEventDelegate:
+    """Handle the pointer, focus and key events of every pooled row with one set of bindings.
+
+    Each row widget and its composites carry the delegate's bindtag, so a list
+    installs one Tk binding per event sequence instead of one per widget. The
+    handlers resolve the event's widget to its row through a lookup table keyed by
+    Tk path name. Row events (ITEM_CLICK, ITEM_SELECTING, ...) are handed to the
+    list's stream listeners as Python objects, without `event_generate` or a JSON
+    payload round-trip.
+    """
+
+    def __init__(self, hub, keys: dict[Event, Callable[[Any], Any]]):
+        """
+        Args:
+            hub: The widget the row events are dispatched on; it also owns the bindings.
+            keys: Key event -> handler for the keys a focused row responds to.
+        """
+        self._hub = hub
+        self.tag = f'ListRows{id(self)}'
+        self._rows: dict[str, tuple['ListItem', RowPart]] = {}
+        handlers = {
+            Event.ENTER: self._on_enter,
+            Event.LEAVE: self._on_leave,
+            Event.FOCUS: self._on_focus_in,
+            Event.BLUR: self._on_focus_out,
+            Event.CLICK1_DOWN: self._on_press,
+            Event.DRAG1: self._on_drag,
+            Event.CLICK1_UP: self._on_release,
+            Event.KEYDOWN_SPACE: self._on_space,
+            **{event: self._key_handler(handler) for event, handler in keys.items()},
+        }
+        for event, handler in handlers.items():
+            hub._bind_class(self.tag, event, handler)
+
+    def register(self, widget, row: 'ListItem', part: RowPart = None):
+        """Route the events of `widget` to `row`; the bindtag goes right after the widget's own."""
+        tk_widget = widget.widget
+        self._rows[str(tk_widget)] = (row, part)
+        tags = tk_widget.bindtags()
+        if self.tag not in tags:
+            tk_widget.bindtags(tags[:1] + (self.tag,) + tags[1:])
+
+    def release(self, row: 'ListItem'):
+        """Forget every widget registered for `row`, e.g. before the row is destroyed."""
+        for name in [name for name, (owner, _) in self._rows.items() if owner is row]:
+            del self._rows[name]
+
+    def dispatch(self, event: Event, data: dict):
+        """Deliver a row event to the list's listeners; Tk bindings made outside `on()` see it too."""
+        self._hub.emit(event, data, via="auto")
+
+    # ---- handlers ----
+
+    def _lookup(self, event) -> tuple[Optional['ListItem'], RowPart]:
+        # the raw path name is enough; resolving `event.target` would cost a registry lookup
+        return self._rows.get(event.target_path, (None, None))
+
+    def _on_enter(self, event):
+        row, _ = self._lookup(event)
+        return row._on_enter(event) if row is not None else None
+
+    def _on_leave(self, event):
+        row, _ = self._lookup(event)
+        return row._on_leave(event) if row is not None else None
+
+    def _on_focus_in(self, event):
+        row, _ = self._lookup(event)
+        return row._on_focus_in(event) if row is not None else None
+
+    def _on_focus_out(self, event):
+        row, _ = self._lookup(event)
+        return row._on_focus_out(event) if row is not None else None
+
+    def _on_press(self, event):
+        row, part = self._lookup(event)
+        if row is None or part == 'ignore':
+            return None
+        if part == 'delete':
+            return row.delete()
+        if part == 'drag':
+            return row._on_drag_mouse_down(event)
+        return row._on_mouse_down(event)
+
+    def _on_drag(self, event):
+        row, part = self._lookup(event)
+        if row is not None and part == 'drag':
+            row._on_drag_mouse_motion(event)
+
+    def _on_release(self, event):
+        row, part = self._lookup(event)
+        if row is None or part in ('ignore', 'delete'):
+            return None
+        if part == 'drag':
+            return row._on_drag_mouse_up(event)
+        return row._on_mouse_up(event)
+
+    def _on_space(self, event):
+        row, _ = self._lookup(event)
+        return row._on_mouse_down(event) if row is not None else None
+
+    def _key_handler(self, handler: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        def on_key(event):
+            row, _ = self._lookup(event)
+            return handler(event) if row is not None else None
+
+        return on_key
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+
+class HeightIndex:
+    """
+    Row heights for a virtual list, indexed by a Fenwick tree of prefix sums.
+
+    Rows start at an estimated height and are replaced by measured heights as
+    they are rendered. Offset-to-index and index-to-offset lookups are O(log n).
+    Until a row is measured it follows the running average of measured rows.
+    """
+
+    def __init__(self, count: int = 0, estimate: int = 32):
+        self._estimate = max(1, int(estimate))
+        self._measured_total = 0
+        self._measured_count = 0
+        self._heights: list[int] = []
+        self._measured = bytearray()
+        self._tree: list[int] = [0]
+        self.reset(count)
+
+    # ---------- properties ----------
+
+    @property
+    def count(self) -> int:
+        """Number of rows in the index."""
+        return len(self._heights)
+
+    @property
+    def estimate(self) -> int:
+        """Height used for rows that have not been measured yet."""
+        return self._estimate
+
+    def total(self) -> int:
+        """Total height of all rows."""
+        return self.offset_of(self.count)
+
+    def get(self, index: int) -> int:
+        """Return the height of a single row."""
+        return self._heights[index]
+
+    def is_measured(self, index: int) -> bool:
+        return bool(self._measured[index])
+
+    # ---------- mutation ----------
+
+    def reset(self, count: int):
+        """Resize to `count` rows, discarding measurements."""
+        self._heights = [self._estimate] * max(0, count)
+        self._measured = bytearray(len(self._heights))
+        self._measured_total = self._measured_count = 0
+        self._rebuild()
+
+    def resize(self, count: int):
+        """Grow or shrink to `count` rows, keeping the heights of the rows that remain.
+
+        Rows are appended at the current estimate. Both directions cost
+        O(k log n) for k added or removed rows instead of a full rebuild.
+        """
+        count = max(0, count)
+        n = self.count
+        if count < n:
+            measured = self._measured
+            for i in range(count, n):
+                if measured[i]:
+                    self._measured_count -= 1
+                    self._measured_total -= self._heights[i]
+            # a tree node only covers rows at or before its own index, so truncation is exact
+            del self._heights[count:], self._measured[count:], self._tree[count + 1:]
+        elif count > n:
+            tree = self._tree
+            for i in range(n + 1, count + 1):
+                # node i covers rows (i - lowbit(i), i]
+                tree.append(self._estimate + self.offset_of(i - 1) - self.offset_of(i - (i & -i)))
+                self._heights.append(self._estimate)
+            self._measured.extend(bytes(count - n))
+
+    def move(self, source: int, target: int):
+        """Move the height of row `source` to `target`, shifting the rows in between."""
+        if source == target or not (0 <= source < self.count and 0 <= target < self.count):
+            return
+        lo, hi = min(source, target), max(source, target)
+        heights, measured = self._heights, self._measured
+        span, flags = heights[lo:hi + 1], measured[lo:hi + 1]
+        if source < target:
+            span.append(span.pop(0))
+            flags.append(flags.pop(0))
+        else:
+            span.insert(0, span.pop())
+            flags.insert(0, flags.pop())
+        for i, height in enumerate(span, start=lo):
+            delta = height - heights[i]
+            if delta:
+                heights[i] = height
+                self._add(i, delta)
+        measured[lo:hi + 1] = flags
+
+    def set(self, index: int, height: int) -> bool:
+        """
+        Record the measured height of a row.
+
+        Returns:
+            True if the row height changed.
+        """
+        height = max(1, int(height))
+        if not self._measured[index]:
+            self._measured[index] = 1
+            self._measured_count += 1
+            self._measured_total += height
+            if self._measured_count == 1 or self._measured_count & (self._measured_count - 1) == 0:
+                # refresh the estimate at powers of two so the rebuild cost stays amortized
+                self._apply_estimate(round(self._measured_total / self._measured_count))
+        else:
+            self._measured_total += height - self._heights[index]
+
+        delta = height - self._heights[index]
+        if not delta:
+            return False
+        self._heights[index] = height
+        self._add(index, delta)
+        return True
+
+    # ---------- lookup ----------
+
+    def offset_of(self, index: int) -> int:
+        """Return the pixel offset of the top of row `index`."""
+        i = max(0, min(index, self.count))
+        total = 0
+        tree = self._tree
+        while i > 0:
+            total += tree[i]
+            i &= i - 1
+        return total
+
+    def index_at(self, offset: int) -> tuple[int, int]:
+        """
+        Return the row containing pixel `offset`.
+
+        Returns:
+            A tuple of (row index, pixels from the top of that row).
+        """
+        n = self.count
+        if n == 0 or offset <= 0:
+            return 0, 0
+        pos, remaining = 0, offset
+        tree = self._tree
+        step = 1 << n.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= n and tree[nxt] <= remaining:
+                pos = nxt
+                remaining -= tree[nxt]
+            step >>= 1
+        if pos >= n:
+            return n - 1, self._heights[n - 1]
+        return pos, remaining
+
+    # ---------- internal ----------
+
+    def _add(self, index: int, delta: int):
+        i = index + 1
+        tree = self._tree
+        n = len(tree)
+        while i < n:
+            tree[i] += delta
+            i += i & -i
+
+    def _apply_estimate(self, estimate: int):
+        estimate = max(1, estimate)
+        if estimate == self._estimate:
+            return
+        self._estimate = estimate
+        measured = self._measured
+        self._heights = [h if measured[i] else estimate for i, h in enumerate(self._heights)]
+        self._rebuild()
+
+    def _rebuild(self):
+        """Build the tree in O(n) from `_heights`."""
+        n = len(self._heights)
+        tree = [0] + self._heights
+        for i in range(1, n + 1):
+            j = i + (i & -i)
+            if j <= n:
+                tree[j] += tree[i]
+        self._tree = tree
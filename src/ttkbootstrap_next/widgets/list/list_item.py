@@ -1,14 +1,34 @@
-from typing import Optional, TYPE_CHECKING, Unpack
+from typing import Any, Optional, TYPE_CHECKING, Unpack
 
 from ttkbootstrap_next.events import Event
+from ttkbootstrap_next.interop.runtime.key_resolver import SHIFT
 from ttkbootstrap_next.layouts import Pack
 from ttkbootstrap_next.widgets.badge import Badge
 from ttkbootstrap_next.widgets.label import Label
 from ttkbootstrap_next.widgets.list.types import ListItemOptions
-from ttkbootstrap_next.widgets.separator import Separator
 
 if TYPE_CHECKING:
     from ttkbootstrap_next.widgets.button import Button
+    from ttkbootstrap_next.widgets.list.events import RowEventDelegate
+
+# Parts of the start, center and end frames in packing order. A part shown again after
+# being hidden is packed ahead of the next packed part, so the row layout stays stable.
+PART_ORDER = (
+    ('_selection_widget', '_icon_widget'),
+    ('_title_widget', '_text_widget', '_caption_widget'),
+    ('_badge_widget', '_chevron_widget', '_drag_widget', '_delete_widget'),
+)
+PART_LAYOUT = dict(
+    _selection_widget=dict(side='left', padx=5),
+    _icon_widget=dict(side='left', padx=6),
+    _title_widget=dict(fill='x', padx=(0, 3)),
+    _text_widget=dict(fill='x', padx=(0, 3)),
+    _caption_widget=dict(fill='x', padx=(0, 3)),
+    _badge_widget=dict(side='right', padx=6),
+    _chevron_widget=dict(side='right', padx=6),
+    _drag_widget=dict(side='right', padx=6),
+    _delete_widget=dict(side='right', padx=6),
+)
 
 
 class ListItem(Pack):
@@ -17,7 +37,16 @@ class ListItem(Pack):
 
         # properties
         self._data = {}
+        self._preview = False  # the row shows only a preview of `_data`
+        self._state = {}  # snapshot of the values last applied to the row's widgets
+        self._visual_state: set[str] = set()  # ttk state flags currently set on the row and its composites
+        self._surface_styles: dict = {}  # widget -> {surface token: ttk style name}, built on first use
         self._item_index = 0
+        # when the owning list batches deferred work, it calls `flush_deferred` itself
+        self._defer_updates = kwargs.pop('defer_updates', False)
+        self._deferred_job = None
+        # a list that delegates row events routes them itself; see `RowEventDelegate`
+        self._delegate: Optional[RowEventDelegate] = kwargs.pop('event_delegate', None)
         self._focus_state_enabled = kwargs.pop('focus_state_enabled', True)
         self._focus_color = kwargs.pop('focus_color', None)
         self._show_separator = kwargs.pop('show_separators', False)
@@ -44,30 +73,18 @@ class ListItem(Pack):
             builder=dict(select_background=self._selection_background, focus_color=self._focus_color),
             parent=kwargs.pop('parent', None))
 
-        # composite widgets (guaranteed to exist upon init)
-        self._frame_start = Pack(
-            direction="horizontal",
-            parent=self,
-            variant='list',
-            take_focus=False,
-            builder=dict(select_background=self._selection_background)
-        ).attach()
-
+        # composite widgets; only the center frame is built upfront, the start and end
+        # frames and every part are built when the first bound record needs them
         self._frame_center = Pack(
             parent=self,
             variant='list',
             take_focus=False,
             builder=dict(select_background=self._selection_background)
         ).attach(fill='x', expand=True)
+        self._frame_start: Optional[Pack] = None
+        self._frame_end: Optional[Pack] = None
 
-        self._frame_end = Pack(
-            parent=self,
-            variant='list',
-            take_focus=False,
-            builder=dict(select_background=self._selection_background)
-        ).attach()
-
-        self._separator = Separator(parent=self)
+        self._hidden_parts: set[str] = set()  # built parts that are currently unpacked
         self._selection_widget: Optional[Label] = None
         self._icon_widget: Optional[Label] = None
         self._title_widget: Optional[Label] = None
@@ -79,15 +96,17 @@ class ListItem(Pack):
         self._drag_widget: Optional[Button] = None
 
         self._composite_widgets = set()
-        for widget in [self, self._frame_start, self._frame_end, self._frame_center]:
+        for widget in [self, self._frame_center]:
             self._add_composite_widget(widget, ignore_click=self._ignore_selection_by_click)
 
         # row-level pointer events
-        self.on(Event.ENTER).listen(self._on_enter)
-        self.on(Event.LEAVE).listen(self._on_leave)
-        self.on(Event.FOCUS).listen(self._on_focus_in)
-        self.on(Event.BLUR).listen(self._on_focus_out)
-        self.on(Event.KEYDOWN_SPACE).listen(self._on_mouse_down)
+        if self._delegate is None:
+            self.on(Event.ENTER).listen(self._on_enter)
+            self.on(Event.LEAVE).listen(self._on_leave)
+            self.on(Event.FOCUS).listen(self._on_focus_in)
+            self.on(Event.BLUR).listen(self._on_focus_out)
+            self.on(Event.KEYDOWN_SPACE).listen(self._on_mouse_down)
+        self.on(Event.THEME_CHANGED).listen(self._on_theme_changed)
 
     @property
     def selected(self):
@@ -104,16 +123,8 @@ class ListItem(Pack):
     # ---- event handlers ----
 
     def _on_enter(self, _):
-        # also mark the row container for consistency
-        try:
-            self.state(['hover'])
-        except Exception:
-            pass
-        for widget in self._composite_widgets:
-            try:
-                widget.state(['hover'])
-            except Exception:
-                pass
+        # entering a child of an already hovered row is a no-op
+        self._set_visual_state(hover=True)
 
     def _on_leave(self, event):
         # robust containment check: if moving to a descendant, ignore leave
@@ -124,73 +135,69 @@ class ListItem(Pack):
         except Exception:
             pass
 
-        try:
-            self.state(['!hover'])
-        except Exception:
-            pass
-        for widget in self._composite_widgets:
-            try:
-                widget.state(['!hover'])
-            except Exception:
-                pass
+        self._set_visual_state(hover=False)
         return None
 
-    def _on_mouse_down(self, _):
+    def _on_mouse_down(self, event):
         if self._focus_state_enabled:
             self.focus()
         # Let the list handle selection via emitted event
-        self.parent.emit(Event.ITEM_CLICK, data=self._data)
-        self.select()
-        for widget in self._composite_widgets:
-            try:
-                widget.state(['pressed'])
-            except Exception:
-                pass
+        self._emit(Event.ITEM_CLICK, self._data)
+        state = getattr(event, 'state', 0)
+        if isinstance(state, int) and state & SHIFT and self.selection_mode() == 'multiple':
+            # shift-click: the list selects from its anchor to this row
+            self._emit(Event.ITEM_RANGE_SELECTING, self._data)
+        else:
+            self.select()
+        self._set_visual_state(pressed=True)
+
+    def _emit(self, event: Event, data: dict[str, Any]):
+        """Notify the owning list of a row event."""
+        if self._delegate is not None:
+            self._delegate.dispatch(event, data)
+        else:
+            self.parent.emit(event, data=data)
 
     def _on_mouse_up(self, _event):
-        for widget in self._composite_widgets:
-            try:
-                widget.state(['!pressed'])
-            except Exception:
-                pass
+        self._set_visual_state(pressed=False)
 
     def _set_focus_state(self, focused: bool):
-        # Helper to apply a guaranteed transition to row + composites
-        targets = [self, *list(self._composite_widgets)]
-
-        for w in targets:
-            try:
-                # Force a real transition so ttk recomputes maps:
-                # clear then set, even if we "think" it's already that value.
-                w.state(['!focus'])
-                if focused:
-                    w.state(['focus'])
-            except Exception:
-                pass
-
-            # Optional nudge: re-assign current style to force re-resolve.
-            # (Useful if your style element caches and didn't invalidate.)
+        self._set_visual_state(focus=focused)
+
+    def _set_visual_state(self, **flags: bool) -> bool:
+        """Move the row and its composites to a new combination of ttk state flags.
+
+        Each flag (hover, pressed, selected, focus) is compared with the row's
+        current state and only the flags that changed are applied, in one
+        `state` call per widget. The ttk maps built by the list style builders
+        already hold a color for every state combination, so nothing is restyled.
+
+        Returns:
+            True if any flag changed.
+        """
+        current = self._visual_state
+        changes = []
+        for name, on in flags.items():
+            if (name in current) != on:
+                changes.append(name if on else f'!{name}')
+                if on:
+                    current.add(name)
+                else:
+                    current.discard(name)
+        if not changes:
+            return False
+        for widget in self._composite_widgets:
             try:
-                style = w.cget('style')
-                if style:
-                    w.configure(style=style)
+                widget.state(changes)
             except Exception:
                 pass
-
-        # If you also key off 'active' as a hover surrogate, make sure we don't
-        # leave it set accidentally (focus visuals often compete with active).
-        if focused:
-            for w in targets:
-                try:
-                    w.state(['!active'])
-                except Exception:
-                    pass
+        return True
 
     def _on_focus_in(self, event):
         if not self._focus_state_enabled: return
         self._set_focus_state(True)
         # Emit event to notify parent list that this record is focused
-        self.parent.emit(Event.ITEM_FOCUSED, data=self._data)
+        self._emit(Event.ITEM_FOCUSED, self._data)
 
     def _on_focus_out(self, event):
         if not self._focus_state_enabled:
@@ -211,6 +218,11 @@ class ListItem(Pack):
     def data(self):
         return self._data
 
+    @property
+    def previewing(self) -> bool:
+        """True while the row shows a preview instead of its fully bound record."""
+        return self._preview
+
     def selection_mode(self, value=None):
         if value is None:
             return self._selection_mode
@@ -232,19 +244,10 @@ class ListItem(Pack):
             if value != self._selection_controls_visible:
                 self._selection_controls_visible = value
                 if value:
-                    if self._selection_widget is None:
-                        self._selection_widget = Label(
-                            parent=self._frame_start,
-                            icon=self._selection_icon,
-                            variant='list',
-                            take_focus=False,
-                            builder=dict(select_background=self._selection_background),
-                        )
-                        self._add_composite_widget(self._selection_widget)
-                    self._selection_widget.attach(side="left", padx=5)
+                    self._ensure_selection_widget()
+                    self._pack_part('_selection_widget')
                 else:
-                    if self._selection_widget is not None:
-                        self._selection_widget.detach()
+                    self._hide_part('_selection_widget')
             return self
 
     def selection_background(self, value=None):
@@ -288,264 +291,259 @@ class ListItem(Pack):
             # In single selection mode, don't allow deselecting the selected item
             if mode == 'single':
                 return None
-            self.parent.emit(Event.ITEM_DESELECTING, data=self.data)
+            self._emit(Event.ITEM_DESELECTING, self.data)
             return False
         else:
-            self.parent.emit(Event.ITEM_SELECTING, data=self.data)
+            self._emit(Event.ITEM_SELECTING, self.data)
             return True
 
+    def _ensure_selection_widget(self):
+        if self._selection_widget is None:
+            self._new_part('_selection_widget', Label(
+                parent=self._frame('_frame_start'),
+                icon=self._selection_icon,
+                variant='list',
+                take_focus=False,
+                builder=dict(select_background=self._selection_background),
+            ))
+
     def delete(self):
         """Unpack this widget and notify subscribers to handle delete action."""
-        self.parent.emit(Event.ITEM_DELETING, data=self.data)
+        self._emit(Event.ITEM_DELETING, self.data)
 
     def _update_selection(self, selected: bool = False):
         """Apply selection state atomically (styles + icon) with null guards."""
         mode = self.selection_mode()
 
         if mode == "none":
-            # selection disabled: tear down and clear states
-            if self._selection_widget is not None:
-                try:
-                    self._selection_widget.detach()
-                except Exception:
-                    pass
-                self._composite_widgets.discard(self._selection_widget)
-                try:
-                    self._selection_widget.destroy()
-                except Exception:
-                    pass
-                self._selection_widget = None
-            # clear selected state on row + composites
-            try:
-                self.state(['!selected'])
-            except Exception:
-                pass
-            for w in list(self._composite_widgets):
-                try:
-                    w.state(['!selected'])
-                    w.emit(Event.COMPOSITE_DESELECT)
-                except Exception:
-                    pass
+            # selection disabled: hide the control and clear states
+            self._hide_part('_selection_widget')
+            if self._set_visual_state(selected=False):
+                self._emit_composite(Event.COMPOSITE_DESELECT)
             # keep a remembered icon so later comparisons are cheap and safe
-            if hasattr(self, '_state'):
-                self._state['__sel_icon'] = None
-                self._state['selected'] = False
+            self._state['__sel_icon'] = None
+            self._state['selected'] = False
             return
 
-        # Ensure state cache exists
-        if not hasattr(self, '_state'):
-            self._state = {}
-
         # Ensure the selection control exists (even if not visible)
-        if self._selection_widget is None:
-            self._selection_widget = Label(
-                parent=self._frame_start,
-                icon=self._selection_icon,
-                variant='list',
-                take_focus=False,
-                builder=dict(select_background=self._selection_background),
-            )
-            if self._selection_controls_visible:
-                self._selection_widget.attach(side="left", padx=5)
-            self._add_composite_widget(self._selection_widget)
+        self._ensure_selection_widget()
+        if self._selection_controls_visible:
+            self._pack_part('_selection_widget')
 
         # Apply selected state to the row + all composites (styles co-update)
-        try:
-            self.state(['selected' if selected else '!selected'])
-        except Exception:
-            pass
-        for w in list(self._composite_widgets):
-            try:
-                w.state(['selected' if selected else '!selected'])
-            except Exception:
-                pass
+        if self._set_visual_state(selected=selected):
+            self._emit_composite(Event.COMPOSITE_SELECT if selected else Event.COMPOSITE_DESELECT)
+
+        # Remember logical selected flag
+        self._state['selected'] = bool(selected)
+
+    def _emit_composite(self, event: Event):
         for w in list(self._composite_widgets):
             try:
-                w.emit(Event.COMPOSITE_SELECT if selected else Event.COMPOSITE_DESELECT)
+                w.emit(event)
             except Exception:
                 pass
 
-        # Remember logical selected flag
-        self._state['selected'] = bool(selected)
-
     def _update_icon(self, icon=None):
-        if icon is not None:
-            if not self._icon_widget:
-                self._icon_widget = Label(
-                    parent=self._frame_start,
-                    icon=icon,
-                    variant='list',
-                    take_focus=False,
-                    builder=dict(select_background=self._selection_background)
-                ).attach(side='left', padx=6)
-                self._add_composite_widget(self._icon_widget, ignore_click=self._ignore_selection_by_click)
-            else:
-                self._icon_widget.configure(icon=icon)
+        if icon is None:
+            self._hide_part('_icon_widget')
+            return
+        if self._icon_widget is None:
+            self._new_part('_icon_widget', Label(
+                parent=self._frame('_frame_start'),
+                icon=icon,
+                variant='list',
+                take_focus=False,
+                builder=dict(select_background=self._selection_background)
+            ), ignore_click=self._ignore_selection_by_click)
         else:
-            if self._icon_widget:
-                self._icon_widget.detach()
-                self._composite_widgets.discard(self._icon_widget)
-                self._icon_widget.destroy()
-                self._icon_widget = None
-        pass
+            self._icon_widget.configure(icon=icon)
+        self._pack_part('_icon_widget')
 
     def _update_title(self, text=None):
-        if text is not None:
-            if not self._title_widget:
-                self._title_widget = Label(
-                    text=text,
-                    parent=self._frame_center,
-                    font='heading-lg',
-                    variant='list',
-                    take_focus=False,
-                    builder=dict(select_background=self._selection_background)
-                ).attach(fill='x', padx=(0, 3))
-                self._add_composite_widget(self._title_widget, ignore_click=self._ignore_selection_by_click)
-            else:
-                self._title_widget.configure(text=text)
+        if text is None:
+            self._hide_part('_title_widget')
+            return
+        if self._title_widget is None:
+            self._new_part('_title_widget', Label(
+                text=text,
+                parent=self._frame_center,
+                font='heading-lg',
+                variant='list',
+                take_focus=False,
+                builder=dict(select_background=self._selection_background)
+            ), ignore_click=self._ignore_selection_by_click)
         else:
-            if self._title_widget:
-                self._title_widget.detach()
-                self._composite_widgets.discard(self._title_widget)
-                self._title_widget.destroy()
-                self._title_widget = None
+            self._title_widget.configure(text=text)
+        self._pack_part('_title_widget')
 
     def _update_text(self, text=None):
-        if text is not None:
-            if not self._text_widget:
-                self._text_widget = Label(
-                    parent=self._frame_center,
-                    text=text,
-                    variant='list',
-                    take_focus=False,
-                    builder=dict(select_background=self._selection_background)
-                ).attach(fill='x', padx=(0, 3))
-                self._add_composite_widget(self._text_widget, ignore_click=self._ignore_selection_by_click)
-            else:
-                self._text_widget.configure(text=text)
+        if text is None:
+            self._hide_part('_text_widget')
+            return
+        if self._text_widget is None:
+            self._new_part('_text_widget', Label(
+                parent=self._frame_center,
+                text=text,
+                variant='list',
+                take_focus=False,
+                builder=dict(select_background=self._selection_background)
+            ), ignore_click=self._ignore_selection_by_click)
         else:
-            if self._text_widget:
-                self._text_widget.detach()
-                self._composite_widgets.discard(self._text_widget)
-                self._text_widget.destroy()
-                self._text_widget = None
+            self._text_widget.configure(text=text)
+        self._pack_part('_text_widget')
 
     def _update_caption(self, text=None):
-        if text is not None:
-            if not self._caption_widget:
-                self._caption_widget = Label(
-                    parent=self._frame_center,
-                    text=text,
-                    font='caption',
-                    anchor='w',
-                    foreground='secondary',
-                    variant='list',
-                    take_focus=False,
-                    builder=dict(select_background=self._selection_background)
-                ).attach(fill='x', padx=(0, 3))
-                self._add_composite_widget(self._caption_widget, ignore_click=self._ignore_selection_by_click)
-            else:
-                self._caption_widget.configure(text=text)
+        if text is None:
+            self._hide_part('_caption_widget')
+            return
+        if self._caption_widget is None:
+            self._new_part('_caption_widget', Label(
+                parent=self._frame_center,
+                text=text,
+                font='caption',
+                anchor='w',
+                foreground='secondary',
+                variant='list',
+                take_focus=False,
+                builder=dict(select_background=self._selection_background)
+            ), ignore_click=self._ignore_selection_by_click)
         else:
-            if self._caption_widget:
-                self._caption_widget.detach()
-                self._composite_widgets.discard(self._caption_widget)
-                self._caption_widget.destroy()
-                self._caption_widget = None
+            self._caption_widget.configure(text=text)
+        self._pack_part('_caption_widget')
 
     def _update_badge(self, text=None):
-        if text is not None:
-            if not self._badge_widget:
-                self._badge_widget = Badge(
-                    parent=self._frame_end,
-                    text=text,
-                    variant='list',
-                    builder=dict(select_background=self._selection_background)
-                ).attach(side='right', padx=6)
-                self._add_composite_widget(self._badge_widget, ignore_click=self._ignore_selection_by_click)
-            else:
-                self._badge_widget.configure(text=text)
+        if text is None:
+            self._hide_part('_badge_widget')
+            return
+        if self._badge_widget is None:
+            self._new_part('_badge_widget', Badge(
+                parent=self._frame('_frame_end'),
+                text=text,
+                variant='list',
+                builder=dict(select_background=self._selection_background)
+            ), ignore_click=self._ignore_selection_by_click)
         else:
-            if self._badge_widget:
-                self._badge_widget.detach()
-                self._composite_widgets.discard(self._badge_widget)
-                self._badge_widget.destroy()
-                self._badge_widget = None
+            self._badge_widget.configure(text=text)
+        self._pack_part('_badge_widget')
 
     def _update_chevron(self):
-        if self._chevron_visible:
-            if not self._chevron_widget:
-                from ttkbootstrap_next.widgets.button import Button
-                self._chevron_widget = Button(
-                    parent=self._frame_end,
-                    icon='chevron-right',
-                    variant='list',
-                    take_focus=False,
-                    builder=dict(select_background=self._selection_background)
-                ).attach(side='right', padx=6)
-                self._add_composite_widget(self._chevron_widget, ignore_click=self._ignore_selection_by_click)
-        else:
-            if self._chevron_widget:
-                self._chevron_widget.detach()
-                self._composite_widgets.discard(self._chevron_widget)
-                self._chevron_widget.destroy()
-                self._chevron_widget = None
+        if not self._chevron_visible:
+            self._hide_part('_chevron_widget')
+            return
+        if self._chevron_widget is None:
+            from ttkbootstrap_next.widgets.button import Button
+            self._new_part('_chevron_widget', Button(
+                parent=self._frame('_frame_end'),
+                icon='chevron-right',
+                variant='list',
+                take_focus=False,
+                builder=dict(select_background=self._selection_background)
+            ), ignore_click=self._ignore_selection_by_click)
+        self._pack_part('_chevron_widget')
 
     def _update_delete(self):
-        if self._deleting_enabled:
-            if not self._delete_widget:
-                from ttkbootstrap_next.widgets.button import Button
-                self._delete_widget = Button(
-                    parent=self._frame_end,
-                    icon='x-lg',
-                    variant='list',
-                    take_focus=False,
-                    builder=dict(select_background=self._selection_background)
-                ).attach(side='right', padx=6)
+        if not self._deleting_enabled:
+            self._hide_part('_delete_widget')
+            return
+        if self._delete_widget is None:
+            from ttkbootstrap_next.widgets.button import Button
+            self._new_part('_delete_widget', Button(
+                parent=self._frame('_frame_end'),
+                icon='x-lg',
+                variant='list',
+                take_focus=False,
+                builder=dict(select_background=self._selection_background)
+            ), ignore_click=True)
+            if self._delegate is not None:
+                self._delegate.register(self._delete_widget, self, 'delete')
+            else:
                 self._delete_widget.on(Event.CLICK1_DOWN).listen(lambda _: self.delete())
-                self._add_composite_widget(self._delete_widget, ignore_click=True)
-        else:
-            if self._delete_widget:
-                self._delete_widget.detach()
-                self._composite_widgets.discard(self._delete_widget)
-                self._delete_widget.destroy()
-                self._delete_widget = None
+        self._pack_part('_delete_widget')
 
     def _update_drag(self):
-        if self._dragging_enabled:
-            if not self._drag_widget:
-                from ttkbootstrap_next.widgets.button import Button
-                self._drag_widget = Button(
-                    parent=self._frame_end,
-                    icon='grip-vertical',
-                    variant='list',
-                    cursor='fleur',
-                    take_focus=False,
-                    builder=dict(select_background=self._selection_background)
-                ).attach(side='right', padx=6)
+        if not self._dragging_enabled:
+            self._hide_part('_drag_widget')
+            return
+        if self._drag_widget is None:
+            from ttkbootstrap_next.widgets.button import Button
+            self._new_part('_drag_widget', Button(
+                parent=self._frame('_frame_end'),
+                icon='grip-vertical',
+                variant='list',
+                cursor='fleur',
+                take_focus=False,
+                builder=dict(select_background=self._selection_background)
+            ), ignore_click=True)
 
+            if self._delegate is not None:
+                self._delegate.register(self._drag_widget, self, 'drag')
+            else:
                 # Setup drag detection using direct tkinter bindings
                 # NOTE: Using direct bindings because button has take_focus=False which may
                 # prevent the event system from working correctly in this context
-                self._drag_state = {'dragging': False, 'start_y': None}
                 self._drag_widget.widget.bind('<ButtonPress-1>', self._on_drag_mouse_down, add='+')
                 self._drag_widget.widget.bind('<B1-Motion>', self._on_drag_mouse_motion, add='+')
                 self._drag_widget.widget.bind('<ButtonRelease-1>', self._on_drag_mouse_up, add='+')
-
-                self._add_composite_widget(self._drag_widget, ignore_click=True)
-        else:
-            if self._drag_widget:
-                self._drag_widget.detach()
-                self._composite_widgets.discard(self._drag_widget)
-                self._drag_widget.destroy()
-                self._drag_widget = None
-                self._drag_state = None
+            self._drag_state = {'dragging': False, 'start_y': None}
+        self._pack_part('_drag_widget')
+
+    # ---- lazily built parts ----
+
+    def _frame(self, name: str) -> Pack:
+        """Return the start or end frame, creating it the first time a part needs it."""
+        frame = getattr(self, name)
+        if frame is None:
+            frame = Pack(
+                direction="horizontal" if name == '_frame_start' else "vertical",
+                parent=self,
+                variant='list',
+                take_focus=False,
+                builder=dict(select_background=self._selection_background)
+            )
+            if name == '_frame_start':
+                frame.attach(before=self._frame_center.widget)
+            else:
+                frame.attach()
+            setattr(self, name, frame)
+            self._add_composite_widget(frame, ignore_click=self._ignore_selection_by_click)
+            if self._state.get('surface') is not None:
+                self._apply_surface_style(frame, self._state['surface'])
+        return frame
+
+    def _new_part(self, name: str, widget, *, ignore_click: bool = False):
+        """Register a newly built part; it stays unpacked until `_pack_part`."""
+        setattr(self, name, widget)
+        self._hidden_parts.add(name)
+        self._add_composite_widget(widget, ignore_click=ignore_click)
+        if self._state.get('surface') is not None:
+            self._apply_surface_style(widget, self._state['surface'])
+
+    def _pack_part(self, name: str):
+        """Pack a hidden part in its slot, ahead of the next packed part of the same frame."""
+        if name not in self._hidden_parts:
+            return
+        order = next(parts for parts in PART_ORDER if name in parts)
+        options = dict(PART_LAYOUT[name])
+        for later in order[order.index(name) + 1:]:
+            if getattr(self, later) is not None and later not in self._hidden_parts:
+                options['before'] = getattr(self, later).widget
+                break
+        getattr(self, name).attach(**options)
+        self._hidden_parts.discard(name)
+
+    def _hide_part(self, name: str):
+        """Unpack a part but keep it for the next record that needs it."""
+        widget = getattr(self, name)
+        if widget is not None and name not in self._hidden_parts:
+            widget.hide()
+            self._hidden_parts.add(name)
 
     def _on_drag_mouse_down(self, event):
         """Mouse pressed on drag handle - prepare for drag."""
         if not hasattr(self, '_drag_state'):
             self._drag_state = {}
-        self._drag_state['start_y'] = event.y_root
+        self._drag_state['start_y'] = _screen_y(event)
         self._drag_state['dragging'] = False  # Not dragging yet, wait for motion
 
     def _on_drag_mouse_motion(self, event):
@@ -556,21 +554,21 @@ class ListItem(Pack):
         # If this is the first motion event, emit drag start
         if not self._drag_state.get('dragging'):
             self._drag_state['dragging'] = True
-            self.parent.emit(
-                Event.ITEM_DRAG_START, data={
+            self._emit(
+                Event.ITEM_DRAG_START, {
                     **self._data,
                     'source_index': self._item_index,
                     'y_start': self._drag_state['start_y']
                 })
 
         # Emit drag motion event
-        self.parent.emit(
-            Event.ITEM_DRAGGING, data={
+        self._emit(
+            Event.ITEM_DRAGGING, {
                 **self._data,
                 'source_index': self._item_index,
-                'y_current': event.y_root,
+                'y_current': _screen_y(event),
                 'y_start': self._drag_state['start_y'],
-                'delta_y': event.y_root - self._drag_state['start_y']
+                'delta_y': _screen_y(event) - self._drag_state['start_y']
             })
 
     def _on_drag_mouse_up(self, event):
@@ -580,28 +578,56 @@ class ListItem(Pack):
 
         # Only emit drag end if we actually started dragging
         if self._drag_state.get('dragging'):
-            self.parent.emit(
-                Event.ITEM_DRAG_END, data={
+            self._emit(
+                Event.ITEM_DRAG_END, {
                     **self._data,
                     'source_index': self._item_index,
-                    'y_end': event.y_root,
+                    'y_end': _screen_y(event),
                     'y_start': self._drag_state.get('start_y')
                 })
 
         # Reset drag state
         self._drag_state = {'dragging': False, 'start_y': None}
 
+    def update_preview(self, record: dict):
+        """Show only the record's title (or text) on the existing label; `update_data` restores the full row."""
+        title_shown = self._title_widget is not None and '_title_widget' not in self._hidden_parts
+        widget, field = (self._title_widget, 'title') if title_shown else (self._text_widget, 'text')
+        value = record.get('title', record.get('text'))
+        if widget is None or value is None:
+            return
+        widget.configure(text=value)
+        # keep the record so input on the row still targets it; the flag and the
+        # dropped snapshot entry make the next update_data redraw the row
+        self._data = record
+        self._preview = True
+        self._state.pop(field, None)
+
+    @property
+    def deferred_pending(self) -> bool:
+        """True if work deferred by `update_data` is waiting for `flush_deferred`."""
+        return self._state.get('controls') != self._controls()
+
     def update_data(self, record: dict | None):
-        """Efficiently update row visuals only when values have changed."""
+        """Update the row visuals, touching only the fields that changed since the last update.
+
+        The values last applied to the widgets are kept in a per-row snapshot, so
+        rebinding a row to an identical record issues no widget calls. Trailing
+        controls are built in an idle callback; see `flush_deferred`.
+        """
         if record is None or '__empty__' in record:
-            self.detach()
+            if not self._state.get('empty'):
+                self.detach()
+                self._state['empty'] = True
+            self._data = {}
+            self._preview = False
+            return
+        self._state['empty'] = False
+        if record == self._data and not self._preview:
             return
-
-        # Initial state cache
-        if not hasattr(self, '_state'):
-            self._state = {}
 
         self._data = record
+        self._preview = False
         self._item_index = self._data.get('item_index', 0)
 
         if self._row_alternation_enabled:
@@ -612,19 +638,9 @@ class ListItem(Pack):
             if self._row_alternation_mode == 'odd':
                 if self._item_index % 2 == 1:
                     surface_token = self._row_alternation_color
-
-            # Update surface on parent and all composite widgets
-            self.configure(surface=surface_token)
-            for widget in [self._frame_start, self._frame_center, self._frame_end]:
-                widget.configure(surface=surface_token)
-
-            # Update surface on all child widgets
-            for widget in self._composite_widgets:
-                if widget not in [self, self._frame_start, self._frame_center, self._frame_end]:
-                    try:
-                        widget.configure(surface=surface_token)
-                    except Exception:
-                        pass
+            if self._state.get('surface') != surface_token:
+                self._apply_surface(surface_token)
+                self._state['surface'] = surface_token
 
         selected = bool(record.get("selected", False))
         if self._state.get("selected") != selected:
@@ -657,12 +673,68 @@ class ListItem(Pack):
                 updater(value)
                 self._state[field] = value
 
-        self.schedule.idle(self._update_chevron)
-        self.schedule.idle(self._update_drag)
-        self.schedule.idle(self._update_delete)
+        if not self._defer_updates and self._deferred_job is None and self.deferred_pending:
+            self._deferred_job = self.schedule.idle(self.flush_deferred)
+
+    def flush_deferred(self):
+        """Build or remove the trailing controls (chevron, drag handle, delete button) if they changed."""
+        self.schedule.cancel(self._deferred_job)
+        self._deferred_job = None
+        controls = self._controls()
+        if self._state.get('controls') == controls:
+            return
+        self._update_chevron()
+        self._update_drag()
+        self._update_delete()
+        self._state['controls'] = controls
+
+    def _controls(self) -> tuple[bool, bool, bool]:
+        return self._chevron_visible, self._dragging_enabled, self._deleting_enabled
+
+    def _apply_surface(self, surface_token: str):
+        """Swap the row and its composite widgets to their styles for `surface_token`.
+
+        Each widget's style for a surface is built once and remembered, so moving a
+        row between the odd and even stripe is one `configure(style=...)` per widget.
+        """
+        for widget in self._composite_widgets:
+            self._apply_surface_style(widget, surface_token)
+
+    def _apply_surface_style(self, widget, surface_token: str):
+        builder = getattr(widget, '_style_builder', None)
+        if builder is None:
+            return
+        styles = self._surface_styles.setdefault(widget, {})
+        name = styles.get(surface_token)
+        if name is None:
+            name = styles[surface_token] = builder.build_with(surface=surface_token)
+        try:
+            widget.widget.configure(style=name)
+        except Exception:
+            pass
+
+    def _on_theme_changed(self, _):
+        # styles are named per theme; rebuild them once the composites have restyled
+        self._surface_styles.clear()
+        surface = self._state.get('surface')
+        if surface is not None:
+            self.schedule.idle(lambda: self._apply_surface(surface))
 
     def _add_composite_widget(self, widget, *, ignore_click: bool = False):
         self._composite_widgets.add(widget)
+        if self._delegate is not None:
+            self._delegate.register(widget, self, 'ignore' if ignore_click else None)
+        else:
+            self._bind_composite_events(widget, ignore_click)
+
+        # bring the new widget to the row's current state
+        if self._visual_state:
+            try:
+                widget.state(list(self._visual_state))
+            except Exception:
+                pass
+
+    def _bind_composite_events(self, widget, ignore_click: bool):
         widget.on(Event.ENTER).listen(self._on_enter)
         widget.on(Event.LEAVE).listen(self._on_leave)
         widget.on(Event.FOCUS).listen(self._on_focus_in)
@@ -672,13 +744,8 @@ class ListItem(Pack):
             widget.on(Event.CLICK1_DOWN).listen(self._on_mouse_down)
             widget.on(Event.CLICK1_UP).listen(self._on_mouse_up)
 
-        try:
-            current = set(self.state())
-        except Exception:
-            current = set()
-        for s in ('hover', 'pressed', 'selected', 'focus'):
-            if s in current:
-                try:
-                    widget.state([s])
-                except Exception:
-                    pass
+
+def _screen_y(event) -> int:
+    """Pointer y in screen coordinates, from a stream event or a raw tkinter event."""
+    y = getattr(event, 'screen_y', None)
+    return event.y_root if y is None else y
@@ -1,5 +1,8 @@
 from tkinter import Widget
-from typing import Literal, TypedDict
+from typing import Literal, TYPE_CHECKING, TypedDict
+
+if TYPE_CHECKING:
+    from ttkbootstrap_next.widgets.list.events import RowEventDelegate
 
 SelectBy = Literal['index', 'key']
 
@@ -16,4 +19,6 @@ class ListItemOptions(TypedDict, total=False):
     selection_background: str
     selection_mode: Literal['single', 'multiple', 'none']
     selection_controls_visible: bool
+    defer_updates: bool
+    event_delegate: 'RowEventDelegate'
     parent: Widget
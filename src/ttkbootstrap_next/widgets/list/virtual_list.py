@@ -1,18 +1,30 @@
+import time
 from typing import Any, Callable, Literal, Union
 
 from ttkbootstrap_next.datasource.memory_source import MemoryDataSource
+from ttkbootstrap_next.datasource.page_cache import PageCache
 from ttkbootstrap_next.datasource.types import DataSourceProtocol
 from ttkbootstrap_next.events import Event
 from ttkbootstrap_next.layouts import Pack
 from ttkbootstrap_next.types import Primitive
+from ttkbootstrap_next.widgets.badge import Badge
 from ttkbootstrap_next.widgets.entry import TextEntry
 from ttkbootstrap_next.widgets.label import Label
+from ttkbootstrap_next.widgets.list.canvas_renderer import CanvasRow, CanvasRowRenderer
+from ttkbootstrap_next.widgets.list.events import RowEventDelegate
+from ttkbootstrap_next.widgets.list.height_index import HeightIndex
 from ttkbootstrap_next.widgets.list.list_item import ListItem
 from ttkbootstrap_next.widgets.scrollbar import Scrollbar
 
-VISIBLE_ROWS = 20
-ROW_HEIGHT = 32
+VISIBLE_ROWS = 20  # initial viewport size, in rows, before the list is laid out
+ROW_HEIGHT = 32  # estimated row height until rows are measured
 OVERSCAN_ROWS = 2  # small buffer for smoother scroll/resizes
+POOL_SLACK = 4  # surplus pooled rows tolerated before the pool shrinks
+ROWS_PER_IDLE = 4  # rows created per idle callback while the pool grows
+WHEEL_PIXELS = 40  # pixels per wheel notch in smooth-scroll mode
+SCRUB_SETTLE_MS = 120  # thumb idle time before rows are fully bound during a drag
+FRAME_MS = 16  # minimum interval between drag auto-scroll steps
+FRAME_BUDGET_MS = 8  # time spent binding rows per slice; the rest of the frame is left to Tk
 EMPTY = {"__empty__": True, "id": "__empty__"}
 
 
@@ -22,6 +34,7 @@ class VirtualList(Pack):
             *,
             items: Union[DataSourceProtocol, list[Primitive], list[ListItem], list[dict[str, Any]]] = None,
             row_factory: Callable = None,
+            row_renderer: Literal['widgets', 'canvas'] = 'widgets',
             dragging_enabled=False,
             deleting_enabled=False,
             chevron_visible=False,
@@ -29,12 +42,16 @@ class VirtualList(Pack):
             row_alternation_color="background-1",
             row_alternation_mode: Literal['even', 'odd'] = "even",
             scrollbar_visible=True,
+            smooth_scroll_enabled=False,
+            scrub_overlay_enabled=True,
+            scrub_preview_field: str = None,
             show_separators=True,
             focus_state_enabled=True,
             focus_color=None,
             search_enabled=False,
             search_expr: list[str] = None,
             search_mode: Literal["contains", "startswith", "endswidth", "equals"] = "contains",
+            search_delay: int = 200,
             selection_background: str = "primary",
             select_by_click: bool = False,
             selection_mode: Literal['single', 'multiple', 'none'] = 'none',
@@ -46,7 +63,12 @@ class VirtualList(Pack):
 
             Keyword Arguments:
                 items: A list of items used to populate the list.
-                row_factory: A factory function used to generate the list items.
+                row_factory: A factory function used to generate the list items. It receives the parent
+                    and the row options, and passes them to `ListItem`. Rows from a custom factory bind their
+                    own events and schedule their own deferred work.
+                row_renderer: How rows are drawn. `widgets` builds a ListItem per pooled row; `canvas` draws
+                    every row as items on a single Canvas, which hit-tests pointer input and emits the same
+                    item events. `row_factory` is ignored by the canvas renderer.
                 row_alternation_enabled: Display alternating rows a different color.
                 row_alternation_color: The color of the alternating rows (default, surface-2)
                 row_alternation_mode: Whether to alternate even or odd rows.
@@ -54,9 +76,16 @@ class VirtualList(Pack):
                 deleting_enabled: Show a delete button and emit a delete event.
                 chevron_visible: Show a chevron icon.
                 scrollbar_visible: Display a scrollbar when content overflows the list view.
+                smooth_scroll_enabled: Scroll by pixels instead of whole rows. Rows are shifted with `place`
+                    and only rebound when a row crosses the viewport edge. Rows may differ in height; each
+                    row is measured the first time it is rendered.
+                scrub_overlay_enabled: Show the current position over the list while the scrollbar thumb is dragged.
+                scrub_preview_field: A record field whose value is previewed in the scrub overlay, such as the
+                    sort column.
                 search_enabled: Display a search entry above the list.
                 search_expr: The field(s) to use when executing the search query.
                 search_mode: The search method to execute.
+                search_delay: Milliseconds to wait after the last keystroke before searching.
                 show_separators: Display a separator between list items.
                 focus_state_enabled: Allow list items to take focus.
                 focus_color: The color of the focus indicator. Default follows selection color.
@@ -84,35 +113,92 @@ class VirtualList(Pack):
             row_alternation_mode=row_alternation_mode,
         )
         self._datasource = items if isinstance(items, DataSourceProtocol) else MemoryDataSource().set_data(items or [])
+        # Rows are read through a block cache; it is cleared when the data source reports a change
+        self._pages = PageCache(self._datasource)
+        self._prefetch_job = None
+        self._scroll_direction = 0  # +1 scrolling down, -1 scrolling up
         self._focus_state_enabled = focus_state_enabled
         self._row_factory = row_factory or self._default_row_factory
-        self._rows: list[ListItem] = []
+        self._custom_rows = row_factory is not None  # custom rows get only the documented options
+        self._rows: list[ListItem | CanvasRow] = []
         self._start_index = 0
-        self._total_rows = self._datasource.total_count()
+        self._total_rows = self._pages.total_count()
         self._visible_rows = VISIBLE_ROWS
-        self._row_height = ROW_HEIGHT
+        self._heights = HeightIndex(self._total_rows, ROW_HEIGHT)  # measured or estimated row heights
+        self._unmeasured: set[ListItem | CanvasRow] = set()  # rows rebound since they were last measured
+        self._measure_job = None
         self._page_size = VISIBLE_ROWS + OVERSCAN_ROWS
+        self._pool_target = 0  # rows the pool is growing toward
+        self._grow_job = None
+        self._natural_height = 0
         self._focused_record_id = None  # Track which record has logical focus
+        self._focused_index = None  # ...and its position in the current view
+        self._selection_anchor = None  # view index that shift-click ranges extend from
+
+        # Smooth scrolling: the first bound row is shifted up by `_pixel_offset` pixels
+        self._smooth_scroll_enabled = smooth_scroll_enabled
+        self._pixel_offset = 0
+        self._bound_rows = 0
+        self._bound_start = 0  # start index of the records currently bound to the pool
+
+        # Scroll input is accumulated and applied in a single idle repaint
+        self._scroll_target = None  # pending absolute `moveto` fraction
+        self._scroll_delta = 0  # pending relative scroll (rows, or pixels when smooth)
+        self._repaint_job = None
+        self._stats = dict(
+            scroll_events=0, repaints=0, last_frame_ms=0.0, max_frame_ms=0.0, total_frame_ms=0.0,
+            rows_bound=0, rows_deferred=0)
+
+        # Row binds that did not fit in the frame budget, nearest the focus first
+        self._pending_binds: list[tuple[int, ListItem | CanvasRow, dict]] = []
+        self._bind_job = None
+        # Rows with deferred work (trailing controls), flushed in one idle callback per refresh
+        self._deferred_rows: set[ListItem] = set()
+        self._deferred_job = None
+
+        # Scrubbing: while the scrollbar thumb is dragged, rows only preview their text
+        self._scrub_overlay_enabled = scrub_overlay_enabled
+        self._scrub_preview_field = scrub_preview_field
+        self._scrollbar_pressed = False
+        self._scrubbing = False
+        self._scrub_settle_job = None
+        self._scrub_overlay = None
 
         # Drag state tracking
         self._drag_source_index = None  # Index of item being dragged
         self._drag_target_index = None  # Index where item will be dropped
         self._drag_start_y = None  # Starting Y position of drag
         self._drag_indicator = None  # Visual drop indicator (Frame widget)
+        self._drag_scrolled_at = 0.0  # perf_counter time of the last auto-scroll step
 
         # Search
         self._search_enabled = search_enabled
         self._search_expr = search_expr
         self._search_mode = search_mode
+        self._search_delay = search_delay
+        self._search_term = ""  # term of the filter currently applied
         if self._search_enabled and self._search_expr:
             self._search_entry = TextEntry(parent=self, show_messages=False)
             self._search_entry.insert_addon(Label, icon="search", position="left")
-            self._search_entry.on_input().listen(self._on_search_text)
+            # A new keystroke restarts the delay, so only the settled term is searched
+            (self._search_entry.on_input()
+             .debounce(self._search_delay)
+             .cancel_when(self._is_stale_search)
+             .listen(self._on_search_text))
             self._search_entry.attach()
 
-        # List layout
-        self._canvas_frame = Pack(parent=self).attach(fill="both", expand=True)
+        # List layout; the pool is sized from the viewport, so rows must not drive its size
+        self._canvas_frame = Pack(parent=self, propagate=False).attach(fill="both", expand=True)
+        self._update_natural_height()
         self._canvas_frame.on(Event.CONFIGURE).listen(self._on_resize)
+        self._renderer = None
+        self._delegate = None
+        if row_renderer == 'canvas':
+            self._renderer = CanvasRowRenderer(self._canvas_frame, **self._options)
+            self._bind_row_keys(self._renderer.canvas)
+        else:
+            # pooled rows share one set of event bindings instead of binding every widget
+            self._delegate = RowEventDelegate(self._hub, self._row_key_handlers())
         self._scrollbar = Scrollbar(parent=self, orient="vertical").attach("place", x="100%", height="100%", xoffset=4)
         if not self._scrollbar_visible:
             self._scrollbar.hide()
@@ -133,12 +219,14 @@ class VirtualList(Pack):
         self._deselecting_stream = self._hub.on(Event.ITEM_DESELECTING)
         self._deselecting_stream.listen(self._on_deselecting)
 
-        # Fixed row pool
-        self._ensure_row_pool(self._page_size)
-        self.schedule.after(0, self._remeasure_and_relayout)
+        self._hub.on(Event.ITEM_RANGE_SELECTING).listen(self._on_range_selecting)
+
+        # The row pool is built lazily once the viewport is configured
 
         # Scrollbar binding
         self._scrollbar.widget.config(command=self._on_scroll)
+        self._scrollbar.on(Event.CLICK1_DOWN).listen(self._on_scrollbar_press)
+        self._scrollbar.on(Event.CLICK1_UP).listen(self._on_scrollbar_release)
         self.on(Event.MOUSE_WHEEL, scope="all").listen(self._on_mousewheel)
 
         # Listen for focus events from list items
@@ -149,6 +237,9 @@ class VirtualList(Pack):
         self._hub.on(Event.ITEM_DRAGGING).listen(self._on_dragging)
         self._hub.on(Event.ITEM_DRAG_END).listen(self._on_drag_end)
 
+        # Stop listening to the data source, which may outlive this list
+        self.on(Event.DESTROY).listen(lambda _: self._pages.close())
+
         self._update_rows()
 
     # ----- Helpers -----
@@ -159,12 +250,20 @@ class VirtualList(Pack):
 
         return self._canvas_frame
 
+    @property
+    def _placed_rows(self) -> bool:
+        """Rows are positioned with `place` (smooth scrolling or canvas rows) rather than packed."""
+        return self._smooth_scroll_enabled or self._renderer is not None
+
     @classmethod
     def _default_row_factory(cls, parent, **kwargs):
         return ListItem(parent=parent, **kwargs)
 
     def _clamp_indices(self):
-        self._total_rows = self._datasource.total_count()
+        self._total_rows = self._pages.total_count()
+        if self._heights.count != self._total_rows:
+            # heights follow view positions; keep the measured rows when the count changes
+            self._heights.resize(self._total_rows)
         vr = max(1, self._visible_rows)
         max_start = max(0, self._total_rows - vr)
         if self._start_index < 0:
@@ -172,10 +271,79 @@ class VirtualList(Pack):
         elif self._start_index > max_start:
             self._start_index = max_start
 
+        if self._smooth_scroll_enabled:
+            pos = min(self._top_pixel(), self._max_scroll_pixels())
+            self._start_index, self._pixel_offset = self._heights.index_at(max(0, pos))
+        else:
+            self._pixel_offset = 0
+
+    def _viewport_height(self) -> int:
+        try:
+            h = int(self._canvas_frame.widget.winfo_height())
+        except Exception:
+            h = 0
+        return h if h > 1 else max(1, self._visible_rows) * self._heights.estimate
+
+    def _top_pixel(self) -> int:
+        """Return the content offset of the top edge of the viewport."""
+        return self._heights.offset_of(self._start_index) + self._pixel_offset
+
+    def _max_scroll_pixels(self) -> int:
+        return max(0, self._heights.total() - self._viewport_height())
+
+    def _scroll_to_pixel(self, pos: int):
+        """Move the smooth-scroll position; rebind rows only when the first row changes."""
+        pos = max(0, min(int(pos), self._max_scroll_pixels()))
+        start, offset = self._heights.index_at(pos)
+        if start != self._start_index:
+            self._start_index, self._pixel_offset = start, offset
+            self._update_rows()
+        elif offset != self._pixel_offset:
+            self._pixel_offset = offset
+            self._place_rows()
+            self._update_scrollbar()
+
+    def _place_rows(self):
+        """Position the bound rows at their pixel offsets (smooth-scroll mode or canvas rows)."""
+        y = -self._pixel_offset
+        for i, row in enumerate(self._rows):
+            if i < self._bound_rows:
+                height = self._heights.get(self._start_index + i)
+                row.widget.place(x=0, y=y, relwidth=1, height=height)
+                y += height
+            elif row.widget.winfo_manager():
+                row.widget.place_forget()
+
     # ----- Event handlers -----
 
+    def _is_stale_search(self, event) -> bool:
+        """A search is stale when its term is already applied."""
+        return event.data.get('text', '') == self._search_term
+
+    def _search_refines(self, previous: str, term: str) -> bool:
+        """Return True if matches for `term` are a subset of matches for `previous`."""
+        if not previous or any(ch in term for ch in "%_"):
+            return False
+        previous, term = previous.lower(), term.lower()
+        match self._search_mode:
+            case "startswith":
+                return term.startswith(previous)
+            case "endswidth":
+                return term.endswith(previous)
+            case "equals":
+                return False
+            case _:
+                return previous in term
+
     def _on_search_text(self, event):
         search_term = event.data['text']
+        refine = self._search_refines(self._search_term, search_term)
+        self._search_term = search_term
+        if not search_term:
+            self._datasource.set_filter("")
+            self._update_rows()
+            return
+
         query_parts = []
         for key in self._search_expr:
             match self._search_mode:
@@ -189,54 +357,169 @@ class VirtualList(Pack):
                     query_parts.append(f"{key} LIKE '%{search_term}%'")
 
         where_sql = " OR ".join(query_parts).strip()
-        self._datasource.set_filter(where_sql)
+        if refine:
+            try:
+                self._datasource.set_filter(where_sql, refine=True)
+            except TypeError:
+                # sources written against the plain `set_filter(where_sql)` signature
+                self._datasource.set_filter(where_sql)
+        else:
+            self._datasource.set_filter(where_sql)
         self._update_rows()
 
     def _on_scroll(self, *args):
-        self._clamp_indices()
         if args and args[0] == "moveto":
-            fraction = float(args[1])
-            max_start = max(0, self._total_rows - max(1, self._visible_rows))
-            self._start_index = int(round(fraction * max_start))
+            self._scroll_target = float(args[1])
+            self._scroll_delta = 0
         elif args and args[0] == "scroll":
             number = int(args[1])
             what = args[2] if len(args) > 2 else "units"
-            step = self._visible_rows if what == "pages" else 1
-            self._start_index += number * step
-        self._clamp_indices()
-        self._update_rows()
+            if self._smooth_scroll_enabled:
+                step = self._viewport_height() if what == "pages" else self._heights.estimate
+            else:
+                step = self._visible_rows if what == "pages" else 1
+            self._scroll_delta += number * step
+        self._queue_scroll()
 
     def _on_mousewheel(self, event):
-        step = -1 if event.delta > 0 else 1
-        self._start_index += step
+        if self._smooth_scroll_enabled:
+            delta = event.delta or 0
+            # Windows/X11 report notches of 120; macOS reports small precise deltas
+            pixels = -delta / 120 * WHEEL_PIXELS if abs(delta) >= 120 else -delta * 4
+            self._scroll_delta += int(pixels)
+        else:
+            self._scroll_delta += -1 if event.delta > 0 else 1
+        self._queue_scroll()
+
+    def _queue_scroll(self):
+        """Accumulate scroll input and repaint once when Tk is idle."""
+        self._stats["scroll_events"] += 1
+        if self._repaint_job is None:
+            self._repaint_job = self.schedule.idle(self._flush_scroll)
+
+    def _flush_scroll(self):
+        """Apply all scroll input received since the last repaint."""
+        self._repaint_job = None
+        target, delta = self._scroll_target, self._scroll_delta
+        self._scroll_target, self._scroll_delta = None, 0
+
+        # Thumb drags bind a cheap preview; the full rows are bound once the drag settles
+        scrub = target is not None and self._scrollbar_pressed
+
+        started = time.perf_counter()
         self._clamp_indices()
+        if self._smooth_scroll_enabled:
+            pos = self._top_pixel() if target is None else target * self._heights.total()
+            if scrub:
+                pos = max(0, min(int(pos + delta), self._max_scroll_pixels()))
+                self._start_index, self._pixel_offset = self._heights.index_at(pos)
+                self._scrub_rows()
+            else:
+                self._scroll_to_pixel(pos + delta)
+        else:
+            if target is not None:
+                max_start = max(0, self._total_rows - max(1, self._visible_rows))
+                self._start_index = int(round(target * max_start))
+            self._start_index += delta
+            self._clamp_indices()
+            if scrub:
+                self._scrub_rows()
+            else:
+                self._update_rows()
+
+        elapsed = (time.perf_counter() - started) * 1000
+        stats = self._stats
+        stats["repaints"] += 1
+        stats["last_frame_ms"] = elapsed
+        stats["max_frame_ms"] = max(stats["max_frame_ms"], elapsed)
+        stats["total_frame_ms"] += elapsed
+
+    def _on_scrollbar_press(self, _):
+        self._scrollbar_pressed = True
+
+    def _on_scrollbar_release(self, _):
+        self._scrollbar_pressed = False
+        if self._scrubbing:
+            self._settle_scrub()
+
+    def _scrub_rows(self):
+        """Preview the rows at the current position without a full bind."""
+        self._scrubbing = True
+        page_data = self._pages.get_page_from_index(self._start_index, self._page_size)
+        for row, rec in zip(self._rows, page_data):
+            row.update_preview(rec)
+
+        if self._placed_rows:
+            self._bound_rows = min(len(page_data), len(self._rows))
+            self._bound_start = self._start_index
+            self._place_rows()
+        self._update_scrollbar()
+        self._show_scrub_overlay(page_data[0] if page_data else None)
+
+        # bind fully once the thumb rests, even while it is still held
+        self.schedule.cancel(self._scrub_settle_job)
+        self._scrub_settle_job = self.schedule.after(SCRUB_SETTLE_MS, self._settle_scrub)
+
+    def _settle_scrub(self):
+        """Leave scrubbing mode and bind the rows at the final position."""
+        self.schedule.cancel(self._scrub_settle_job)
+        self._scrub_settle_job = None
+        if not self._scrubbing:
+            return
+        self._scrubbing = False
+        if self._scrub_overlay is not None:
+            self._scrub_overlay.detach()
         self._update_rows()
 
+    def _show_scrub_overlay(self, record: dict | None):
+        if not self._scrub_overlay_enabled:
+            return
+        text = f"{self._start_index + 1:,} of {self._total_rows:,}"
+        if record and self._scrub_preview_field and record.get(self._scrub_preview_field) is not None:
+            text = f"{text}  ·  {record[self._scrub_preview_field]}"
+
+        if self._scrub_overlay is None:
+            self._scrub_overlay = Badge(parent=self._canvas_frame, text=text, color="secondary", variant="pill")
+        else:
+            self._scrub_overlay.configure(text=text)
+        if not self._scrub_overlay.widget.winfo_manager():
+            self._scrub_overlay.attach("place", x="50%", y="50%", anchor="center")
+        self._scrub_overlay.widget.lift()
+
     def _on_deselecting(self, event: Any):
+        self._selection_anchor = event.data.get('item_index', self._selection_anchor)
         self._datasource.unselect_record(event.data['id'])
         self._update_rows()
-        selected = self._datasource.get_selected()
-        self._hub.emit(Event.ITEM_DESELECTED, data=event.data)
-        self._hub.emit(Event.CHANGED, selected=selected)
+        self._hub.emit(Event.ITEM_DESELECTED, data=event.data, via="auto")
+        self._emit_selection_changed()
 
     def _on_selecting(self, event: Any):
+        self._selection_anchor = event.data.get('item_index', self._selection_anchor)
         if self._options.get('selection_mode') == 'single':
             self._datasource.unselect_all()
             self._datasource.select_record(event.data['id'])
         else:
             self._datasource.select_record(event.data['id'])
         self._update_rows()
-        selected = self._datasource.get_selected()
-        self._hub.emit(Event.ITEM_SELECTED, data=event.data)
-        self._hub.emit(Event.SELECTION_CHANGED, selected=selected)
+        self._hub.emit(Event.ITEM_SELECTED, data=event.data, via="auto")
+        self._emit_selection_changed()
+
+    def _on_range_selecting(self, event: Any):
+        """Replace the selection with the rows between the anchor and the shift-clicked row."""
+        index = event.data.get('item_index')
+        if index is None:
+            return
+        anchor = index if self._selection_anchor is None else self._selection_anchor
+        self._selection_anchor = anchor
+        self.select_range(min(anchor, index), max(anchor, index) + 1, replace=True)
 
     def _on_deleting(self, event: Any):
         try:
             self._datasource.delete_record(event.data['id'])
             self._update_rows()
-            self._hub.emit(Event.ITEM_DELETED, data=event.data)
+            self._hub.emit(Event.ITEM_DELETED, data=event.data, via="auto")
         except Exception as error:
-            self._hub.emit(Event.ITEM_DELETE_FAILED, data={**event.data, "reason": error.args[0]})
+            self._hub.emit(Event.ITEM_DELETE_FAILED, data={**event.data, "reason": error.args[0]}, via="auto")
 
     def _on_inserting(self, event: Any):
         try:
@@ -244,37 +527,106 @@ class VirtualList(Pack):
             record_id = self._datasource.create_record(record)
             record['id'] = record_id
             self._update_rows()
-            self._hub.emit(Event.ITEM_INSERTED, data=record)
+            self._hub.emit(Event.ITEM_INSERTED, data=record, via="auto")
         except Exception as error:
-            self._hub.emit(Event.ITEM_INSERT_FAILED, data={**event.data, "reason": error.args[0]})
+            self._hub.emit(Event.ITEM_INSERT_FAILED, data={**event.data, "reason": error.args[0]}, via="auto")
 
     def _on_updating(self, event: Any):
         try:
             updated = self._datasource.update_record(event.data['id'], event.data.updates)
             if updated:
                 self._update_rows()
-                self._hub.emit(Event.ITEM_UPDATED, data=event.data)
+                self._hub.emit(Event.ITEM_UPDATED, data=event.data, via="auto")
             else:
                 self._hub.emit(
-                    Event.ITEM_UPDATE_FAILED, data={**event.data, "reason": "Datasource rejected the update."})
+                    Event.ITEM_UPDATE_FAILED, data={**event.data, "reason": "Datasource rejected the update."},
+                    via="auto")
         except Exception as error:
-            self._hub.emit(Event.ITEM_UPDATE_FAILED, data={**event.data, "reason": error.args[0]})
+            self._hub.emit(Event.ITEM_UPDATE_FAILED, data={**event.data, "reason": error.args[0]}, via="auto")
 
     def _on_item_focused(self, event: Any):
         """Handle when a list item receives focus - track which record is focused."""
         if not self._focus_state_enabled: return;
         record_id = event.data.get('id')
-        if record_id and record_id != '__empty__':
+        if record_id and record_id != '__empty__' and record_id != self._focused_record_id:
+            previous = self._focused_record_id
             self._focused_record_id = record_id
-            # Force update to apply focused state to the correct row
-            self._update_rows()
+            self._focused_index = event.data.get('item_index')
+            # Only the rows that gained or lost focus need to change
+            self._refresh_focus_rows(previous, record_id)
+
+    def _on_nav_key(self, delta: int | None = None, *, index: int | None = None):
+        """Move logical focus by `delta` rows, or to an absolute `index`."""
+        if not self._focus_state_enabled or self._total_rows <= 0:
+            return "break"
+        if index is None:
+            current = self._focused_index if self._focused_index is not None else self._start_index
+            index = current + delta
+        self._focus_index(max(0, min(index, self._total_rows - 1)))
+        return "break"
+
+    def _page_rows(self) -> int:
+        return max(1, self._visible_rows - 1)
+
+    def _row_key_handlers(self) -> dict[Event, Callable[[Any], Any]]:
+        return {
+            Event.KEYDOWN_UP: lambda _: self._on_nav_key(-1),
+            Event.KEYDOWN_DOWN: lambda _: self._on_nav_key(1),
+            Event.KEYDOWN_PAGE_UP: lambda _: self._on_nav_key(-self._page_rows()),
+            Event.KEYDOWN_PAGE_DOWN: lambda _: self._on_nav_key(self._page_rows()),
+            Event.KEYDOWN_HOME: lambda _: self._on_nav_key(index=0),
+            Event.KEYDOWN_END: lambda _: self._on_nav_key(index=self._total_rows - 1),
+        }
+
+    def _bind_row_keys(self, widget):
+        for event, handler in self._row_key_handlers().items():
+            widget.on(event).listen(handler)
+
+    def _focus_index(self, index: int):
+        """Give logical focus to the record at `index`, scrolling only if it is out of view."""
+        page = self._pages.get_page_from_index(index, 1)
+        if not page:
+            return
+        previous = self._focused_record_id
+        self._focused_index, self._focused_record_id = index, page[0].get('id')
+
+        if self._smooth_scroll_enabled:
+            top = self._heights.offset_of(index)
+            bottom = top + self._heights.get(index)
+            view_top = self._top_pixel()
+            view_height = self._viewport_height()
+            if top < view_top:
+                self._scroll_to_pixel(top)
+            elif bottom > view_top + view_height:
+                self._scroll_to_pixel(bottom - view_height)
+        else:
+            visible = max(1, self._visible_rows)
+            if index < self._start_index:
+                self._start_index = index
+                self._update_rows()
+            elif index >= self._start_index + visible:
+                self._start_index = index - visible + 1
+                self._update_rows()
+
+        self._refresh_focus_rows(previous, self._focused_record_id)
+
+    def _refresh_focus_rows(self, *record_ids):
+        """Rebind the bound rows showing `record_ids` if their focus flag is stale."""
+        for row in self._rows[:self._bound_rows]:
+            data = row.data
+            rid = data.get('id')
+            if rid is None or rid not in record_ids:
+                continue
+            focused = rid == self._focused_record_id
+            if bool(data.get('focused')) != focused:
+                row.update_data({**data, 'focused': focused})
 
     def _on_drag_start(self, event: Any):
         """Handle when user starts dragging an item."""
         self._drag_source_index = event.data.get('source_index')
         self._drag_start_y = event.data.get('y_start')
         self._drag_target_index = self._drag_source_index  # Initially target same as source
-        self._drag_scroll_counter = 0  # Reset scroll counter
+        self._drag_scrolled_at = 0.0
         self._show_drag_indicator()
 
     def _on_dragging(self, event: Any):
@@ -296,33 +648,23 @@ class VirtualList(Pack):
             # Define scroll zones (20% of container height from top/bottom)
             scroll_zone_height = int(container_height * 0.2)
 
-            # Check if we need to auto-scroll
-            # Only scroll every few motion events to slow it down
-            if not hasattr(self, '_drag_scroll_counter'):
-                self._drag_scroll_counter = 0
-
-            self._drag_scroll_counter += 1
-            should_scroll = self._drag_scroll_counter % 8 == 0  # Only scroll every 8th motion event
-
-            if should_scroll:
-                if relative_y < scroll_zone_height and self._start_index > 0:
-                    # Near top edge - scroll up
-                    # Always scroll just 1 row for smooth, predictable scrolling
-                    self._start_index -= 1
-                    self._clamp_indices()
-                    self._update_rows()
-
-                elif relative_y > (container_height - scroll_zone_height):
-                    # Near bottom edge - scroll down
-                    max_start = max(0, self._total_rows - self._visible_rows)
-                    if self._start_index < max_start:
-                        # Always scroll just 1 row for smooth, predictable scrolling
-                        self._start_index += 1
-                        self._clamp_indices()
-                        self._update_rows()
+            # Auto-scroll near the edges, at most one step per frame however fast the
+            # motion events arrive; steps go through the coalesced scroll repaint.
+            direction = 0
+            if relative_y < scroll_zone_height:
+                direction = -1
+            elif relative_y > (container_height - scroll_zone_height):
+                direction = 1
+
+            now = time.perf_counter()
+            if direction and (now - self._drag_scrolled_at) * 1000 >= FRAME_MS:
+                self._drag_scrolled_at = now
+                step = max(1, self._heights.estimate // 4) if self._smooth_scroll_enabled else 1
+                self._scroll_delta += direction * step
+                self._queue_scroll()
 
             # Calculate target row index based on mouse position
-            row_index = self._start_index + (relative_y // self._row_height)
+            row_index, _ = self._heights.index_at(self._top_pixel() + relative_y)
 
             # Clamp to valid range
             row_index = max(0, min(row_index, self._total_rows - 1))
@@ -361,26 +703,12 @@ class VirtualList(Pack):
             return
 
         try:
-            # Get all records from datasource
-            all_records = self._datasource.get_page_from_index(0, self._total_rows)
-
-            if source < len(all_records) and target < len(all_records):
-                # Get the record being moved
-                moved_record = all_records[source]
-
-                # Remove from source position
-                all_records.pop(source)
-
-                # Insert at target position
-                # If moving down, target index doesn't need adjustment (already removed one before it)
-                # If moving up, target index is correct
-                insert_index = target if source > target else target
-                all_records.insert(insert_index, moved_record)
+            page = self._pages.get_page_from_index(source, 1)
+            if page and target < self._total_rows:
+                moved_record = page[0]
 
-                # Update datasource with reordered data
-                self._datasource.set_data(all_records)
-
-                # Refresh the list
+                self._move_record(moved_record, source, target)
+                self._heights.move(source, target)
                 self._update_rows()
 
                 # Emit success event
@@ -389,7 +717,7 @@ class VirtualList(Pack):
                         'record': moved_record,
                         'from_index': source,
                         'to_index': target
-                    })
+                    }, via="auto")
 
         except Exception as e:
             # Handle error - emit failed event
@@ -398,7 +726,19 @@ class VirtualList(Pack):
                     'from_index': source,
                     'to_index': target,
                     'reason': str(e)
-                })
+                }, via="auto")
+
+    def _move_record(self, record: dict, source: int, target: int):
+        move_records = getattr(self._datasource, 'move_records', None)
+        if callable(move_records):
+            # The data source moves the record in place; rows outside the moved
+            # span still match their records and are skipped by the rebind.
+            move_records([record['id']], target)
+            return
+        # sources without the reorder capability are reloaded in the new order
+        all_records = self._datasource.get_page_from_index(0, self._total_rows)
+        all_records.insert(target, all_records.pop(source))
+        self._datasource.set_data(all_records)
 
     # ----- Drag indicator helpers ------
 
@@ -425,7 +765,7 @@ class VirtualList(Pack):
 
             # Only show indicator if target is visible
             if 0 <= visual_index < len(self._rows):
-                y_pos = visual_index * self._row_height
+                y_pos = self._heights.offset_of(target_index) - self._top_pixel()
 
                 # Place the indicator at the top of the target row
                 self._drag_indicator.place(
@@ -453,19 +793,55 @@ class VirtualList(Pack):
 
     # ----- Helpers ------
 
+    def _rotate_rows(self, shift: int):
+        """Recycle the pool after scrolling by `shift` rows.
+
+        Rows that scrolled out of view are moved to the opposite end of the pool
+        so that rows still showing the same record keep their widgets untouched.
+        """
+        rows = self._rows
+        if shift > 0:
+            moved = rows[:shift]
+            self._rows = rows[shift:] + moved
+            if not self._placed_rows:
+                anchor = rows[-1]
+                for row in moved:
+                    row.widget.pack_configure(after=anchor.widget)
+                    anchor = row
+        else:
+            moved = rows[shift:]
+            self._rows = moved + rows[:shift]
+            if not self._placed_rows:
+                first = rows[0]
+                for row in moved:
+                    row.widget.pack_configure(before=first.widget)
+
     def _update_rows(self):
         self._clamp_indices()
-        page_data = self._datasource.get_page_from_index(self._start_index, self._page_size)
-
+        page_data = self._pages.get_page_from_index(self._start_index, self._page_size)
+
+        # Recycle by rotation when scrolling within a fully bound pool
+        shift = self._start_index - self._bound_start
+        if shift:
+            self._scroll_direction = 1 if shift > 0 else -1
+        prev_bound = min(self._bound_rows, len(self._rows))
+        if shift and abs(shift) < len(self._rows) and prev_bound == len(self._rows):
+            self._rotate_rows(shift)
+        elif shift:
+            prev_bound = 0  # nothing lines up with the previous binding
+
+        self._bound_rows = min(len(page_data), len(self._rows))
+        self._bound_start = self._start_index
+
+        binds = []
         for i, row in enumerate(self._rows):
             rec = page_data[i] if i < len(page_data) else EMPTY
-            # if ListItem ever gets pack_forget/destroyed elsewhere, make sure it's packed:
-            if not row.widget.winfo_manager():
-                row.widget.pack(fill="x")
             # preserve selection and focus flags
             if rec is not EMPTY:
                 rid = rec.get('id')
-                if rid is not None and hasattr(self._datasource, 'is_selected'):
+                # built-in sources fill `selected` from their recorded selection; asking
+                # `is_selected` per row would make them write a pending range out first
+                if 'selected' not in rec and rid is not None and hasattr(self._datasource, 'is_selected'):
                     try:
                         sel = bool(self._datasource.is_selected(rid))
                     except Exception:
@@ -477,7 +853,107 @@ class VirtualList(Pack):
                 focused = (rid is not None and rid == self._focused_record_id)
 
                 rec = {**rec, 'selected': sel, 'focused': focused, "item_index": i + self._start_index}
-            row.update_data(rec)
+
+                # Row already shows this exact record; skip the rebind entirely
+                if i < prev_bound and row.data == rec and not getattr(row, 'previewing', False):
+                    continue
+
+                # if ListItem ever gets pack_forget/destroyed elsewhere, make sure it's packed:
+                if not self._placed_rows and not row.widget.winfo_manager():
+                    row.widget.pack(fill="x")
+                binds.append((i, row, rec))
+            else:
+                # clearing a row is cheap and must never leave a stale record on screen
+                row.update_data(rec)
+
+        self._schedule_binds(binds)
+        if self._placed_rows:
+            self._place_rows()
+        self._update_scrollbar()
+        if shift and self._pages.enabled and self._prefetch_job is None:
+            self._prefetch_job = self.schedule.idle(self._prefetch_rows)
+
+    def _schedule_binds(self, binds: list[tuple[int, ListItem | CanvasRow, dict]]):
+        """Bind rows nearest the focused row (or the viewport centre) first.
+
+        Binding stops once FRAME_BUDGET_MS is spent; the remaining rows show a
+        text preview and are bound in later idle slices.
+        """
+        self.schedule.cancel(self._bind_job)
+        self._bind_job = None
+        focus = -1 if self._focused_index is None else self._focused_index - self._start_index
+        anchor = focus if 0 <= focus < len(self._rows) else self._visible_rows // 2
+        binds.sort(key=lambda b: abs(b[0] - anchor))
+        self._pending_binds = binds
+        self._bind_pending()
+        if self._pending_binds:
+            self._stats["rows_deferred"] += len(self._pending_binds)
+            for _, row, rec in self._pending_binds:
+                row.update_preview(rec)
+
+    def _bind_pending(self):
+        """Bind pending rows until the frame budget is spent, then yield to Tk."""
+        self._bind_job = None
+        pending = self._pending_binds
+        started = time.perf_counter()
+        done = 0
+        while done < len(pending):
+            # always bind at least one row so every slice makes progress
+            if done and (time.perf_counter() - started) * 1000 >= FRAME_BUDGET_MS:
+                break
+            _, row, rec = pending[done]
+            done += 1
+            if row in self._rows:
+                row.update_data(rec)
+                self._unmeasured.add(row)
+                if getattr(row, 'deferred_pending', False):
+                    self._deferred_rows.add(row)
+        self._stats["rows_bound"] += done
+        del pending[:done]
+
+        if pending:
+            self._bind_job = self.schedule.idle(self._bind_pending)
+        if self._deferred_rows and self._deferred_job is None:
+            self._deferred_job = self.schedule.idle(self._flush_deferred)
+        if self._unmeasured and self._measure_job is None:
+            # requested sizes are only settled once Tk has processed the new content
+            self._measure_job = self.schedule.idle(self._measure_rows)
+
+    def _flush_deferred(self):
+        """Run the deferred row work queued since the last flush."""
+        self._deferred_job = None
+        rows, self._deferred_rows = self._deferred_rows, set()
+        for row in rows:
+            if row in self._rows:
+                row.flush_deferred()
+
+    def _prefetch_rows(self):
+        """Load the next block of records in the scroll direction."""
+        self._prefetch_job = None
+        self._pages.prefetch(self._start_index, self._page_size, self._scroll_direction)
+
+    def _measure_rows(self):
+        """Record the natural height of rows rebound since they were last measured."""
+        self.schedule.cancel(self._measure_job)
+        self._measure_job = None
+        changed = False
+        for i in range(self._bound_rows):
+            row = self._rows[i]
+            if row in self._unmeasured:
+                changed |= self._heights.set(self._start_index + i, row.widget.winfo_reqheight())
+        self._unmeasured.clear()
+        if changed:
+            if self._placed_rows:
+                self._place_rows()
+            self._update_scrollbar()
+            self._relayout_pool()
+
+    def _update_scrollbar(self):
+        if self._smooth_scroll_enabled and self._total_rows > 0:
+            total_px = max(1, self._heights.total())
+            top = self._top_pixel()
+            self._scrollbar.set(top / total_px, min(1.0, (top + self._viewport_height()) / total_px))
+            return
 
         total = max(1, self._total_rows)
         first = (self._start_index / total) if self._total_rows > 0 else 0.0
@@ -487,18 +963,21 @@ class VirtualList(Pack):
         self._scrollbar.set(first, min(last, 1.0))
 
     def _compute_sizes(self) -> tuple[int, int]:
-        try:
-            h = int(self._canvas_frame.widget.winfo_height())
-        except Exception:
-            h = 0
-
-        # Use the measured row height; guard against zero
-        rh = max(1, int(self._row_height) or ROW_HEIGHT)
-
-        visible = max(1, (h // rh) if h > 0 else self._visible_rows or VISIBLE_ROWS)
-        page = visible + OVERSCAN_ROWS
+        """Return the number of fully visible rows and the number of rows needed to cover the viewport."""
+        h = self._viewport_height()
+
+        # Use the average measured row height; guard against zero
+        rh = max(1, self._heights.estimate)
+
+        visible = max(1, h // rh)
+        span = -(-h // rh)
+        if self._smooth_scroll_enabled and self._total_rows:
+            # rows of measured height between the top and bottom edges of the viewport
+            last, _ = self._heights.index_at(self._top_pixel() + h)
+            span = max(span, last - self._start_index + 1)
+        page = span + OVERSCAN_ROWS
         # Also cap by total rows so clamping math can reach the end exactly
-        total = max(0, self._datasource.total_count())
+        total = max(0, self._pages.total_count())
         visible = min(visible, total) if total else visible
         page = min(page, total) if total else page
         return visible, page
@@ -506,49 +985,65 @@ class VirtualList(Pack):
     def _on_resize(self, *_):
         self._remeasure_and_relayout()
 
-    def _compute_page_size(self) -> int:
-        """Return how many rows fit in the viewport, with a small overscan."""
-        try:
-            h = int(self._canvas_frame.widget.winfo_height())
-        except Exception:
-            h = 0
+    def _update_natural_height(self):
+        """Request room for up to VISIBLE_ROWS rows; the layout may grant more or less."""
+        rows = min(self._total_rows, VISIBLE_ROWS) if self._total_rows else VISIBLE_ROWS
+        height = rows * self._heights.estimate
+        if height != self._natural_height:
+            self._natural_height = height
+            self._canvas_frame.widget.configure(height=height)
 
-        # If height not yet laid out, fall back to previous or default
-        base = max(1, (h // self._row_height) if h > 0 else self._page_size or VISIBLE_ROWS)
-        return base + OVERSCAN_ROWS
+    def _resize_pool(self, needed: int):
+        """Move the pooled ListItem widgets toward `needed` rows.
 
-    def _ensure_row_pool(self, needed: int):
-        """Grow/shrink the pooled ListItem widgets to match the needed page size."""
-        # Grow
-        while len(self._rows) < needed:
-            row = self._row_factory(self._canvas_frame, **self._options)
-            row.widget.pack(fill="x")
+        Rows are created a few at a time when Tk is idle, so building a list never
+        blocks the first paint. The pool only shrinks once it holds more than
+        POOL_SLACK surplus rows, so small resizes do not churn widgets.
+        """
+        self._pool_target = needed
+        if len(self._rows) > needed + POOL_SLACK:
+            while len(self._rows) > needed:
+                row = self._rows.pop()
+                self._unmeasured.discard(row)
+                self._deferred_rows.discard(row)
+                if self._delegate is not None:
+                    self._delegate.release(row)
+                row.destroy()
+            self._bound_rows = min(self._bound_rows, len(self._rows))
+        elif len(self._rows) < needed and self._grow_job is None:
+            self._grow_job = self.schedule.idle(self._grow_pool)
+
+    def _grow_pool(self):
+        """Create the next batch of pooled rows and bind them."""
+        self._grow_job = None
+        for _ in range(min(ROWS_PER_IDLE, self._pool_target - len(self._rows))):
+            if self._renderer is not None:
+                # canvas rows share the canvas key bindings
+                self._rows.append(self._renderer.create_row())
+                continue
+            # default rows share the list's event delegate and deferred-work batching
+            extras = {} if self._custom_rows else {'defer_updates': True, 'event_delegate': self._delegate}
+            row = self._row_factory(self._canvas_frame, **extras, **self._options)
+            if not self._smooth_scroll_enabled:
+                row.widget.pack(fill="x")
             self._rows.append(row)
-        # Shrink
-        while len(self._rows) > needed:
-            row = self._rows.pop()
-            row.destroy()
+        self._update_rows()
+        if len(self._rows) < self._pool_target:
+            self._grow_job = self.schedule.idle(self._grow_pool)
+
+    def _relayout_pool(self):
+        """Recompute visible/page sizes and resize the pool to match."""
+        self._visible_rows, self._page_size = self._compute_sizes()
+        self._resize_pool(self._page_size)
+        self._update_natural_height()
 
     def _remeasure_and_relayout(self):
-        """Measure real row height, then recompute visible/page sizes and repaint."""
-        if not self._rows:
-            return
-        # Measure actual widget height; fall back to requested if 0 (not yet mapped)
-        rh = self._rows[0].widget.winfo_height()
-        if rh <= 1:
-            rh = self._rows[0].widget.winfo_reqheight()
-
-        # If ListItem adds internal padding/margins, this captures it.
-        if rh and rh != self._row_height:
-            self._row_height = rh
-
-        # Recompute sizes with the true row height
-        vis, page = self._compute_sizes()
-        size_changed = (vis != self._visible_rows) or (page != self._page_size)
-
-        # Always ensure pool >= page and repaint when height changed
-        self._visible_rows, self._page_size = vis, page
-        self._ensure_row_pool(self._page_size)
+        """Measure real row heights, then recompute visible/page sizes and repaint."""
+        # Placed rows are forced to their recorded height, so measure the natural size
+        # (which also captures any ListItem padding/margins).
+        self._clamp_indices()
+        self._measure_rows()
+        self._relayout_pool()
         self._clamp_indices()
         self._update_rows()
 
@@ -563,7 +1058,14 @@ class VirtualList(Pack):
         return self._hub.on(Event.ITEM_SELECTED)
 
     def on_selection_changed(self):
-        """Convenience alias for selection changed stream"""
+        """Convenience alias for selection changed stream.
+
+        Every event carries the same payload: `count`, the number of selected
+        records, and `selected_range`, the `[start, end)` view rows a range
+        selection or `select_all` covered (None for a single row or
+        `unselect_all`). It is emitted for selections and deselections alike.
+        Use the data source's `get_selected` for the records themselves.
+        """
         return self._hub.on(Event.SELECTION_CHANGED)
 
     def on_item_deselecting(self):
@@ -622,26 +1124,43 @@ class VirtualList(Pack):
         """Convenience alias for item reorder failed stream"""
         return self._hub.on(Event.ITEM_REORDER_FAILED)
 
+    # ----- Diagnostics -----
+
+    def render_stats(self) -> dict:
+        """Return scroll, repaint and row binding counters, including frame times in milliseconds.
+
+        `rows_deferred` counts row binds pushed past the frame budget into idle slices.
+        """
+        stats = dict(self._stats)
+        total_ms = stats.pop("total_frame_ms")
+        stats["avg_frame_ms"] = total_ms / stats["repaints"] if stats["repaints"] else 0.0
+        stats["rows_pending"] = len(self._pending_binds)
+        stats["page_cache"] = self._pages.stats()
+        return stats
+
     # ----- Actions -----
 
     def reload(self):
         """Reload from datasource and redraw the rows"""
         self._datasource.reload()
+        self._pages.invalidate()
+        # the view order may have changed (e.g. a new sort); measured heights no longer line up
+        self._heights.reset(self._pages.total_count())
         self._update_rows()
 
     # ----- Mutators -----
 
     def delete_item(self, key: str):
         """Delete item by key"""
-        self._hub.emit(Event.ITEM_DELETING, data={'id': key})
+        self._hub.emit(Event.ITEM_DELETING, data={'id': key}, via="auto")
 
     def insert_item(self, value: dict):
         """Insert new item"""
-        self._hub.emit(Event.ITEM_INSERTING, data=value)
+        self._hub.emit(Event.ITEM_INSERTING, data=value, via="auto")
 
     def update_item(self, key: str, changes: dict):
         """Update item by key"""
-        self._hub.emit(Event.ITEM_UPDATING, data={"id": key, "changes": changes})
+        self._hub.emit(Event.ITEM_UPDATING, data={"id": key, "changes": changes}, via="auto")
 
     # ----- Query -----
 
@@ -655,15 +1174,53 @@ class VirtualList(Pack):
 
     def select_item(self, key: str):
         """Select item by key"""
-        self._hub.emit(Event.ITEM_SELECTING, data={"id": key})
+        self._hub.emit(Event.ITEM_SELECTING, data={"id": key}, via="auto")
 
     def deselect_item(self, key: str):
         """Deselect item by key"""
-        self._hub.emit(Event.ITEM_DESELECTING, data={"id": key})
+        self._hub.emit(Event.ITEM_DESELECTING, data={"id": key}, via="auto")
+
+    def select_range(self, start: int, end: int, replace: bool = False):
+        """Select the rows from view index `start` (inclusive) to `end` (exclusive).
+
+        The range is handed to the data source as a single operation, and the
+        change event reports the range and count instead of the selected records;
+        see `on_selection_changed`.
+
+        Args:
+            start: First row to select.
+            end: Row after the last row to select.
+            replace: Clear the existing selection first.
+        """
+        if replace:
+            self._datasource.unselect_all()
+        start, end = max(0, start), min(end, self._pages.total_count())
+        if end > start:
+            self._select_source_range(start, end)
+        self._update_rows()
+        self._emit_selection_changed([start, end])
+
+    def _select_source_range(self, start: int, end: int) -> int:
+        select_range = getattr(self._datasource, 'select_range', None)
+        if callable(select_range):
+            return select_range(start, end)
+        # sources without the range capability select record by record
+        records = self._datasource.get_page_from_index(start, end - start)
+        return sum(bool(self._datasource.select_record(record['id'])) for record in records)
+
+    def select_all(self):
+        """Select all items"""
+        self._datasource.select_all()
+        self._update_rows()
+        self._emit_selection_changed([0, self._total_rows])
+
+    def _emit_selection_changed(self, selected_range: list[int] | None = None):
+        self._hub.emit(
+            Event.SELECTION_CHANGED, count=self._datasource.selected_count(), selected_range=selected_range,
+            via="auto")
 
     def unselect_all(self):
         """Unselect all items"""
         self._datasource.unselect_all()
         self._update_rows()
-        selected = self._datasource.get_selected()
-        self._hub.emit(Event.CHANGED, selected=selected)
+        self._emit_selection_changed()
@@ -0,0 +1,36 @@
+"""Per-emit cost of a virtual event through Tk versus the pure-Python dispatch path.
+
+Run manually; needs a display:
+
+    python tests/research/bench_emit.py
+"""
+import time
+import tkinter as tk
+
+from ttkbootstrap_next.events import Event
+from ttkbootstrap_next.layouts import Pack
+
+N = 20_000
+
+root = tk.Tk()
+root.withdraw()
+frame = Pack(parent=root)
+
+received = []
+frame.on(Event.SELECTION_CHANGED).listen(lambda e: received.append(e.data))
+payloads = {
+    'small': {'id': 'row-1'},
+    'ids_10k': {'selected': list(range(10_000))},
+}
+
+for label, payload in payloads.items():
+    for via in ('tk', 'python', 'auto'):
+        received.clear()
+        start = time.perf_counter()
+        for _ in range(N):
+            frame.emit(Event.SELECTION_CHANGED, payload, via=via)
+        elapsed = time.perf_counter() - start
+        assert len(received) == N and received[-1] == payload
+        print(f"{label:>8} via={via:<6} {elapsed / N * 1e6:8.2f} us/emit")
+
+root.destroy()
@@ -0,0 +1,44 @@
+"""Tests for Tcl command ownership and reclamation."""
+import tkinter as tk
+
+from ttkbootstrap_next.interop.runtime.commands import (
+    command_wrapper, commands_stats, event_callback_wrapper, owned_commands, release_command)
+
+
+def _exists(interp, func_id):
+    return bool(interp.tk.call("info", "commands", func_id))
+
+
+def test_release_deletes_the_command_and_updates_stats():
+    interp = tk.Tcl()
+    before = commands_stats()
+    func_id = command_wrapper(interp, lambda: "ok")
+    assert interp.tk.call(func_id) == "ok"
+    assert func_id in owned_commands(interp)
+    assert commands_stats()["live"] == before["live"] + 1
+
+    assert release_command(interp, func_id)
+    assert not release_command(interp, func_id)
+    assert not _exists(interp, func_id)
+    assert func_id not in owned_commands(interp)
+    after = commands_stats()
+    assert after["live"] == before["live"]
+    assert after["released"] == before["released"] + 1
+
+
+def test_transient_commands_release_themselves():
+    interp = tk.Tcl()
+    func_id = command_wrapper(interp, lambda: None, transient=True)
+    interp.tk.call(func_id)
+    assert not _exists(interp, func_id)
+    assert func_id not in owned_commands(interp)
+
+
+def test_rebinding_a_dedup_callback_reuses_one_command():
+    interp = tk.Tcl()
+    handler = lambda e: None
+    first = event_callback_wrapper(interp, handler, "<<Changed>>", dedup=True)
+    second = event_callback_wrapper(interp, handler, "<<Changed>>", dedup=True)
+    assert first == second
+    assert owned_commands(interp).count(first) == 1
+    release_command(interp, first)
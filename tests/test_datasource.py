@@ -0,0 +1,177 @@
+"""Tests for the in-memory and SQLite data sources."""
+import pytest
+
+from ttkbootstrap_next.datasource import MemoryDataSource, SqliteDataSource
+
+
+def make_records(n=10):
+    return [{"id": i, "text": f"item {i}", "region": ["north", "south", None][i % 3], "score": i} for i in range(n)]
+
+
+@pytest.fixture(params=[MemoryDataSource, SqliteDataSource], ids=["memory", "sqlite"])
+def source(request):
+    return request.param().set_data(make_records())
+
+
+def test_group_by_counts_and_aggregates(source):
+    groups = source.group_by("region", aggregates={"total": "SUM(score)", "best": "MAX(score)", "n": "COUNT(region)"})
+    assert [g["region"] for g in groups] == ["north", "south", None]
+    assert [g["count"] for g in groups] == [4, 3, 3]
+    assert [g["total"] for g in groups] == [18, 12, 15]
+    assert [g["best"] for g in groups] == [9, 7, 8]
+    assert groups[2]["n"] == 0
+
+
+def test_group_by_respects_filter_and_invalidates_cache(source):
+    source.group_by("region")
+    source.set_filter("score >= 6")
+    assert [g["count"] for g in source.group_by("region")] == [2, 1, 1]
+
+    rid = source.get_page_from_index(0, 1)[0]["id"]
+    source.update_record(rid, {"region": "south"})
+    assert [g["count"] for g in source.group_by("region")] == [1, 2, 1]
+
+
+def test_group_by_rejects_bad_expressions(source):
+    with pytest.raises(ValueError):
+        source.group_by("region", aggregates={"total": "SUM(score); DROP TABLE records"})
+    with pytest.raises(ValueError):
+        source.group_by("region", aggregates={"total": "SUM(*)"})
+
+
+def test_memory_sort_cache_reuses_permutations():
+    source = MemoryDataSource().set_data(make_records())
+    source.set_sort("score DESC")
+    assert [r["score"] for r in source.get_page_from_index(0, 3)] == [9, 8, 7]
+    source.set_sort("text ASC")
+    source.get_page_from_index(0, 3)
+    assert len(source._sort_cache) == 2
+
+    source.set_sort("score DESC")
+    perm = source._sort_permutation()
+    assert perm is source._sort_permutation()
+    assert [r["score"] for r in source.get_page_from_index(0, 3)] == [9, 8, 7]
+
+    rid = source.get_page_from_index(0, 1)[0]["id"]
+    source.update_record(rid, {"score": -1})
+    assert [r["score"] for r in source.get_page_from_index(0, 3)] == [8, 7, 6]
+
+
+def test_memory_sort_cache_respects_budget():
+    source = MemoryDataSource(sort_cache_bytes=0).set_data(make_records())
+    source.set_sort("score DESC")
+    assert source.get_page_from_index(0, 1)[0]["score"] == 9
+    assert len(source._sort_cache) == 0
+
+
+def test_refined_filter_matches_full_filter(source):
+    source.set_filter("text LIKE '%item%'")
+    source.get_page_from_index(0, 10)
+    source.set_filter("text LIKE '%item 1%'", refine=True)
+    assert [r["score"] for r in source.get_page_from_index(0, 10)] == [1]
+
+
+def test_page_cache_serves_blocks_and_invalidates_on_change(source):
+    from ttkbootstrap_next.datasource import PageCache
+
+    cache = PageCache(source, block_size=4, max_blocks=2)
+    assert [r["score"] for r in cache.get_page_from_index(2, 4)] == [2, 3, 4, 5]
+    assert cache.stats()["misses"] == 2
+    cache.get_page_from_index(3, 2)
+    assert cache.stats()["misses"] == 2
+
+    assert cache.prefetch(4, 4, direction=1)
+    assert cache.stats()["blocks"] == 2  # oldest block evicted
+    assert [r["score"] for r in cache.get_page_from_index(8, 5)] == [8, 9]
+
+    source.set_filter("score >= 5")
+    assert cache.total_count() == 5
+    assert [r["score"] for r in cache.get_page_from_index(0, 2)] == [5, 6]
+
+    cache.close()
+    source.set_filter("")
+    assert cache.total_count() == 10
+
+
+def test_select_range_follows_view_order(source):
+    source.set_filter("score >= 2")
+    source.set_sort("score DESC")
+    assert source.select_range(1, 4) == 3
+    assert sorted(r["score"] for r in source.get_selected()) == [6, 7, 8]
+    assert source.select_range(0, 2, selected=False) == 2
+    assert source.selected_count() == 2
+
+
+def test_range_selection_is_recorded_until_the_flags_are_needed(source):
+    ids = [r["id"] for r in source.get_page_from_index(0, 10)]
+    source.unselect_all()
+    source.select_range(2, 6)
+    source.unselect_record(ids[3])
+    source.select_range(3, 4)  # a later range wins over the earlier record change
+    source.unselect_record(ids[5])
+    assert [r["selected"] for r in source.get_page_from_index(0, 10)] == [0, 0, 1, 1, 1, 0, 0, 0, 0, 0]
+    assert source.selected_count() == 3
+    assert source.is_selected(ids[4]) and not source.is_selected(ids[5])
+    assert source.read_record(ids[2])["selected"] == 1
+
+    source.set_filter("selected = 1")  # reads the flags, so the recorded selection is written out
+    assert [r["score"] for r in source.get_page_from_index(0, 10)] == [2, 3, 4]
+    source.set_filter("")
+    source.select_all()
+    source.unselect_record(ids[0])
+    assert source.selected_count() == 9
+    assert len(source.get_selected()) == 9
+
+
+def test_memory_range_selection_leaves_rows_untouched():
+    source = MemoryDataSource().set_data(make_records(100))
+    source.select_all()
+    source.unselect_all()
+    assert source.select_range(10, 60) == 50
+    assert all(r["selected"] == 0 for r in source._data)  # recorded, not applied
+    assert source.selected_count() == 50
+    source.set_sort("score DESC")  # positions of the pending range still refer to the old view
+    assert [r["score"] for r in source.get_selected()][:2] == [59, 58]
+
+
+def test_move_records_reorders_view(source):
+    ids = [r["id"] for r in source.get_page_from_index(0, 10)]
+    assert source.move_records([ids[1]], 5) == 1
+    assert [r["score"] for r in source.get_page_from_index(0, 10)] == [0, 2, 3, 4, 5, 1, 6, 7, 8, 9]
+
+    assert source.move_records([ids[8], ids[7]], 0) == 2
+    assert [r["score"] for r in source.get_page_from_index(0, 4)] == [7, 8, 0, 2]
+
+    source.set_filter("score >= 5")
+    source.move_records([ids[9]], 1)
+    assert [r["score"] for r in source.get_page_from_index(0, 10)] == [7, 9, 8, 5, 6]
+    assert "_position" not in source.get_page_from_index(0, 1)[0]
+
+    source.set_sort("score")
+    with pytest.raises(ValueError):
+        source.move_records([ids[0]], 0)
+
+
+def test_protocol_check_does_not_require_optional_capabilities(source):
+    from ttkbootstrap_next.datasource import DataSourceProtocol
+
+    optional = {"group_by", "select_range", "move_records"}
+    members = [name for name in dir(type(source)) if not name.startswith("_") and name not in optional]
+    plain = type("PlainSource", (), {name: getattr(type(source), name) for name in members})
+    plain.page_size = source.page_size
+    assert isinstance(source, DataSourceProtocol)
+    assert isinstance(plain(), DataSourceProtocol)
+
+
+def test_memory_selected_count_does_not_settle_ranges():
+    source = MemoryDataSource().set_data(make_records(100))
+    source.set_sort("score DESC")
+    ids = [r["id"] for r in source.get_page_from_index(0, 100)]
+    assert source.select_range(10, 60) == 50  # own flags are all clear: counted from the range
+    source.unselect_record(ids[20])  # inside the range
+    source.select_record(ids[80])  # outside it
+    source.select_range(15, 25)  # a later range re-selects ids[20]
+    source.unselect_record(ids[30])
+    assert source.selected_count() == 50
+    assert source._selection.ranges  # counted without writing the flags
+    assert len(source.get_selected()) == 50
@@ -0,0 +1,94 @@
+"""Tests for emit's Python dispatch path: bindtag order, "break" and the `auto` fallback."""
+import tkinter as tk
+
+from ttkbootstrap_next.core import payload_store
+from ttkbootstrap_next.interop.runtime.binding import BindingMixin
+
+# `bind` stands in for Tk's command so bindings can be made and read without a display
+BIND = """
+proc bind {tag seq args} {
+    global bindings
+    set key "$tag $seq"
+    if {![llength $args]} {
+        if {[info exists bindings($key)]} { return $bindings($key) }
+        return ""
+    }
+    set script [lindex $args 0]
+    if {[string index $script 0] eq "+"} {
+        append bindings($key) "\n" [string range $script 1 end]
+    } else {
+        set bindings($key) $script
+    }
+}
+"""
+
+
+class _Widget:
+    def __init__(self, interp, path, tags):
+        self.tk = interp.tk
+        self.path = path
+        self.tags = tags
+        self.generated = []
+
+    def bindtags(self):
+        return self.tags
+
+    def event_generate(self, sequence, data=None, when="now"):
+        self.generated.append((sequence, data))
+
+    def after(self, ms, func, *args):
+        func(*args)
+
+    def __str__(self):
+        return self.path
+
+
+class Host(BindingMixin):
+    def __init__(self, interp, path, tags):
+        self.widget = _Widget(interp, path, tags)
+        super().__init__()
+
+
+def _host(path, cls):
+    interp = tk.Tcl()
+    interp.eval(BIND)
+    return Host(interp, path, (path, cls, ".", "all"))
+
+
+def test_python_dispatch_visits_bindtags_in_order_until_break():
+    host = _host(".emit1", "EmitTestA")
+    calls = []
+    subs = [
+        host.on("<<Ping>>", scope="all").listen(lambda e: calls.append("all")),
+        host.on("<<Ping>>", scope="EmitTestA").listen(lambda e: calls.append("class")),
+        host.on("<<Ping>>").listen(lambda e: calls.append(("widget", e.data))),
+    ]
+    host.emit("<<Ping>>", {"n": 1}, via="python")
+    assert calls == [("widget", {"n": 1}), "class", "all"]
+
+    calls.clear()
+    subs.append(host.on("<<Ping>>", scope="EmitTestA").listen(lambda e: "break", priority=1))
+    assert host._dispatch_python("<<Ping>>", {}, host.widget.bindtags()) == "break"
+    assert calls == [("widget", {})]  # the class tag broke before "all"
+    assert host.widget.generated == []
+    for sub in subs:
+        sub.unlisten()
+
+
+def test_auto_falls_back_to_tk_when_other_bindings_exist():
+    host = _host(".emit2", "EmitTestB")
+    calls = []
+    sub = host.on("<<Ping>>").listen(lambda e: calls.append(e.data))
+    tags = host.widget.bindtags()
+    assert host._python_reachable(tags, "<<Ping>>")
+    host.emit("<<Ping>>", {"n": 1}, via="auto")
+    assert calls == [{"n": 1}] and host.widget.generated == []
+
+    host.widget.tk.call("bind", "EmitTestB", "<<Ping>>", "+puts ping")  # bound outside `on()`
+    assert not host._python_reachable(tags, "<<Ping>>")
+    before = payload_store.pending_count()
+    host.emit("<<Ping>>", {"n": 2}, via="auto")
+    assert [seq for seq, _ in host.widget.generated] == ["<<Ping>>"]
+    assert calls == [{"n": 1}]  # delivered by Tk, not dispatched in Python
+    assert payload_store.pending_count() == before
+    sub.unlisten()
@@ -0,0 +1,44 @@
+"""Tests for the event profiles and the lazily resolved event fields."""
+from dataclasses import replace
+from types import SimpleNamespace
+
+from ttkbootstrap_next.interop.runtime.event_factory import build_event
+from ttkbootstrap_next.interop.runtime.event_types import WidgetEvent
+from ttkbootstrap_next.interop.spec.profiles import event_substring
+
+
+def test_substitutions_need_no_tcl_evaluation():
+    assert event_substring("<Motion>") == "%x %y %X %Y %s %W"
+    assert event_substring("<Configure>") == "%w %h %x %y %W"
+    assert event_substring("<<Changed>>") == "%d %W"
+    for sequence in ("<Motion>", "<Configure>", "<KeyPress>", "<Enter>", "<<Changed>>"):
+        assert "[" not in event_substring(sequence)
+
+
+def test_widget_fields_resolve_on_access(monkeypatch):
+    calls = []
+    tk = SimpleNamespace(call=lambda *args: calls.append(args) or ".top")
+    monkeypatch.setattr("ttkbootstrap_next.core.layout_context._default_root", SimpleNamespace(widget=SimpleNamespace(tk=tk)))
+    event = build_event("<Motion>", ["3", "4", "103", "104", "0", ".top.unregistered"])
+    assert (event.x, event.y, event.screen_x, event.screen_y, event.state) == (3, 4, 103, 104, 0)
+    assert event.target_path == ".top.unregistered"
+    assert event.target == ".top.unregistered"  # not a registered wrapper: the path name is returned
+    assert calls == []
+    assert event.toplevel == ".top"  # likewise for its toplevel
+    assert calls == [("winfo", "toplevel", ".top.unregistered")]
+    assert event.timestamp is None
+
+
+def test_events_accept_the_public_field_names():
+    event = WidgetEvent("<<Changed>>", target=".w", data={"a": 1}, timestamp=0, toplevel=".")
+    assert (event.target_path, event.toplevel, event.timestamp) == (".w", ".", "1970-01-01T00:00:00Z")
+    moved = replace(event, target=".v")
+    assert moved.target_path == ".v" and moved.data == {"a": 1} and moved.toplevel == "."
+
+
+def test_virtual_events_are_stamped_lazily():
+    event = build_event("<<Changed>>", ["", ".w"])
+    assert event.data == {}
+    assert isinstance(event._timestamp, float)
+    assert event.timestamp.endswith("Z")
+    assert event.timestamp is event.timestamp  # converted once
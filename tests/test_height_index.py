@@ -0,0 +1,57 @@
+"""Tests for the Fenwick-tree row height index used by VirtualList."""
+import random
+
+from ttkbootstrap_next.widgets.list.height_index import HeightIndex
+
+
+def test_offsets_follow_measured_heights():
+    index = HeightIndex(100, estimate=20)
+    assert index.total() == 2000
+    index.set(0, 30)  # first measurement becomes the estimate for unmeasured rows
+    assert index.estimate == 30
+    assert index.total() == 3000
+
+    heights = [random.Random(i).randint(10, 60) for i in range(100)]
+    for i, h in enumerate(heights):
+        index.set(i, h)
+    for i in (0, 1, 37, 99, 100):
+        assert index.offset_of(i) == sum(heights[:i])
+    assert index.total() == sum(heights)
+
+
+def test_index_at_maps_offsets_back_to_rows():
+    index = HeightIndex(5, estimate=10)
+    index.set(2, 50)
+    index.set(0, 10)
+    heights = [index.get(i) for i in range(5)]
+    for offset in range(sum(heights)):
+        row, within = index.index_at(offset)
+        assert index.offset_of(row) + within == offset
+        assert 0 <= within < heights[row]
+    assert index.index_at(-5) == (0, 0)
+    assert index.index_at(10_000)[0] == 4
+    assert HeightIndex().index_at(10) == (0, 0)
+
+
+def test_resize_keeps_measured_rows():
+    index = HeightIndex(10, estimate=10)
+    for i in range(10):
+        index.set(i, 10 + i)
+    index.resize(4)
+    assert index.count == 4 and index.total() == sum(10 + i for i in range(4))
+    for n in range(5, 40):
+        index.resize(n)
+        heights = [index.get(i) for i in range(n)]
+        assert heights[:4] == [10, 11, 12, 13]
+        assert all(index.offset_of(i) == sum(heights[:i]) for i in range(n + 1))
+
+
+def test_move_carries_the_row_height_along():
+    index = HeightIndex(6, estimate=10)
+    for i in range(6):
+        index.set(i, 10 * (i + 1))
+    index.move(1, 4)
+    assert [index.get(i) for i in range(6)] == [10, 30, 40, 50, 20, 60]
+    index.move(4, 1)
+    assert [index.get(i) for i in range(6)] == [10, 20, 30, 40, 50, 60]
+    assert index.offset_of(6) == 210 and index.offset_of(3) == 60
@@ -0,0 +1,129 @@
+"""Headless tests for the VirtualList row event delegate and canvas row placement."""
+from types import SimpleNamespace
+
+from ttkbootstrap_next.events import Event
+from ttkbootstrap_next.interop.runtime.event_factory import build_event
+from ttkbootstrap_next.widgets.list.canvas_renderer import CanvasRow, CanvasRowRenderer
+from ttkbootstrap_next.widgets.list.events import RowEventDelegate
+
+
+class Hub:
+    def __init__(self):
+        self.bindings = {}
+        self.emitted = []
+
+    def _bind_class(self, tag, event, handler):
+        self.bindings[(tag, event)] = handler
+
+    def emit(self, event, data, via="tk"):
+        self.emitted.append((event, data, via))
+
+
+class TkWidget:
+    def __init__(self, path):
+        self.path = path
+        self.tags = (path, "TFrame", ".", "all")
+
+    def bindtags(self, tags=None):
+        if tags is None:
+            return self.tags
+        self.tags = tuple(tags)
+
+    def __str__(self):
+        return self.path
+
+
+class Row:
+    def __init__(self, path):
+        self.widget = TkWidget(path)
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append(name)
+
+    def delete(self):
+        self.calls.append("delete")
+
+
+def _press(path):
+    return build_event(Event.CLICK1_DOWN, ["", "", "0", path])
+
+
+def test_delegate_binds_once_and_routes_by_path():
+    hub = Hub()
+    delegate = RowEventDelegate(hub, {})
+    bound = len(hub.bindings)
+    rows = [Row(f".list.row{i}") for i in range(3)]
+    button = Row(".list.row1.delete")
+    for row in rows:
+        delegate.register(row, row)
+    delegate.register(button, rows[1], 'delete')
+    assert len(hub.bindings) == bound  # registering rows adds no bindings
+    assert rows[0].widget.tags[:2] == (".list.row0", delegate.tag)
+
+    hub.bindings[(delegate.tag, Event.CLICK1_DOWN)](_press(".list.row2"))
+    hub.bindings[(delegate.tag, Event.CLICK1_DOWN)](_press(".list.row1.delete"))
+    hub.bindings[(delegate.tag, Event.ENTER)](build_event(Event.ENTER, [".list.row0"]))
+    assert rows[2].calls == ["_on_mouse_down"]
+    assert rows[1].calls == ["delete"]
+    assert rows[0].calls == ["_on_enter"]
+
+    delegate.dispatch(Event.ITEM_CLICK, {"id": 1})
+    assert hub.emitted[-1][:2] == (Event.ITEM_CLICK, {"id": 1})
+
+
+def test_released_rows_are_forgotten():
+    hub = Hub()
+    delegate = RowEventDelegate(hub, {})
+    row = Row(".list.row0")
+    delegate.register(row, row)
+    delegate.register(Row(".list.row0.drag"), row, 'drag')
+    delegate.release(row)
+    press = hub.bindings[(delegate.tag, Event.CLICK1_DOWN)]
+    assert press(_press(".list.row0")) is None
+    assert press(_press(".list.row0.drag")) is None
+    assert row.calls == []
+
+
+class Renderer:
+    def __init__(self):
+        self.drawn = []
+        self.moved = []
+        widget = SimpleNamespace(
+            move=lambda tag, dx, dy: self.moved.append((tag, dy)),
+            itemconfigure=lambda tag, **kw: self.moved.append((tag, kw)))
+        self.canvas = SimpleNamespace(widget=widget)
+
+    def measure(self, record):
+        return 40 if record.get('caption') else 24
+
+    def draw(self, row):
+        self.drawn.append((row.tag, row.top, row.height))
+
+
+def test_row_placement_moves_instead_of_redrawing():
+    renderer = Renderer()
+    row = CanvasRow(renderer, 0)
+    row.widget.place(y=10)
+    assert renderer.drawn == [("row0", 10, 24)]
+    row.widget.place(y=34)  # same height: the items are shifted
+    assert renderer.moved == [("row0", 24)] and len(renderer.drawn) == 1
+    row.widget.place(y=34, height=30)  # new height: redrawn
+    assert renderer.drawn[-1] == ("row0", 34, 30)
+    assert row.widget.winfo_manager() == "place"
+    row.widget.place_forget()
+    assert row.widget.winfo_manager() == ""
+    row.update_data({"title": "a", "caption": "b"})
+    assert row.widget.winfo_reqheight() == 40
+
+
+def test_row_at_hit_tests_visible_rows():
+    renderer = Renderer()
+    rows = [CanvasRow(renderer, i) for i in range(3)]
+    for i, row in enumerate(rows):
+        row.widget.place(y=i * 24)
+    rows[2].visible = False
+    hits = SimpleNamespace(_rows=rows)
+    assert CanvasRowRenderer.row_at(hits, 0) is rows[0]
+    assert CanvasRowRenderer.row_at(hits, 47) is rows[1]
+    assert CanvasRowRenderer.row_at(hits, 48) is None
@@ -0,0 +1,60 @@
+"""Tests for the out-of-band virtual event payload store."""
+from ttkbootstrap_next.core import payload_store
+from ttkbootstrap_next.interop.spec.converters import convert_event_data
+
+
+def test_listeners_resolve_the_original_object():
+    payload = {"ids": list(range(10_000))}
+    ref = payload_store.store(payload)
+    assert payload_store.is_ref(ref)
+    assert convert_event_data(ref) is payload
+    payload_store.release(ref)
+    assert convert_event_data(ref) == {}
+
+
+def test_release_is_idempotent_and_tokens_are_unique():
+    before = payload_store.pending_count()
+    refs = [payload_store.store(i) for i in range(3)]
+    assert len(set(refs)) == 3
+    assert payload_store.pending_count() == before + 3
+    for ref in refs + refs:
+        payload_store.release(ref)
+    assert payload_store.pending_count() == before
+
+
+def test_legacy_base64_payloads_still_decode():
+    assert convert_event_data("b64:eyJhIjogMX0=") == {"a": 1}
+
+
+class _QueuedWidget:
+    """Records Tk's queue order: queued events and due timers versus idle callbacks."""
+
+    def __init__(self):
+        self.queue, self.idle, self.seen = [], [], []
+
+    def event_generate(self, sequence, data=None, when="now"):
+        self.queue.append(lambda: self.seen.append(convert_event_data(data)))
+
+    def after(self, ms, func, *args):
+        self.queue.append(lambda: func(*args))
+
+    def after_idle(self, func, *args):
+        self.idle.append(lambda: func(*args))
+
+    def run(self, tasks):
+        while tasks:
+            tasks.pop(0)()
+
+
+def test_queued_payloads_outlive_idle_callbacks():
+    from types import SimpleNamespace
+    from ttkbootstrap_next.interop.runtime.binding import BindingMixin
+
+    widget = _QueuedWidget()
+    before = payload_store.pending_count()
+    BindingMixin.emit(SimpleNamespace(widget=widget, _normalize=str), "<<Changed>>", {"a": 1}, when="tail")
+    widget.run(widget.idle)  # update_idletasks
+    assert payload_store.pending_count() == before + 1
+    widget.run(widget.queue)  # the event loop delivers the event, then releases its slot
+    assert widget.seen == [{"a": 1}]
+    assert payload_store.pending_count() == before
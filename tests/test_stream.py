@@ -0,0 +1,85 @@
+"""Tests for Stream subscriber ordering, cancellation and dispatch snapshots."""
+from ttkbootstrap_next.interop.runtime.binding import Stream
+
+
+def test_priority_then_subscription_order():
+    stream = Stream()
+    calls = []
+    for name, priority in [("a", 0), ("b", 5), ("c", 0), ("d", 5), ("e", -1)]:
+        stream.listen(lambda v, n=name: calls.append(n), priority=priority)
+    stream._next(None)
+    assert calls == ["b", "d", "a", "c", "e"]
+
+
+def test_break_stops_later_subscribers():
+    stream = Stream()
+    calls = []
+    stream.listen(lambda v: calls.append("late"))
+    stream.listen(lambda v: "break", priority=1)
+    assert stream._dispatch(None) == "break"
+    assert calls == []
+
+
+def test_derived_streams_ignore_break_but_honour_cancel_when():
+    source = Stream()
+    calls = []
+    derived = source.map(lambda v: v * 2)
+    derived.listen(lambda v: calls.append(("late", v)))
+    derived.listen(lambda v: "break", priority=1)
+    derived.cancel_when(lambda v: v > 10)
+    source._next(2)
+    source._next(6)
+    assert calls == [("late", 4)]
+
+
+def test_cancel_leaves_tombstones_until_compaction():
+    stream = Stream()
+    calls = []
+    subs = [stream.listen(lambda v, i=i: calls.append(i)) for i in range(100)]
+    for sub in subs[:60]:
+        sub.unlisten()
+    assert len(stream._subs) < 100  # compacted once tombstones outnumbered live subscribers
+    stream._next(None)
+    assert calls == list(range(60, 100))
+
+
+def test_dispatch_uses_a_snapshot():
+    stream = Stream()
+    calls = []
+    late = []
+
+    def first(v):
+        calls.append("first")
+        stream.listen(lambda v: late.append(v))  # joins for the next value
+        second_sub.unlisten()  # cancelled subscribers are skipped at once
+
+    stream.listen(first, priority=1)
+    second_sub = stream.listen(lambda v: calls.append("second"))
+    stream._next(1)
+    assert calls == ["first"] and late == []
+    stream._next(2)
+    assert late == [2]
+
+
+def test_on_empty_fires_when_the_last_subscriber_leaves():
+    stream = Stream()
+    emptied = []
+    stream._on_empty = lambda: emptied.append(True)
+    a, b = stream.listen(print), stream.listen(print)
+    a.unlisten()
+    a.unlisten()
+    assert emptied == []
+    b.unlisten()
+    assert emptied == [True]
+
+
+def test_on_first_rearms_after_the_stream_empties():
+    stream = Stream()
+    armed = []
+    stream._on_first = lambda: armed.append(True)
+    sub = stream.listen(print)
+    stream.listen(print).unlisten()
+    assert armed == [True]
+    sub.unlisten()
+    stream.listen(print)
+    assert armed == [True, True]